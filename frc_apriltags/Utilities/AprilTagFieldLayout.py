@@ -37,7 +37,7 @@ class AprilTagFieldLayout:
         self.fieldWidth = fieldWidth
 
         # Logs the field size
-        Logger.logInfo(f"Field length: {self.fieldLength}, Field width: {self.fieldWidth}", True)
+        Logger.logInfo("Field length: %s, Field width: %s", True, self.fieldLength, self.fieldWidth)
 
         # Creates the allTags array
         self.allTags = [Pose3d()] * 9
@@ -50,7 +50,7 @@ class AprilTagFieldLayout:
             self.allTags[id] = pose
 
             # Logs the tag information
-            Logger.logInfo(f"Tag {id}. Pose: {pose}", True)
+            Logger.logInfo("Tag %d. Pose: %s", True, id, pose)
 
         # Variables
         self.m_origin  = None
@@ -129,7 +129,7 @@ class AprilTagFieldLayout:
             raise ValueError("Unsupported enumerator value.")
         
         # Logs the origin
-        Logger.logInfo(f"Origin at {origin}", self.logStatus)
+        Logger.logInfo("Origin at %s", self.logStatus, origin)
 
     def getTags(self):
         """
@@ -1,67 +1,129 @@
 # Created by Alex Pereira
 
 # Import Libraries
-import time
+import queue
+import atexit
 import logging
+import logging.handlers
+
+# The logger every frc_apriltags message goes through. Until a log path is set, messages go to the root logger
+logger = logging.getLogger("frc_apriltags")
+
+# Queues log records without formatting them, so the caller never pays for the formatting
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        return record
 
 # Start of the Logging class
 class Logger:
     """
     Use this class to log an debug info you generate.
+    Messages are handed to a background thread that writes them to disk, so logging never waits on file I/O.
+    Messages may be a ``%`` format string followed by its arguments, or a callable that returns the message. Either is only formatted if logging is enabled.
+    Once a log path is set, ``%`` format messages are formatted on the background thread, so their arguments should not be changed after they are logged.
     """
+    # The background thread that writes queued messages
+    listener = None
+
     @staticmethod
-    def setLogPath(dirPath: str = "/tmp/"):
+    def setLogPath(dirPath: str = "/tmp/", fileName: str = "frc_apriltags.log", maxBytes: int = 1000000, backupCount: int = 5):
         """
         Enables the logger.
+        The log file is rotated once it reaches ``maxBytes``, and only ``backupCount`` old files are kept.
 
         :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method
+        :param fileName: The name of the log file.
+        :param maxBytes: The size of a log file before it is rotated, in bytes.
+        :param backupCount: The number of rotated log files to keep.
         """
-        # Gets the time as a string
-        currTime = time.ctime().replace(" ", "_")[4:]
+        # Stops the last writer
+        Logger.stop()
+
+        # Creates the rotating file writer
+        fileHandler = logging.handlers.RotatingFileHandler(dirPath + "/" + fileName, maxBytes = maxBytes, backupCount = backupCount, encoding = "utf-8")
+        fileHandler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s:%(message)s"))
 
-        # Starts a logger
-        logging.basicConfig(filename = dirPath + f"/{currTime}.log", format="%(levelname)s:%(message)s", encoding = "utf-8", level = logging.DEBUG)
+        # Queues messages from the caller and writes them on a background thread
+        logQueue = queue.SimpleQueue()
+        logger.handlers = [DeferredQueueHandler(logQueue)]
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        Logger.listener = logging.handlers.QueueListener(logQueue, fileHandler)
+        Logger.listener.start()
 
     @staticmethod
-    def logDebug(debug: str, logStatus: bool = True):
+    def stop():
+        """
+        Writes every queued message and stops the background writer.
+        """
+        if (Logger.listener is not None):
+            Logger.listener.stop()
+            for handler in Logger.listener.handlers:
+                handler.close()
+            Logger.listener = None
+
+    @staticmethod
+    def log(level: int, message, args):
+        """
+        Queues a message at a level, formatting it only if the level is enabled.
+
+        :param level: The ``logging`` level.
+        :param message: The message, a ``%`` format string, or a callable that returns the message.
+        :param args: The arguments of a ``%`` format string.
+        """
+        if (logger.isEnabledFor(level) == True):
+            if (callable(message) == True):
+                message = message()
+            logger.log(level, message, *args)
+
+    @staticmethod
+    def logDebug(debug, logStatus: bool = True, *args):
         """
         Logs a debug statement.
 
         :param debug: The debug message to log
         :param logStatus: Is logging enabled
+        :param args: The arguments of a ``%`` format message
         """
         if (logStatus == True):
-            logging.debug(debug)
+            Logger.log(logging.DEBUG, debug, args)
 
     @staticmethod
-    def logInfo(info: str, logStatus: bool = True):
+    def logInfo(info, logStatus: bool = True, *args):
         """
         Logs information.
 
         :param info: The info message to log
         :param logStatus: Is logging enabled
+        :param args: The arguments of a ``%`` format message
         """
         if (logStatus == True):
-            logging.info(info)
+            Logger.log(logging.INFO, info, args)
 
     @staticmethod
-    def logWarning(warning: str, logStatus: bool = True):
+    def logWarning(warning, logStatus: bool = True, *args):
         """
         Logs a warning.
 
         :param warning: The warning message to log
         :param logStatus: Is logging enabled
+        :param args: The arguments of a ``%`` format message
         """
         if (logStatus == True):
-            logging.warning(warning)
+            Logger.log(logging.WARNING, warning, args)
 
     @staticmethod
-    def logError(error: str, logStatus: bool = True):
+    def logError(error, logStatus: bool = True, *args):
         """
         Logs an error.
 
         :param error: The error message to log
         :param logStatus: Is logging enabled
+        :param args: The arguments of a ``%`` format message
         """
         if (logStatus == True):
-            logging.error(error)
\ No newline at end of file
+            Logger.log(logging.ERROR, error, args)
+
+# Writes any queued messages before the program exits
+atexit.register(Logger.stop)
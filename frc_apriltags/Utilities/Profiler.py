@@ -0,0 +1,201 @@
+# Import Libraries
+import threading
+import numpy as np
+from   time import perf_counter
+
+# Start of the Profiler class
+class Profiler:
+    """
+    Use this class to time each stage of the vision loop.
+    Every stage keeps its latest timings in a fixed-size ring buffer, so percentiles always describe recent frames.
+    While profiling is disabled, ``now()`` and ``record()`` return immediately.
+    Stages can be recorded from any thread. A lock guards the ring buffers, and summaries are made from a copy of them.
+    """
+    # Profiler state, shared by every class that records timings
+    enabled     = False
+    bufferSize  = 256
+    stages      = {}
+    publishing  = False
+    period      = 1.0
+    lastPublish = 0.0
+    table       = None
+    publishers  = {}
+    lock        = threading.Lock()
+
+    @staticmethod
+    def enable(bufferSize: int = 256):
+        """
+        Starts recording stage timings.
+
+        :param bufferSize: The number of timings kept for each stage.
+        """
+        with Profiler.lock:
+            Profiler.bufferSize = bufferSize
+            Profiler.stages     = {}
+        Profiler.enabled = True
+
+    @staticmethod
+    def disable():
+        """
+        Stops recording stage timings. Recorded timings are kept until ``reset()`` or ``enable()`` is called.
+        """
+        Profiler.enabled = False
+
+    @staticmethod
+    def isEnabled() -> bool:
+        """
+        Gets if stage timings are being recorded.
+
+        :return: Is the profiler enabled?
+        """
+        return Profiler.enabled
+
+    @staticmethod
+    def now() -> float:
+        """
+        Gets the time a stage starts.
+
+        :return: The current ``perf_counter()`` time in seconds, or 0 if the profiler is disabled.
+        """
+        if (Profiler.enabled == False):
+            return 0.0
+
+        return perf_counter()
+
+    @staticmethod
+    def record(stage: str, start: float) -> float:
+        """
+        Records the time since a stage started. The returned time can start the next stage.
+
+        :param stage: The name of the stage.
+        :param start: The time the stage started, from ``now()``.
+        :return: The time the stage ended, or 0 if the profiler is disabled.
+        """
+        if (Profiler.enabled == False):
+            return 0.0
+
+        end = perf_counter()
+
+        with Profiler.lock:
+            # Creates the stage's ring buffer the first time it is recorded
+            timings = Profiler.stages.get(stage)
+            if (timings is None):
+                timings = Profiler.stages[stage] = [np.zeros(Profiler.bufferSize), 0, 0]
+
+            # Overwrites the oldest timing
+            timings[0][timings[1]] = end - start
+            timings[1] = (timings[1] + 1) % len(timings[0])
+            timings[2] = min(timings[2] + 1, len(timings[0]))
+
+            # Only one thread publishes each period
+            publish = (Profiler.publishing == True) and (end - Profiler.lastPublish >= Profiler.period)
+            if (publish == True):
+                Profiler.lastPublish = end
+
+        # Publishes the summary once every period, outside the lock
+        if (publish == True):
+            Profiler.publish()
+
+        return end
+
+    @staticmethod
+    def getTimings(stage: str):
+        """
+        Gets the recorded timings of a stage, oldest first.
+
+        :param stage: The name of the stage.
+        :return: An array of timings in seconds.
+        """
+        with Profiler.lock:
+            if (stage not in Profiler.stages):
+                return np.zeros(0)
+
+            buffer, index, count = Profiler.stages[stage]
+            if (count < len(buffer)):
+                return buffer[:count].copy()
+
+            return np.roll(buffer, -index)
+
+    @staticmethod
+    def getPercentiles(stage: str, percentiles = (50, 95, 99)):
+        """
+        Gets percentiles of the recorded timings of a stage.
+
+        :param stage: The name of the stage.
+        :param percentiles: The percentiles to calculate.
+        :return: An array of the percentiles in seconds, or zeros if the stage has not been recorded.
+        """
+        timings = Profiler.getTimings(stage)
+        if (len(timings) == 0):
+            return np.zeros(len(percentiles))
+
+        return np.percentile(timings, percentiles)
+
+    @staticmethod
+    def getSummary() -> dict:
+        """
+        Gets a summary of every recorded stage.
+
+        :return: A dictionary of stage name to a dictionary of ``count``, ``mean``, ``p50``, ``p95`` and ``p99`` in seconds.
+        """
+        with Profiler.lock:
+            stages = list(Profiler.stages)
+
+        summary = {}
+        for stage in stages:
+            timings = Profiler.getTimings(stage)
+            if (len(timings) == 0):
+                continue
+            p50, p95, p99 = np.percentile(timings, (50, 95, 99))
+            summary[stage] = {"count": len(timings), "mean": float(timings.mean()), "p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+        return summary
+
+    @staticmethod
+    def enablePublishing(tableName: str = "TagInfo/Profiler", period: float = 1.0):
+        """
+        Publishes a summary of every stage to NetworkTables once every period.
+        Each stage is sent as [count, mean, p50, p95, p99], with times in milliseconds.
+
+        :param tableName: The NetworkTables table to publish to.
+        :param period: The time between summaries in seconds.
+        """
+        # Imports NetworkTables only when publishing is used
+        import ntcore
+
+        Profiler.table      = ntcore.NetworkTableInstance.getDefault().getTable(tableName)
+        Profiler.publishers = {}
+        Profiler.period     = period
+        Profiler.publishing = True
+
+    @staticmethod
+    def disablePublishing():
+        """
+        Stops publishing summaries to NetworkTables.
+        """
+        Profiler.publishing = False
+
+    @staticmethod
+    def publish():
+        """
+        Publishes a summary of every stage to NetworkTables.
+        """
+        if (Profiler.table is None):
+            return
+
+        for stage, summary in Profiler.getSummary().items():
+            # Creates the stage's publisher the first time it is published
+            if (stage not in Profiler.publishers):
+                Profiler.publishers[stage] = Profiler.table.getDoubleArrayTopic(stage).publish()
+
+            # Sends the data
+            data = [summary["count"], 1000 * summary["mean"], 1000 * summary["p50"], 1000 * summary["p95"], 1000 * summary["p99"]]
+            Profiler.publishers[stage].set(data)
+
+    @staticmethod
+    def reset():
+        """
+        Clears the recorded timings of every stage.
+        """
+        with Profiler.lock:
+            Profiler.stages = {}
@@ -1,18 +1,37 @@
 # Import libraries
-from importlib_metadata import PackageNotFoundError, version
-
-# Generate the version
-try:
-    __version__ = version("frc-apriltags")
-except PackageNotFoundError:
-    # Package is not installed
-    pass
-
-# Import Utility classes
-from .Logger              import Logger
-from .Units               import Units
-from .MathUtil            import MathUtil
-from .AprilTag            import AprilTag
-from .AprilTagFieldLayout import AprilTagFieldLayout
-
-__all__ = ["Logger", "Units", "MathUtil", "AprilTag", "AprilTagFieldLayout"]
+import importlib
+
+# Utility classes, each in the module of the same name. They are imported the first time they are used
+_lazyClasses = ("Logger", "Units", "MathUtil", "AprilTag", "AprilTagFieldLayout", "Profiler")
+
+__all__ = ["Logger", "Units", "MathUtil", "AprilTag", "AprilTagFieldLayout", "Profiler"]
+
+def __getattr__(name: str):
+    """
+    Imports a utility class the first time it is used.
+
+    :param name: The name of the class, or ``__version__``.
+    :return: The class or version.
+    """
+    # Generates the version the first time it is asked for
+    if (name == "__version__"):
+        from importlib_metadata import PackageNotFoundError, version
+        try:
+            value = version("frc-apriltags")
+        except PackageNotFoundError:
+            # Package is not installed
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        globals()[name] = value
+        return value
+
+    if (name not in _lazyClasses):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Importing the module binds it to its name, so the class replaces it afterwards
+    value = getattr(importlib.import_module("." + name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyClasses))
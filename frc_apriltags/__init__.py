@@ -1,47 +1,111 @@
 # Import libraries
 import time
-import ntcore
-from   networktables import NetworkTablesInstance
-from   importlib_metadata import PackageNotFoundError, version
-
-# Generate the version
-try:
-    __version__ = version("frc-apriltags")
-except PackageNotFoundError:
-    # Package is not installed
-    pass
-
-# Import AprilTag related classes
-from .communications import NetworkCommunications
-from .apriltags      import Detector
-
-# Import Vision related classes
-from .calibration    import Calibrate
-from .camera         import USBCamera
-from .stream         import Streaming
+import importlib
+import threading
+
+# The module of each class. Classes are imported the first time they are used, so each script only pays for what it uses
+_lazyClasses = {
+    # AprilTag related classes
+    "TagResult":             ".results",
+    "NetworkCommunications": ".communications",
+    "NullCommunications":    ".communications",
+    "TagTracker":            ".tracking",
+    "DetectionGovernor":     ".governor",
+    "PowerGovernor":         ".governor",
+    "FrameGate":             ".gate",
+    "PoseEstimator":         ".estimator",
+    "Detector":              ".apriltags",
+    "MultiCameraDetector":   ".multicamera",
+    "TagVisualizer":         ".visualization",
+
+    # Vision related classes
+    "Calibrate":             ".calibration",
+    "CalibrationStore":      ".calibration",
+    "ThreadedCapture":       ".capture",
+    "ThreadedOutput":        ".output",
+    "FrameRecorder":         ".recording",
+    "FrameReplay":           ".recording",
+    "USBCamera":             ".camera",
+    "Streaming":             ".stream",
+    "FrameQueue":            ".pipeline",
+    "VisionPipeline":        ".pipeline",
+    "SharedFrameRing":       ".shared",
+    "DetectorPool":          ".shared"
+}
 
 __all__ = [
     "Detector",
+    "MultiCameraDetector",
+    "TagVisualizer",
+    "TagResult",
+    "PoseEstimator",
+    "TagTracker",
+    "DetectionGovernor",
+    "PowerGovernor",
+    "FrameGate",
     "Calibrate",
+    "CalibrationStore",
     "NetworkCommunications",
+    "NullCommunications",
     "USBCamera",
-    "Streaming"
+    "ThreadedCapture",
+    "ThreadedOutput",
+    "FrameRecorder",
+    "FrameReplay",
+    "Streaming",
+    "FrameQueue",
+    "VisionPipeline",
+    "SharedFrameRing",
+    "DetectorPool"
 ]
 
+def __getattr__(name: str):
+    """
+    Imports a class the first time it is used.
+
+    :param name: The name of the class, or ``__version__``.
+    :return: The class or version.
+    """
+    # Generates the version the first time it is asked for
+    if (name == "__version__"):
+        from importlib_metadata import PackageNotFoundError, version
+        try:
+            value = version("frc-apriltags")
+        except PackageNotFoundError:
+            # Package is not installed
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        globals()[name] = value
+        return value
+
+    if (name not in _lazyClasses):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Imports the class and stores it so this is only done once
+    value = getattr(importlib.import_module(_lazyClasses[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyClasses))
+
 # Starts the NetworkTables
 @staticmethod
-def startNetworkComms(teamNumber: int = 2199):
+def startNetworkComms(teamNumber: int = 2199, timeout: float = 10.0) -> bool:
     """
-    Starts an NT4 server and client for a specific team.
+    Starts an NT4 server and client for a specific team, and waits until the client connects.
 
     :param teamNumber: Your FRC team's number.
+    :param timeout: The longest time to wait for a connection in seconds.
+    :return: Did the client connect before the timeout?
     """
+    # Imports NetworkTables only when it is started
+    import ntcore
+    from   networktables import NetworkTablesInstance
+    from   .Utilities    import Logger
+
     # Ensures that a team number is a least 4 character long
-    teamStr = str(teamNumber)
-    teamStr.zfill(4)
- 
-    # Waits for the Rio to start
-    time.sleep(5)
+    teamStr = str(teamNumber).zfill(4)
 
     # Gets the default NetworkTables instance
     ntinst = NetworkTablesInstance.getDefault() # Get a NetworkTables Instance
@@ -49,10 +113,27 @@ def startNetworkComms(teamNumber: int = 2199):
     # Initializes the NetworkTables
     ntinst.initialize(server = "10." + teamStr[:2] + "." + teamStr[2:] + ".2")
 
-    # Create the NT4 server and client
+    # Signals when the NT4 client connects, including if it is already connected
+    connected = threading.Event()
     nt = ntcore.NetworkTableInstance.getDefault()
+    listener = nt.addConnectionListener(True, lambda event: connected.set() if (event.is_(ntcore.EventFlags.kConnected) == True) else None)
+
+    # Create the NT4 server and client
     nt.setServerTeam(teamNumber)
     nt.startClient4(__file__)
 
     # Create the NetworkTables
-    ntinst.startClientTeam(teamNumber)
\ No newline at end of file
+    ntinst.startClientTeam(teamNumber)
+
+    # Waits for the Rio instead of sleeping for a fixed time
+    startTime = time.monotonic()
+    isConnected = connected.wait(timeout)
+    nt.removeListener(listener)
+
+    # Updates log
+    if (isConnected == True):
+        Logger.logInfo("NetworkTables connected after %.2f seconds", True, time.monotonic() - startTime)
+    else:
+        Logger.logWarning("NetworkTables did not connect within %.2f seconds", True, timeout)
+
+    return isConnected
@@ -2,12 +2,19 @@
 import cv2   as cv
 import numpy as np
 import pupil_apriltags
+from   time   import perf_counter, monotonic
 from   wpilib import Timer
 from   wpimath.geometry import *
 from   frc_apriltags import NetworkCommunications
+from   .tracking     import TagTracker
+from   .governor     import DetectionGovernor
+from   .gate         import FrameGate
+from   .results      import TagResult, getFieldPoses
+from   .estimator    import PoseEstimator
+from   .visualization import TagVisualizer
 
 # Import Utilities
-from .Utilities import Logger, Units
+from .Utilities import Logger, Units, Profiler
 
 # Creates the Detector Class
 class Detector:
@@ -15,103 +22,130 @@ class Detector:
     Use this class to detect AprilTags from the tag16h5 family.
 
     :param size: The size of the AprilTag in inches.
+    :param validIds: The tag ids present on the field. All other ids are thrown out before pose estimation.
+    :param maxHamming: The most error bits a tag may have corrected.
+    :param minConfidence: The smallest decision margin a tag may have.
+    :param maxError: The largest object-space pose error a tag may have.
+    :param comms: The ``NetworkCommunications`` to publish results with. One is created if None.
     """
-    def __init__(self, size: int = 6) -> None:
+    def __init__(self, size: int = 6, validIds = range(1, 9), maxHamming: int = 1, minConfidence: float = 50, maxError: float = 1e-3, comms = None) -> None:
         """
         Constructor for the Detector class.
 
         :param size: The size of the AprilTag in inches.
+        :param validIds: The tag ids present on the field. All other ids are thrown out before pose estimation.
+        :param maxHamming: The most error bits a tag may have corrected.
+        :param minConfidence: The smallest decision margin a tag may have.
+        :param maxError: The largest object-space pose error a tag may have.
+        :param comms: The ``NetworkCommunications`` to publish results with. One is created if None.
         """
         # Instance creation
         self.timer = Timer()
-        self.comms = NetworkCommunications()
+        self.comms = comms if (comms is not None) else NetworkCommunications()
 
         # Creates a pupil apriltags detector
         self.detector = pupil_apriltags.Detector(families = "tag16h5")
 
+        # Draws the pose of every tag at once
+        self.visualizer = TagVisualizer(size)
+
         # Variables
         self.tagSize   = Units.inchesToMeters(size)
         self.logStatus = False
 
+        # Detection filters
+        self.validIds      = frozenset(validIds)
+        self.maxHamming    = maxHamming
+        self.minConfidence = minConfidence
+        self.maxError      = maxError
+
+        # Tracking, the governor, the frame gate and field pose estimation are disabled until they are enabled
+        self.tracker   = None
+        self.governor  = None
+        self.gate      = None
+        self.estimator = None
+        self.robotPose = None
+
+        # The results of the last detected frame, reused for frames the gate skips
+        self.lastResults      = []
+        self.lastBest         = None
+        self.lastPoseMatrices = np.zeros((0, 3, 4))
+        self.lastCaptureTime  = None
+
+        # Corners of the tag in the tag's frame, in the order ``pupil_apriltags`` reports them
+        halfSize = self.tagSize / 2
+        self.tagCorners = np.array([
+                                    [-halfSize,  halfSize, 0],
+                                    [ halfSize,  halfSize, 0],
+                                    [ halfSize, -halfSize, 0],
+                                    [-halfSize, -halfSize, 0]
+                                ])
+
         # Update logs
         Logger.logInfo("Detector initialized", True)
 
-    def detectTags(self, stream, camera_matrix, vizualization: int = 0):
+    def detectTags(self, stream, camera_matrix, vizualization: int = 0, distortion = None, captureTime: float = None):
         """
         Detects AprilTags in a stream using ``pupil_apriltags``.
+        If distortion coefficients are given, the stream is expected to be the raw, distorted image and only the tag corners are undistorted.
+        Every result of the frame is published to NetworkTables at once, timestamped with the capture time.
+        Frames the gate skips publish the last results again, along with how long ago they were detected.
 
         :param stream: The images generated by reading a ``VideoCapture``.
         :param camera_matrix: The camera's intrinsic calibration matrix.
         :param vizualization: 0 - Highlight, 1 - Highlight + Boxes, 2 - Highlight + Axes, 3 - Highlight + Boxes + Axes.
-        :return: The detection result.
+        :param distortion: The camera's distortion coefficients, or None if the stream is already undistorted.
+        :param captureTime: The time the stream was captured, from ``time.monotonic()``, or None to use the time detection starts.
+        :return: A list of ``TagResult`` objects, one for each detected tag.
         :return: The image.
         """
+        # Gets when the stream was captured
+        if (captureTime is None):
+            captureTime = monotonic()
+
+        # Starts timing each stage
+        frameStart = Profiler.now()
+
         # If the stream is not grayscale, create a grayscale copy
         if (len(stream.shape) == 3):
             gray = cv.cvtColor(stream, cv.COLOR_BGR2GRAY)
         else:
             gray = stream
+        stageStart = Profiler.record("detector.grayscale", frameStart)
+
+        # Reuses the last results if the gate finds nothing new in the frame
+        if (self.gate is not None):
+            skip = self.gate.shouldSkip(gray)
+            Profiler.record("detector.gate", stageStart)
+            if (skip == True):
+                results = self.reuseResults(stream, camera_matrix, vizualization, distortion, captureTime)
+                Profiler.record("detector.total", frameStart)
+                return results, stream
 
-        # Define the intrinsic parameters of the camera
-        intrinsic_properties = (camera_matrix[0, 0], camera_matrix[1, 1], camera_matrix[0, 2], camera_matrix[1, 2])  # fx, fy, cx, cy
+        # Finds the tags and their poses
+        detections, poseMatrices = self.findTags(gray, camera_matrix, distortion)
 
-        # Detect the AprilTags in the image with pupil_apriltags
-        detections = self.detector.detect(img = gray, estimate_tag_pose = True, camera_params = intrinsic_properties, tag_size = self.tagSize)
+        # Converts every pose into the field's WCS at once
+        stageStart = Profiler.now()
+        translations, rotations = self.getFieldPoses(poseMatrices)
+        stageStart = Profiler.record("detector.fieldPose", stageStart)
 
         # Variables to use in detections
         results = []
-        maxError = 1e-3
-        maxHamming = 1
-        minConfidence = 50
 
         # Variables to use in sorting the data
         best = None
         prevMargin = 0
 
         # Access the 3D pose of all detected tag
-        for tag in detections:
+        for i, tag in enumerate(detections):
             # Gets info from the tag
             decision_margin = tag.decision_margin
-            hamming         = tag.hamming
             tag_num         = tag.tag_id
-            center          = tag.center
-            error           = tag.pose_err
-
-            # Gets pose data from the tag
-            rMatrix = tag.pose_R
-            tVecs   = tag.pose_t
-
-            # Throws out tags not present on the field
-            if (1 <= tag_num <= 8):
-                pass
-            else:
-                # Detected tag is not on field, move to next detection
-                continue
-
-            # Throws out noise
-            if ((hamming <= maxHamming) and (error <= maxError) and (decision_margin >= minConfidence)):
-                pass
-            else:
-                # Detected tag is noise, move to next detection
-                continue
-
-            # Creates a 3d pose array from the rotation matrix and translation vectors
-            poseMatrix = np.concatenate([rMatrix, tVecs], axis = 1)
-
-            # Draws varying levels of information onto the image
-            if (vizualization == 1):
-                self.draw_pose_box(stream, camera_matrix, poseMatrix)
-            elif (vizualization == 2):
-                self.draw_pose_axes(stream, camera_matrix, poseMatrix, center)
-            elif (vizualization == 3):
-                self.draw_pose_box(stream, camera_matrix, poseMatrix)
-                self.draw_pose_axes(stream, camera_matrix, poseMatrix, center)
-
-            # Calculate Pose3d
-            pose3d = self.getPose3D(poseMatrix)
-
-            # Adds results to the arrays
-            result = [tag_num, pose3d]
+            poseMatrix      = poseMatrices[i]
+
+            # Adds results to the arrays. The Pose3d is only built if it is asked for
+            result = TagResult(tag_num, translations[i], rotations[i], poseMatrix, tag)
             results.append(result)
 
             # Determines if the current decision margin is larger than the last one and stores the corresponding data
@@ -119,24 +153,302 @@ class Detector:
                 prevMargin = decision_margin
                 best = result
 
-            # Gets current time
-            time = self.timer.getFPGATimestamp()
+        # Draws varying levels of information onto the image
+        if (vizualization != 0):
+            self.visualizer.draw(stream, camera_matrix, poseMatrices, distortion, vizualization)
+            stageStart = Profiler.record("detector.draw", stageStart)
 
-            # Sets detection time
-            self.comms.setDetectionTimeSec(time)
+        # Solves for the robot's pose from every tag at once and stores it in NetworkTables
+        if (self.estimator is not None):
+            self.robotPose = self.estimator.estimateRobotPose(results, camera_matrix, distortion)
+            if (self.robotPose is not None):
+                self.comms.setRobotPose(self.robotPose, self.estimator.getTagsUsed(), self.estimator.getReprojectionError(), self.comms.getNetworkTime(captureTime))
+            stageStart = Profiler.record("detector.estimator", stageStart)
 
-        # Stores the best result in NetworkTables
-        if (best is not None):
-            self.comms.setBestResult(best)
+        # Publishes every result of the frame in one packet
+        self.comms.publishFrame(results, best, captureTime)
+        Profiler.record("detector.total", frameStart)
 
-        # Determines if there are valid targets
-        if (len(results) > 0):
-            self.comms.setTargetValid(True)
-        else:
-            self.comms.setTargetValid(False)
+        # Keeps the results for frames the gate skips
+        self.lastResults, self.lastBest, self.lastPoseMatrices, self.lastCaptureTime = results, best, poseMatrices, captureTime
 
         return results, stream
 
+    def reuseResults(self, stream, camera_matrix, vizualization: int = 0, distortion = None, captureTime: float = None):
+        """
+        Gets the results of the last detected frame for a frame the gate skipped.
+        The results are published again with the skipped frame's capture time and their age, so the RoboRio can tell a static scene from a stalled coprocessor.
+
+        :param stream: The skipped image.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param vizualization: 0 - Highlight, 1 - Highlight + Boxes, 2 - Highlight + Axes, 3 - Highlight + Boxes + Axes.
+        :param distortion: The camera's distortion coefficients, or None if the stream is already undistorted.
+        :param captureTime: The time the skipped stream was captured, from ``time.monotonic()``, or None to use the current time.
+        :return: A list of the last ``TagResult`` objects, with their age increased by one frame.
+        """
+        # Gets when the stream was captured
+        if (captureTime is None):
+            captureTime = monotonic()
+
+        # Ages every reused result
+        for result in self.lastResults:
+            result.age += 1
+
+        # Draws the last poses, which still match a static frame
+        if (vizualization != 0):
+            self.visualizer.draw(stream, camera_matrix, self.lastPoseMatrices, distortion, vizualization)
+
+        # Publishes the reused results with how long ago their frame was captured
+        age = (captureTime - self.lastCaptureTime) if (self.lastCaptureTime is not None) else 0.0
+        self.comms.publishFrame(self.lastResults, self.lastBest, captureTime, age)
+
+        return list(self.lastResults)
+
+    def findTags(self, gray, camera_matrix, distortion = None):
+        """
+        Finds the AprilTags in a grayscale image and estimates their poses, without publishing anything.
+        This is the part of ``detectTags`` that ``DetectorPool`` runs in its worker processes.
+
+        :param gray: The grayscale image.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients, or None if the image is already undistorted.
+        :return: The detections that passed every filter, with their poses.
+        :return: An (N, 3, 4) array of each detection's pose relative to the camera.
+        """
+        # Starts timing the detection
+        detectionStart = perf_counter()
+        stageStart     = Profiler.now()
+
+        # Detect the AprilTags in the image with pupil_apriltags. Pose is estimated later, only for tags that pass the filters
+        if (self.tracker is not None):
+            # The tracker already throws out invalid tags, so they never become tracks
+            detections = self.trackTags(gray)
+            stageStart = Profiler.record("detector.detect", stageStart)
+        else:
+            detections = self.detector.detect(img = gray, estimate_tag_pose = False)
+            stageStart = Profiler.record("detector.detect", stageStart)
+
+            # Throws out tags not present on the field and noise
+            detections = [tag for tag in detections if (self.isValidTag(tag) == True)]
+            stageStart = Profiler.record("detector.filter", stageStart)
+
+        # Estimates the pose of the remaining tags in one pass
+        self.estimatePoses(detections, camera_matrix, distortion)
+
+        # Lets the governor adjust the detector for the next frame
+        if (self.governor is not None):
+            self.updateGovernor(detections, perf_counter() - detectionStart)
+
+        # Throws out poses that do not fit the tag's corners
+        detections = [tag for tag in detections if (tag.pose_err <= self.maxError)]
+
+        # Creates a 3d pose array for every tag from the rotation matrices and translation vectors
+        poseMatrices = np.array([np.concatenate([tag.pose_R, tag.pose_t], axis = 1) for tag in detections]).reshape(-1, 3, 4)
+        Profiler.record("detector.pose", stageStart)
+
+        return detections, poseMatrices
+
+    def trackTags(self, gray):
+        """
+        Detects AprilTags only in the regions where tracked tags are predicted to be.
+        The full frame is scanned instead when a track is lost, when nothing is tracked, or every ``reacquireInterval`` frames.
+
+        :param gray: The grayscale image.
+        :return: The detections, with corners and centers in full-frame coordinates.
+        """
+        # Gets the time of the frame
+        timestamp  = self.timer.getFPGATimestamp()
+        resolution = (gray.shape[1], gray.shape[0])
+
+        # Scans the full frame if needed
+        fullScan = self.tracker.needsFullScan()
+        if (fullScan == True):
+            detections = [tag for tag in self.detector.detect(img = gray, estimate_tag_pose = False) if (self.isValidTag(tag) == True)]
+        else:
+            # Detects in each predicted region, keeping the best decode of each tag
+            found = {}
+            for x, y, w, h in self.tracker.predictRegions(resolution, timestamp):
+                for tag in self.detector.detect(img = gray[y:y+h, x:x+w], estimate_tag_pose = False):
+                    # Moves the detection back into full-frame coordinates
+                    tag.corners = tag.corners + (x, y)
+                    tag.center  = tag.center + (x, y)
+                    tag.homography = np.array([[1, 0, x], [0, 1, y], [0, 0, 1]]) @ tag.homography
+
+                    if ((self.isValidTag(tag) == True) and ((tag.tag_id not in found) or (tag.decision_margin > found[tag.tag_id].decision_margin))):
+                        found[tag.tag_id] = tag
+            detections = list(found.values())
+
+        # Updates the tracks
+        self.tracker.update(detections, timestamp, fullScan)
+
+        return detections
+
+    def enableTracking(self, reacquireInterval: int = 15, padding: float = 0.5):
+        """
+        Enables tracking mode. Once a tag has been seen, only the region around its predicted location is searched.
+
+        :param reacquireInterval: A full-frame scan runs at least once every this many frames.
+        :param padding: How far to grow each predicted region, as a fraction of the tag's size in pixels.
+        """
+        self.tracker = TagTracker(reacquireInterval, padding)
+
+        # Updates log
+        Logger.logInfo("Tracking enabled", self.logStatus)
+
+    def disableTracking(self):
+        """
+        Disables tracking mode so every frame is scanned in full.
+        """
+        self.tracker = None
+
+    def enableFieldPose(self, layout, robotToCamera: Transform3d = Transform3d()):
+        """
+        Enables field pose estimation. Every frame, the corners of all detected tags are solved together into one robot pose.
+
+        :param layout: The ``AprilTagFieldLayout`` of the field.
+        :param robotToCamera: The ``Transform3d`` from the robot's center to the camera.
+        """
+        self.estimator = PoseEstimator(layout, Units.metersToInches(self.tagSize), robotToCamera)
+
+        # Updates log
+        Logger.logInfo("Field pose estimation enabled", self.logStatus)
+
+    def getRobotPose(self):
+        """
+        Gets the robot pose solved from the last frame.
+
+        :return: The robot's ``Pose3d``, or None if no known tag was seen.
+        """
+        return self.robotPose
+
+    def updateGovernor(self, detections, detectionTime: float):
+        """
+        Passes the detection time and the apparent size of each tag to the governor, and publishes the active settings.
+
+        :param detections: The detections kept this frame.
+        :param detectionTime: The time the detection took in seconds.
+        """
+        # Gets the mean edge length of each tag in pixels
+        tagSizes = [np.mean(np.linalg.norm(tag.corners - np.roll(tag.corners, 1, axis = 0), axis = 1)) for tag in detections]
+
+        # Updates the governor
+        self.governor.update(detectionTime, tagSizes)
+
+        # Publishes the settings so they can be graphed
+        self.comms.setDetectorSettings(self.governor.getLatency(), self.governor.getSettings())
+
+    def enableGovernor(self, targetTime: float = 0.020, minTagPixels: float = 16):
+        """
+        Enables the latency governor, which adjusts decimation, blur, edge refinement and threads between frames to stay within a time budget.
+
+        :param targetTime: The detection time budget in seconds.
+        :param minTagPixels: The smallest a tag's edge may become after decimation, in pixels.
+        """
+        self.governor = DetectionGovernor(self.detector, targetTime, minTagPixels)
+
+        # Updates log
+        Logger.logInfo("Governor enabled", self.logStatus)
+
+    def enableGate(self, changeThreshold: float = 6.0, changeFraction: float = 0.0005, blurRatio: float = 0.5, maxSkipped: int = 30):
+        """
+        Enables the frame gate, which skips detection on static and motion blurred frames and reuses the last results instead.
+
+        :param changeThreshold: The difference, in gray levels, a thumbnail pixel must exceed to count as changed.
+        :param changeFraction: The fraction of thumbnail pixels that must change for a frame not to be static.
+        :param blurRatio: A frame is blurred if its sharpness is below this fraction of the recent peak sharpness.
+        :param maxSkipped: The most frames in a row that may be skipped, so results are never older than this.
+        """
+        self.gate = FrameGate(changeThreshold = changeThreshold, changeFraction = changeFraction, blurRatio = blurRatio, maxSkipped = maxSkipped)
+
+        # Updates log
+        Logger.logInfo("Frame gate enabled", self.logStatus)
+
+    def disableGate(self):
+        """
+        Disables the frame gate so every frame is detected.
+        """
+        self.gate = None
+
+    def getGateStats(self) -> dict:
+        """
+        Gets how many frames the gate let through and skipped.
+
+        :return: A dictionary of ``changed``, ``static`` and ``blurred`` frame counts, and the ``hitRate``, or an empty dictionary if the gate is disabled.
+        """
+        if (self.gate is None):
+            return {}
+
+        return self.gate.getStats()
+
+    def getDetectorSettings(self) -> dict:
+        """
+        Gets the active ``pupil_apriltags`` settings.
+
+        :return: A dictionary of ``quad_decimate``, ``quad_sigma``, ``refine_edges`` and ``nthreads``.
+        """
+        return {key: self.detector.params[key] for key in ("quad_decimate", "quad_sigma", "refine_edges", "nthreads")}
+
+    def isValidTag(self, tag) -> bool:
+        """
+        Gets if a detection is a tag on the field with a trustworthy decode.
+
+        :param tag: A detection returned by ``pupil_apriltags``.
+        :return: Should the detection be kept?
+        """
+        return (tag.tag_id in self.validIds) and (tag.hamming <= self.maxHamming) and (tag.decision_margin >= self.minConfidence)
+
+    def estimatePoses(self, detections, camera_matrix, distortion = None):
+        """
+        Estimates the pose of each detection from its corners.
+        The corners of every detection are undistorted together, and the pose is stored on each detection the same way ``pupil_apriltags`` does.
+
+        :param detections: The detections returned by ``pupil_apriltags`` without pose estimation.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients, or None if the corners are already undistorted.
+        """
+        # Nothing to estimate
+        if (len(detections) == 0):
+            return
+
+        # Undistorts the corners of every detection at once
+        corners = np.concatenate([tag.corners for tag in detections]).reshape(-1, 1, 2)
+        if (distortion is not None):
+            corners = cv.undistortPoints(corners, camera_matrix, distortion, P = camera_matrix)
+        corners = corners.reshape(-1, 4, 2)
+
+        # Solves for the pose of each square tag
+        rMatrices = np.empty((len(detections), 3, 3))
+        tVecs     = np.empty((len(detections), 3, 1))
+        for i in range(len(detections)):
+            ret, rVecs, tVecs[i] = cv.solvePnP(self.tagCorners, corners[i], camera_matrix, None, flags = cv.SOLVEPNP_IPPE_SQUARE)
+            rMatrices[i], _ = cv.Rodrigues(rVecs)
+
+        # Normalized viewing rays through each corner
+        rays = cv.undistortPoints(corners.reshape(-1, 1, 2), camera_matrix, None).reshape(-1, 4, 2)
+        rays = np.concatenate([rays, np.ones((len(detections), 4, 1))], axis = 2)
+
+        # Calculates the object-space error of every tag the same way pupil_apriltags does
+        points     = np.einsum("nij,kj->nki", rMatrices, self.tagCorners) + tVecs.reshape(-1, 1, 3)
+        projection = rays * (np.sum(rays * points, axis = 2) / np.sum(rays * rays, axis = 2))[..., None]
+        errors     = np.sum((points - projection) ** 2, axis = (1, 2))
+
+        # Stores the pose on each detection
+        for i, tag in enumerate(detections):
+            tag.pose_R   = rMatrices[i]
+            tag.pose_t   = tVecs[i]
+            tag.pose_err = errors[i]
+
+    def getFieldPoses(self, poseMatrices):
+        """
+        Calculates the field relative translation and rotation of many tags at once.
+        This gives the same values as ``getPose3D`` without creating any WPILib objects.
+
+        :param poseMatrices: An (N, 3, 4) ``numpy.ndarray`` of PupilApriltags poses.
+        :return: An (N, 3) array of x, y and z translations in meters.
+        :return: An (N, 3) array of roll, pitch and yaw rotations in radians.
+        """
+        return getFieldPoses(poseMatrices)
+
     def getPose3D(self, poseMatrix = None):
         """
         Calculates a WPILib ``Pose3d`` from the PupilApriltags matrix.
@@ -194,7 +506,7 @@ class Detector:
             # Returns a blank Pose3d
             return Pose3d()
 
-    def draw_pose_box(self, img, camera_matrix, pose, z_sign = 1):
+    def draw_pose_box(self, img, camera_matrix, pose, z_sign = 1, distortion = None):
         """
         Draws the 3d pose box around the AprilTag.
 
@@ -202,6 +514,7 @@ class Detector:
         :param camera_matrix: The camera's intrinsic calibration matrix.
         :param pose: The ``Pose3d`` of the tag.
         :param z_sign: The direction of the z-axis.
+        :param distortion: The camera's distortion coefficients if the image is distorted.
         """
         # Creates object points
         opoints = np.array([
@@ -235,8 +548,11 @@ class Detector:
         rVecs, _ = cv.Rodrigues(pose[:3,:3])
         tVecs = pose[:3, 3:]
 
-        # Derivative coefficients
-        dcoeffs = np.zeros(5)
+        # Distortion coefficients
+        if (distortion is not None):
+            dcoeffs = distortion
+        else:
+            dcoeffs = np.zeros(5)
 
         # Calulate image points of each AprilTag
         ipoints, _ = cv.projectPoints(opoints, rVecs, tVecs, camera_matrix, dcoeffs)
@@ -247,7 +563,7 @@ class Detector:
         for i, j in edges:
             cv.line(img, ipoints[i], ipoints[j], (0, 255, 0), 1, 16)
 
-    def draw_pose_axes(self, img, camera_matrix, pose, center):
+    def draw_pose_axes(self, img, camera_matrix, pose, center, distortion = None):
         """
         Draws the colored pose axes around the AprilTag.
 
@@ -255,13 +571,17 @@ class Detector:
         :param camera_matrix: The camera's intrinsic calibration matrix.
         :param pose: The ``Pose3d`` of the tag.
         :param center: The center of the AprilTag.
+        :param distortion: The camera's distortion coefficients if the image is distorted.
         """
         # Calulcates rotation and translation vectors for each AprilTag
         rVecs, _ = cv.Rodrigues(pose[:3,:3])
         tVecs    = pose[:3, 3:]
 
-        # Derivative coefficients
-        dcoeffs = np.zeros(5)
+        # Distortion coefficients
+        if (distortion is not None):
+            dcoeffs = distortion
+        else:
+            dcoeffs = np.zeros(5)
 
         # Calculate object points of each AprilTag
         opoints = np.float32([[1, 0, 0],
@@ -1,8 +1,11 @@
 # Import Libraries
 import os
 import glob
+import time
+import hashlib
 import cv2   as cv
 import numpy as np
+from   concurrent.futures import ThreadPoolExecutor
 
 # Import Utilities
 from .Utilities import Logger
@@ -13,6 +16,63 @@ CHESSBOARD = (8, 5)  # Number of interior corners (width in squares - 1 x height
 # Default termination criteria
 criteria = (cv.TERM_CRITERIA_EPS + cv.TERM_CRITERIA_MAX_ITER, 30, 0.001)
 
+def hashFile(path: str) -> str:
+    """
+    Hashes the contents of a file.
+
+    :param path: The path of the file.
+    :return: The SHA-1 hex digest of the file.
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def findCorners(imagePath: str):
+    """
+    Finds and refines the chessboard corners in a calibration image.
+    This runs on the worker threads of ``Calibrate.findAllCorners``.
+
+    :param imagePath: The path of the image.
+    :return: The refined corners, or None if the chessboard was not found.
+    """
+    # Reads the image as grayscale
+    gray = cv.imread(imagePath, cv.IMREAD_GRAYSCALE)
+    if (gray is None):
+        return None
+
+    # Finds chessboard corners. ret is true only if the desired number of corners are found
+    ret, corners = cv.findChessboardCorners(gray, CHESSBOARD, cv.CALIB_CB_ADAPTIVE_THRESH + cv.CALIB_CB_FAST_CHECK + cv.CALIB_CB_NORMALIZE_IMAGE)
+    if (ret == False):
+        return None
+
+    # Refining pixel coordinates for given 2d points.
+    return cv.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+
+def scaleIntrinsics(camera_matrix, fromResolution: tuple, toResolution: tuple):
+    """
+    Derives the intrinsic matrix of another resolution of the same sensor mode.
+    The sensor image is assumed to be scaled until it covers the new resolution and then cropped about its center, which is how UVC cameras produce their resolutions.
+    Distortion coefficients act on normalized coordinates, so they do not change.
+
+    :param camera_matrix: The calibrated intrinsic matrix.
+    :param fromResolution: The resolution the camera was calibrated at (width, height).
+    :param toResolution: The resolution to derive the matrix for (width, height).
+    :return: The intrinsic matrix at the new resolution.
+    """
+    # Scales to cover the new resolution, then crops the overflow evenly from both sides
+    scale = max(toResolution[0] / fromResolution[0], toResolution[1] / fromResolution[1])
+    cropX = (fromResolution[0] * scale - toResolution[0]) / 2
+    cropY = (fromResolution[1] * scale - toResolution[1]) / 2
+
+    # Pixel centers sit half a pixel from the edge of their pixel, so the principal point is scaled about the image corner
+    scaled = np.array(camera_matrix, dtype = np.float64).copy()
+    scaled[0, 0] *= scale
+    scaled[1, 1] *= scale
+    scaled[0, 1] *= scale
+    scaled[0, 2] = (scaled[0, 2] + 0.5) * scale - 0.5 - cropX
+    scaled[1, 2] = (scaled[1, 2] + 0.5) * scale - 0.5 - cropY
+
+    return scaled
+
 # Creates the Calibrate class
 class Calibrate:
     """
@@ -22,19 +82,30 @@ class Calibrate:
     :param camNum: The camera number.
     :param numImages: The number of calibration images to take.
     :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+    :param headless: Should calibration run without any windows. Calibration images are then taken automatically whenever the chessboard is seen.
+    :param workers: The number of threads used to find chessboard corners, or None to use one per core.
+    :param cameraId: The name the calibration images are stored under, or None to name them after the camera number.
+        If no images are stored under the name but some are stored under the camera number, those are used instead.
     """
-    def __init__(self, cap, camNum: int, numImages: int = 15, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test") -> None:
+    def __init__(self, cap, camNum: int, numImages: int = 15, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test", headless: bool = False, workers: int = None, cameraId: str = None) -> None:
         """
         Constructor for the Calibrate class.
         :param cap: The ``cv2.VideoCapture`` object.
         :param camNum: The camera number.
         :param numImages: The number of calibration images to take.
         :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+        :param headless: Should calibration run without any windows. Calibration images are then taken automatically whenever the chessboard is seen.
+        :param workers: The number of threads used to find chessboard corners, or None to use one per core.
+        :param cameraId: The name the calibration images are stored under, or None to name them after the camera number.
+            If no images are stored under the name but some are stored under the camera number, those are used instead.
         """
         # Localizes parameters
         self.cap               = cap
         self.camNum            = camNum
         self.calibrationImages = numImages
+        self.headless          = headless
+        self.workers           = workers
+        self.cameraId          = cameraId if (cameraId is not None) else f"camera{camNum}"
 
         # Get height and width
         self.width  = int(self.cap.get(cv.CAP_PROP_FRAME_WIDTH))
@@ -48,18 +119,28 @@ class Calibrate:
         self.objPoints = []  # 3D point in real world
         self.imgPoints = []  # 2D point in image plane
 
-        # Path to calibration images
-        self.PATH = dirPath + f"/camera{self.camNum}-{self.width}x{self.height}-images/"
-
         # File extension
         self.EXTENSION = ".png"
 
+        # Path to calibration images
+        self.PATH = dirPath + f"/{self.cameraId}-{self.width}x{self.height}-images/"
+
+        # Keeps using images stored under the camera number before cameras were named by id, until images are taken under the id
+        legacyPath = dirPath + f"/camera{camNum}-{self.width}x{self.height}-images/"
+        if ((legacyPath != self.PATH) and (len(glob.glob(self.PATH + "*" + self.EXTENSION)) == 0) and (len(glob.glob(legacyPath + "*" + self.EXTENSION)) > 0)):
+            self.PATH = legacyPath
+            Logger.logInfo("Using the calibration images of camera %s stored under its number", True, camNum)
+
+        # Path to the cached corners of each image
+        self.CACHE_PATH = self.PATH + "corners/"
+
         # Variables
-        self.doOver    = False
-        self.logStatus = False
+        self.doOver            = False
+        self.reprojectionError = 0.0
+        self.logStatus         = False
 
         # Updates log
-        Logger.logInfo("Calibration initialized for camera " + str(camNum), True)
+        Logger.logInfo("Calibration initialized for camera %s", True, camNum)
 
     def calibrateCamera(self):
         """
@@ -73,7 +154,10 @@ class Calibrate:
         """
         # Variable to see how many images were used in the calibration
         imagesUsed = 0
-        self.doOver == False
+
+        # Starts from empty point arrays, since a do over replaces the images
+        self.objPoints = []
+        self.imgPoints = []
 
         # Checks if reference images exist
         refExists = self.getPathExistance()
@@ -87,78 +171,136 @@ class Calibrate:
         # Gets the path for all the images saved for this camera at a certain resolution
         images = glob.glob(self.PATH + "*" + self.EXTENSION)
 
+        # Finds the corners of every image at once
+        allCorners = self.findAllCorners(images)
+
         # Loops through stored images
         for image in images:
-            # Reads the created images
-            img = cv.imread(image)
-
-            # Converts images to grayscale
-            gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+            corners2 = allCorners[image]
 
-            # Finds chessboard corners. ret is true only if the desired number of corners are found
-            ret, corners = cv.findChessboardCorners(gray, CHESSBOARD, cv.CALIB_CB_ADAPTIVE_THRESH + cv.CALIB_CB_FAST_CHECK + cv.CALIB_CB_NORMALIZE_IMAGE)
-
-            # Desired number of corners found, add object and image points after refining them
-            if (ret == True):
+            # Desired number of corners found, add object and image points
+            if (corners2 is not None):
                 # Adds the objectpoint
                 self.objPoints.append(self.objp)
 
-                # Refining pixel coordinates for given 2d points.
-                corners2 = cv.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
-
                 # Adds image point
                 self.imgPoints.append(corners2)
 
-                # Draw the corners onto the image
-                img = cv.drawChessboardCorners(img, CHESSBOARD, corners2, ret)
-
                 # Increments the imagesUsed count
                 imagesUsed += 1
 
-            # Display the image and wait for half a second
-            if ((ret == True) & (refExists == False)):
-                # Flips the image for easier viewing
-                img = cv.flip(img, 1)
+                # Display the image and wait for half a second
+                if ((refExists == False) and (self.headless == False)):
+                    # Draw the corners onto the image and flips it for easier viewing
+                    img = cv.imread(image)
+                    img = cv.drawChessboardCorners(img, CHESSBOARD, corners2, True)
+                    img = cv.flip(img, 1)
 
-                # Displays image
-                cv.imshow("img", img)
-                cv.waitKey(500)
+                    # Displays image
+                    cv.imshow("img", img)
+                    cv.waitKey(500)
 
         # Destroys all cached windows
-        cv.destroyAllWindows()
+        if (self.headless == False):
+            cv.destroyAllWindows()
 
         # Restarts the calibration if 1/2 of the images cannot be used for calibration
         if (imagesUsed < (self.calibrationImages * 1/2)):
             # Updates log
             Logger.logWarning("Calibration restarted", self.logStatus)
-            Logger.logInfo(f"Images found: {imagesUsed}", self.logStatus)
+            Logger.logInfo("Images found: %d", self.logStatus, imagesUsed)
 
             # Sets up for a do over
             self.doOver = True
 
-            self.calibrateCamera()
+            return self.calibrateCamera()
         else:
-            Logger.logInfo(f"Images found: {imagesUsed}", self.logStatus)
+            Logger.logInfo("Images found: %d", self.logStatus, imagesUsed)
             self.doOver = False
 
         # Calibrate the camera by passing the value of known 3D points (objPoints) and corresponding pixel coordinates of the detected corners (imgPoints)
-        self.ret, self.cameraMatrix, self.distortion, self.rVecs, self.tVecs = cv.calibrateCamera(self.objPoints, self.imgPoints, gray.shape[::-1], None, None)
+        self.ret, self.cameraMatrix, self.distortion, self.rVecs, self.tVecs = cv.calibrateCamera(self.objPoints, self.imgPoints, (self.width, self.height), None, None)
 
         # Calculates the reprediction error
-        repredictError = self.calculateRepredictionError()
+        self.reprojectionError = self.calculateRepredictionError()
 
         # Updates log
-        Logger.logInfo(f"Camera {self.camNum} Calibrated", self.logStatus)
+        Logger.logInfo("Camera %s Calibrated", self.logStatus, self.camNum)
 
         # Return calibration results
         return self.ret, self.cameraMatrix, self.distortion, self.rVecs, self.tVecs
 
+    def findAllCorners(self, images):
+        """
+        Finds the chessboard corners of many images.
+        The corners of each image are cached by the hash of its contents, so only new or changed images are processed, and those are spread across a thread pool.
+        OpenCV releases the GIL while it searches for corners, so the threads run in parallel without the calling script needing a main guard.
+
+        :param images: The paths of the images.
+        :return: A dictionary of image path to its corners, or None if the chessboard was not found.
+        """
+        os.makedirs(self.CACHE_PATH, exist_ok = True)
+
+        # Loads the cached corners of each image
+        allCorners = {}
+        cachePaths = {}
+        for image in images:
+            cachePath = self.CACHE_PATH + f"{hashFile(image)}-{CHESSBOARD[0]}x{CHESSBOARD[1]}.npy"
+
+            if (os.path.exists(cachePath) == True):
+                # Images without a chessboard are cached as empty arrays
+                corners = np.load(cachePath)
+                allCorners[image] = corners if (corners.size > 0) else None
+            else:
+                cachePaths[image] = cachePath
+
+        # Finds the corners of the remaining images in parallel
+        newImages = list(cachePaths)
+        if (len(newImages) > 0):
+            with ThreadPoolExecutor(max_workers = self.workers if (self.workers is not None) else (os.cpu_count() or 1), thread_name_prefix = "findCorners") as executor:
+                for image, corners in zip(newImages, executor.map(findCorners, newImages)):
+                    allCorners[image] = corners
+                    np.save(cachePaths[image], corners if (corners is not None) else np.zeros((0, 1, 2), np.float32))
+
+        # Updates log
+        Logger.logInfo("Corners found in %d new images, %d were cached", self.logStatus, len(newImages), len(images) - len(newImages))
+
+        return allCorners
+
+    def getFingerprint(self):
+        """
+        Gets a fingerprint of the calibration images, which changes if any image is added, removed or changed.
+
+        :return: The fingerprint, or None if there are no calibration images.
+        """
+        images = sorted(glob.glob(self.PATH + "*" + self.EXTENSION))
+        if (len(images) == 0):
+            return None
+
+        # Hashes the name and contents of every image, along with the chessboard they were taken of
+        fingerprint = hashlib.sha1(f"{CHESSBOARD[0]}x{CHESSBOARD[1]}".encode())
+        for image in images:
+            fingerprint.update(os.path.basename(image).encode())
+            fingerprint.update(hashFile(image).encode())
+
+        return fingerprint.hexdigest()
+
+    def getReprojectionError(self) -> float:
+        """
+        Gets the mean reprojection error of the last calibration.
+
+        :return: The reprojection error in pixels.
+        """
+        return self.reprojectionError
+
     def createCalibrationImages(self):
         """
         Creates a number of images to calibrate the camera.
+        When headless, an image is taken whenever the chessboard is seen, at most once a second.
         """
         # Variables
         imgSelected = False
+        lastTaken   = 0.0
 
         # Creates the calibration images
         for i in range(0, self.calibrationImages):
@@ -175,6 +317,8 @@ class Calibrate:
             while (imgSelected == False):
                 # Read the capture
                 sucess, stream = self.cap.read()
+                if (sucess == False):
+                    continue
 
                 # Stores a totally seperate copy of stream
                 tempStream = cv.cvtColor(stream, cv.COLOR_BGR2RGB)
@@ -193,14 +337,22 @@ class Calibrate:
                     # Draw the corners onto the stream
                     cv.drawChessboardCorners(stream, CHESSBOARD, corners2, ret)
 
-                # Flips the capture for display purposes
-                flippedStream = cv.flip(stream, 1)
+                if (self.headless == True):
+                    # Takes a calibration image once the chessboard is seen, giving time to move it between images
+                    takeImage = (ret == True) and (time.monotonic() - lastTaken > 1.0)
+                else:
+                    # Flips the capture for display purposes
+                    flippedStream = cv.flip(stream, 1)
+
+                    # Display the capture
+                    cv.imshow("Calibration", flippedStream)
 
-                # Display the capture
-                cv.imshow("Calibration", flippedStream)
+                    # Press p to take a calibration image
+                    takeImage = (cv.waitKey(1) == ord("p"))
+
+                if (takeImage == True):
+                    lastTaken = time.monotonic()
 
-                # Press p to take a calibration image
-                if ( cv.waitKey(1) == ord("p") ):
                     # Converts the copy back into BGR
                     tempStream = cv.cvtColor(tempStream, cv.COLOR_RGB2BGR)
 
@@ -211,17 +363,18 @@ class Calibrate:
                     print(f"Calibration image {j} taken")
 
                     # Updates log
-                    Logger.logInfo(f"Calibration image {j} taken", self.logStatus)
+                    Logger.logInfo("Calibration image %d taken", self.logStatus, j)
 
                     # Breaks the while loop
                     imgSelected = True
                     break
 
         # Destroys all windows
-        cv.destroyAllWindows()
+        if (self.headless == False):
+            cv.destroyAllWindows()
 
         # Updates log
-        Logger.logInfo("Calibration images stored at " +  self.PATH, self.logStatus)
+        Logger.logInfo("Calibration images stored at %s", self.logStatus, self.PATH)
 
     def getPathExistance(self) -> bool:
         """
@@ -237,7 +390,7 @@ class Calibrate:
         try:
             os.mkdir(self.PATH)
         except Exception as e:
-            Logger.logError(f"{e}", self.logStatus)
+            Logger.logError("%s", self.logStatus, e)
 
         # Attempts to read the last callibration image and updates variables accordingly
         img = cv.imread(self.PATH + str(self.calibrationImages) + self.EXTENSION)
@@ -275,8 +428,218 @@ class Calibrate:
         # Returns the mean error
         return mean_error
 
+    def evaluateIntrinsics(self, camera_matrix, distortion):
+        """
+        Measures how well intrinsics fit the calibration images at this resolution, without calibrating.
+        The pose of the chessboard in each image is solved with the given intrinsics, and the corners are reprojected.
+        A few images are enough, so this can check intrinsics that were scaled from another resolution.
+
+        :param camera_matrix: The intrinsic matrix to check.
+        :param distortion: The distortion coefficients to check.
+        :return: The mean reprojection error in pixels, or None if no image contains the chessboard.
+        """
+        images = glob.glob(self.PATH + "*" + self.EXTENSION)
+        if (len(images) == 0):
+            return None
+
+        # Solves and reprojects each image that contains the chessboard
+        errors = []
+        for corners in self.findAllCorners(images).values():
+            if (corners is None):
+                continue
+            ret, rVec, tVec = cv.solvePnP(self.objp, corners, camera_matrix, distortion)
+            imgPoints2, _ = cv.projectPoints(self.objp, rVec, tVec, camera_matrix, distortion)
+            errors.append(cv.norm(corners, imgPoints2, cv.NORM_L2) / len(imgPoints2))
+
+        if (len(errors) == 0):
+            return None
+
+        return float(np.mean(errors))
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
+
+# Creates the CalibrationStore class
+class CalibrationStore:
+    """
+    Use this class to save and load camera calibrations, so a camera only has to be calibrated once at each resolution.
+    Each calibration is saved to its own ``.npz`` file named after the camera and resolution, along with a fingerprint of the images it was calculated from.
+
+    :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+    """
+    # Where udev links each camera by its USB vendor, model and serial number
+    BY_ID_PATH = "/dev/v4l/by-id/"
+
+    # Chessboard corners are rarely found more precisely than this, so a derived calibration is never rejected for an error below it
+    MIN_ERROR = 0.1
+
+    def __init__(self, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test") -> None:
+        """
+        Constructor for the CalibrationStore class.
+
+        :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+        """
+        # Path to the stored calibrations
+        self.PATH = dirPath + "/calibrations/"
+
+        # Variables
+        self.logStatus = False
+
+    @staticmethod
+    def getCameraId(path: str = None, camNum: int = 0) -> str:
+        """
+        Gets a name for a camera that stays the same when cameras are plugged into different ports or enumerated in a different order.
+        Cameras are named after their ``/dev/v4l/by-id`` link when one exists.
+
+        :param path: The path the camera was opened with, or None if it was opened by number.
+        :param camNum: The camera number.
+        :return: The name of the camera.
+        """
+        # The camera was opened by its id
+        if ((path is not None) and (path.startswith(CalibrationStore.BY_ID_PATH) == True)):
+            return os.path.basename(path)
+
+        # Finds the id that links to the same device
+        device = os.path.realpath(path if (path is not None) else f"/dev/video{camNum}")
+        for link in sorted(glob.glob(CalibrationStore.BY_ID_PATH + "*")):
+            if (os.path.realpath(link) == device):
+                return os.path.basename(link)
+
+        # The camera has no id
+        return f"camera{camNum}"
+
+    def getProfilePath(self, cameraId: str, resolution: tuple) -> str:
+        """
+        Gets the path of a stored calibration.
+
+        :param cameraId: The name of the camera, from ``getCameraId``.
+        :param resolution: The resolution of the calibration (width, height).
+        :return: The path of the calibration file.
+        """
+        return self.PATH + f"{cameraId}-{resolution[0]}x{resolution[1]}.npz"
+
+    def save(self, cameraId: str, resolution: tuple, camera_matrix, distortion, reprojectionError: float, fingerprint: str = None):
+        """
+        Saves a calibration, replacing any calibration of the same camera and resolution.
+
+        :param cameraId: The name of the camera, from ``getCameraId``.
+        :param resolution: The resolution of the calibration (width, height).
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients.
+        :param reprojectionError: The mean reprojection error of the calibration in pixels.
+        :param fingerprint: The fingerprint of the calibration images, from ``Calibrate.getFingerprint``.
+        """
+        os.makedirs(self.PATH, exist_ok = True)
+
+        # Writes to a temporary file first, so a crash never leaves half a calibration behind
+        profilePath = self.getProfilePath(cameraId, resolution)
+        with open(profilePath + ".tmp", "wb") as file:
+            np.savez(
+                file,
+                camera_matrix     = np.asarray(camera_matrix, dtype = np.float64),
+                distortion        = np.asarray(distortion, dtype = np.float64),
+                reprojectionError = np.array(reprojectionError),
+                resolution        = np.array(resolution),
+                fingerprint       = np.array(fingerprint if (fingerprint is not None) else "")
+            )
+        os.replace(profilePath + ".tmp", profilePath)
+
+        # Updates log
+        Logger.logInfo("Calibration of %s at %dx%d saved", self.logStatus, cameraId, resolution[0], resolution[1])
+
+    def load(self, cameraId: str, resolution: tuple):
+        """
+        Loads a calibration.
+
+        :param cameraId: The name of the camera, from ``getCameraId``.
+        :param resolution: The resolution of the calibration (width, height).
+        :return: A dictionary of ``camera_matrix``, ``distortion``, ``reprojectionError``, ``resolution`` and ``fingerprint``, or None if the calibration is not stored.
+        """
+        profilePath = self.getProfilePath(cameraId, resolution)
+        if (os.path.exists(profilePath) == False):
+            return None
+
+        with np.load(profilePath) as profile:
+            calibration = {
+                "camera_matrix":     profile["camera_matrix"],
+                "distortion":        profile["distortion"],
+                "reprojectionError": float(profile["reprojectionError"]),
+                "resolution":        tuple(int(size) for size in profile["resolution"]),
+                "fingerprint":       str(profile["fingerprint"]) if (str(profile["fingerprint"]) != "") else None
+            }
+
+        # Updates log
+        Logger.logInfo("Calibration of %s at %dx%d loaded", self.logStatus, cameraId, resolution[0], resolution[1])
+
+        return calibration
+
+    def getResolutions(self, cameraId: str):
+        """
+        Gets every resolution a camera has a stored calibration for.
+
+        :param cameraId: The name of the camera, from ``getCameraId``.
+        :return: A list of resolutions (width, height), largest first.
+        """
+        resolutions = []
+        for profilePath in glob.glob(self.PATH + glob.escape(cameraId) + "-*x*.npz"):
+            size = os.path.basename(profilePath)[len(cameraId) + 1:-len(".npz")].split("x")
+            if ((len(size) == 2) and (size[0].isdigit() == True) and (size[1].isdigit() == True)):
+                resolutions.append((int(size[0]), int(size[1])))
+
+        return sorted(resolutions, key = lambda resolution: resolution[0] * resolution[1], reverse = True)
+
+    def deriveProfile(self, cameraId: str, resolution: tuple, calibrate = None, tolerance: float = 1.5):
+        """
+        Derives a calibration for a resolution from the stored calibration of another resolution, using ``scaleIntrinsics``.
+        The largest stored resolution with the same aspect ratio is preferred, since it needs no cropping.
+        If a ``Calibrate`` for the new resolution has calibration images, the derived intrinsics are checked against them,
+        and rejected if their reprojection error is more than ``tolerance`` times the stored error scaled to the new resolution, or ``MIN_ERROR`` if that is larger.
+
+        :param cameraId: The name of the camera, from ``getCameraId``.
+        :param resolution: The resolution to derive the calibration for (width, height).
+        :param calibrate: The ``Calibrate`` of the camera at the new resolution, or None to skip the check.
+        :param tolerance: How many times larger than the expected reprojection error the measured error may be.
+        :return: A calibration dictionary like ``load`` returns, with ``derivedFrom`` set to the stored resolution, or None if it could not be derived.
+        """
+        # Picks the stored resolution to derive from
+        candidates = [stored for stored in self.getResolutions(cameraId) if (stored != tuple(resolution))]
+        if (len(candidates) == 0):
+            return None
+        sameAspect = [stored for stored in candidates if (stored[0] * resolution[1] == stored[1] * resolution[0])]
+        source = (sameAspect + candidates)[0]
+        profile = self.load(cameraId, source)
+
+        # Scales the intrinsics and the error expected from them
+        scale = max(resolution[0] / source[0], resolution[1] / source[1])
+        derived = {
+            "camera_matrix":     scaleIntrinsics(profile["camera_matrix"], source, resolution),
+            "distortion":        profile["distortion"],
+            "reprojectionError": profile["reprojectionError"] * scale,
+            "resolution":        tuple(resolution),
+            "fingerprint":       None,
+            "derivedFrom":       source
+        }
+
+        # Checks the intrinsics against images taken at the new resolution
+        if (calibrate is not None):
+            measuredError = calibrate.evaluateIntrinsics(derived["camera_matrix"], derived["distortion"])
+            if (measuredError is not None):
+                maxError = max(tolerance * derived["reprojectionError"], CalibrationStore.MIN_ERROR)
+                if (measuredError > maxError):
+                    Logger.logWarning("Calibration of %s derived from %dx%d rejected, error %.3f px is over %.3f px", self.logStatus, cameraId, source[0], source[1], measuredError, maxError)
+                    return None
+                derived["reprojectionError"] = measuredError
+
+        # Updates log
+        Logger.logInfo("Calibration of %s at %dx%d derived from %dx%d", self.logStatus, cameraId, resolution[0], resolution[1], source[0], source[1])
+
+        return derived
+
     def enableLogging(self):
         """
         Enables logging for this class.
         """
-        self.logStatus = True
\ No newline at end of file
+        self.logStatus = True
@@ -1,10 +1,102 @@
 # Import Libraries
+import os
+import glob
+import time
 import cv2   as cv
 import numpy as np
+from   concurrent.futures import ThreadPoolExecutor
 from   frc_apriltags import Calibrate
+from   .calibration  import CalibrationStore, scaleIntrinsics
+from   .capture      import ThreadedCapture
+from   .recording    import FrameRecorder
 
 # Import Utilities
-from .Utilities import Logger
+from .Utilities import Logger, Profiler
+
+# The directory of the links udev creates for each video device from the port it is plugged into
+BY_PATH_PATH = "/dev/v4l/by-path/"
+
+def findCameras() -> list:
+    """
+    Finds the cameras plugged into the system through the links in ``/dev/v4l/by-id`` and ``/dev/v4l/by-path``.
+    Only the first video node of each device is listed, since the others carry metadata rather than frames.
+
+    :return: A list of dictionaries, one for each camera, holding its ``device`` node, its ``camNum``, and its ``byId`` and ``byPath`` links, which are None if the link does not exist.
+    """
+    cameras = {}
+    for key, directory in (("byId", CalibrationStore.BY_ID_PATH), ("byPath", BY_PATH_PATH)):
+        for link in sorted(glob.glob(directory + "*")):
+            # Skips the metadata nodes
+            if ((link.endswith("-index0") == False) and ("-index" in link)):
+                continue
+
+            # Groups the links of the same device
+            device = os.path.realpath(link)
+            if (device not in cameras):
+                number = device.replace("/dev/video", "")
+                cameras[device] = {"device": device, "camNum": int(number) if (number.isdigit() == True) else None, "byId": None, "byPath": None}
+            cameras[device][key] = link
+
+    return sorted(cameras.values(), key = lambda camera: camera["device"])
+
+def openCameras(cameras: dict, factory = None, workers: int = None):
+    """
+    Opens and configures several cameras at once, so startup takes as long as the slowest camera rather than the sum of every camera.
+    Opening a camera is mostly spent waiting on the driver, so the cameras are opened on threads.
+    Calibration can show windows and wait for key presses, which only works on one thread, so cameras created with ``calibrate = True`` are calibrated one after another once every camera is open.
+    If any camera fails to open, the cameras that did open are released and the error is raised.
+
+    :param cameras: A dictionary of camera name to the keyword arguments to create it with, such as ``{"front": {"path": ..., "resolution": (1280, 720)}}``.
+    :param factory: The class to create each camera with, such as ``Streaming``, or None for ``USBCamera``.
+    :param workers: The most cameras opened at once, or None to open every camera at once.
+    :return: A dictionary of camera name to the created camera.
+    :return: A dictionary of camera name to the time it took to create in seconds.
+    """
+    factory = factory if (factory is not None) else USBCamera
+
+    # Holds calibration back from the threads
+    calibrations = {name: args for name, args in cameras.items() if (args.get("calibrate", False) == True)}
+
+    def openCamera(name: str):
+        # Creates one camera, timing it
+        startTime = time.monotonic()
+        args = {key: value for key, value in cameras[name].items() if ((name not in calibrations) or (key not in ("calibrate", "recalibrate")))}
+        camera = factory(**args)
+        return camera, time.monotonic() - startTime
+
+    # Opens every camera at once, keeping the order they were given in
+    opened, error = {}, None
+    with ThreadPoolExecutor(max_workers = workers if (workers is not None) else max(len(cameras), 1), thread_name_prefix = "openCameras") as executor:
+        futures = {name: executor.submit(openCamera, name) for name in cameras}
+        for name, future in futures.items():
+            try:
+                opened[name] = future.result()
+            except Exception as e:
+                Logger.logError("Camera %s failed to open: %s", True, name, e)
+                error = e if (error is None) else error
+
+    # Releases the cameras that did open if any failed
+    if (error is not None):
+        for camera, initTime in opened.values():
+            if (hasattr(camera, "release") == True):
+                camera.release()
+        raise error
+
+    # Calibrates on this thread, one camera at a time
+    for name, args in calibrations.items():
+        camera, initTime = opened[name]
+        startTime = time.monotonic()
+        if ("dirPath" in args):
+            camera.calibrateCamera(args["dirPath"], args.get("recalibrate", False))
+        else:
+            camera.calibrateCamera(force = args.get("recalibrate", False))
+        opened[name] = (camera, initTime + time.monotonic() - startTime)
+
+    # Updates log
+    for name, (camera, initTime) in opened.items():
+        Logger.logInfo("Camera %s ready in %.2f seconds", True, name, initTime)
+
+    return {name: camera for name, (camera, initTime) in opened.items()}, {name: initTime for name, (camera, initTime) in opened.items()}
 
 # Creates the USBCamera class
 class USBCamera:
@@ -17,8 +109,10 @@ class USBCamera:
     :param fps: The desired fps for the camera.
     :param calibrate: Should the camera be calibrated this camera.
     :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+    :param threaded: Should frames be captured on a background thread.
+    :param recalibrate: Should the camera be calibrated even if a stored calibration matches its calibration images.
     """
-    def __init__(self, camNum: int = 0, path: str = None, resolution: tuple = (0, 0), fps: int = 30, calibrate: bool = False, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test") -> None:
+    def __init__(self, camNum: int = 0, path: str = None, resolution: tuple = (0, 0), fps: int = 30, calibrate: bool = False, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test", threaded: bool = False, recalibrate: bool = False) -> None:
         """
         Constructor for the USBCamera class.
 
@@ -28,14 +122,35 @@ class USBCamera:
         :param fps: The desired fps for the camera.
         :param calibrate: Should the camera be calibrated this camera.
         :param dirPath: Should be aquired by running ``Path(__file__).absolute().parent.__str__()`` in the script calling this method.
+        :param threaded: Should frames be captured on a background thread.
+        :param recalibrate: Should the camera be calibrated even if a stored calibration matches its calibration images.
         """
+        # Times the initialization
+        startTime = time.monotonic()
+
         # Set camera properties
         self.camNum     = camNum
         self.resolution = resolution
+        self.cameraId   = CalibrationStore.getCameraId(path, camNum)
 
         # Init variables
-        self.logStatus  = False
-        self.calibrate  = calibrate
+        self.logStatus     = False
+        self.calibrate     = calibrate
+        self.threaded      = threaded
+        self.capture       = None
+        self.captureTime   = 0.0
+        self.droppedFrames = 0
+        self.camMatrix     = None
+        self.camdistortion = None
+        self.recorder      = None
+
+        # The intrinsics at the resolution they were calibrated or derived at, so they can be rescaled when the camera is resized
+        self.calibratedMatrix     = None
+        self.calibratedResolution = None
+
+        # The undistortion maps of each resolution, so switching back to a resolution does not rebuild them
+        self.undistortMaps     = None
+        self.undistortMapCache = {}
 
         # Creates a capture
         if (path is not None):
@@ -48,12 +163,17 @@ class USBCamera:
         # Resizes the capture
         self.resize(resolution, fps)
 
+        # Starts the capture thread if told to do so
+        if (self.threaded == True):
+            self.capture = ThreadedCapture(self.cap, self.resolution).start()
+
         # Calibrates if told to do so
         if (self.calibrate == True):
-            self.calibrateCamera(dirPath)
+            self.calibrateCamera(dirPath, recalibrate)
 
         # Updates log
-        Logger.logInfo("USBCamera initialized for camera " + str(camNum), True)
+        self.initTime = time.monotonic() - startTime
+        Logger.logInfo("USBCamera initialized for camera %s in %.2f seconds", True, camNum, self.initTime)
 
     def resize(self, cameraRes: tuple, fps: int):
         """
@@ -64,6 +184,13 @@ class USBCamera:
         :param fps: The desired FPS for the camera.
         :return: The resized capture.
         """
+        # Pauses the capture thread while the capture is reconfigured
+        if (self.capture is not None):
+            self.capture.stop()
+
+        # Set the capture to be MJPG format first, since changing the format afterwards makes the driver negotiate the resolution and fps again
+        self.cap.set(cv.CAP_PROP_FOURCC, cv.VideoWriter_fourcc(*'MJPG'))
+
         # Set the values
         self.cap.set(cv.CAP_PROP_FRAME_WIDTH, cameraRes[0])
         self.cap.set(cv.CAP_PROP_FRAME_HEIGHT, cameraRes[1])
@@ -74,19 +201,29 @@ class USBCamera:
         self.height = int(self.cap.get(cv.CAP_PROP_FRAME_HEIGHT))
         self.fps    = int(self.cap.get(cv.CAP_PROP_FPS))
 
-        # Set the capture to be MJPG format
-        self.cap.set(cv.CAP_PROP_FOURCC, cv.VideoWriter_fourcc(*'MJPG'))
-
         # Prealocate space for stream
         self.stream = self.prealocateSpace()
 
-        # Prints telemetry
-        print("Resolution:", str(self.width) + "x" + str(self.height))
-        print("FPS:", self.fps)
+        # Updates log. Cameras are opened on several threads at once, so each camera logs one line
+        Logger.logInfo("Camera %s resolution: %dx%d, FPS: %d", self.logStatus, self.camNum, self.width, self.height, self.fps)
 
         # Sets the resolution to the true value
         self.resolution = (self.width, self.height)
 
+        # Rescales the intrinsics to the new resolution
+        if (self.calibratedMatrix is not None):
+            self.camMatrix = scaleIntrinsics(self.calibratedMatrix, self.calibratedResolution, self.resolution)
+
+        # Reuses the undistortion maps of the new resolution if they were already built
+        self.undistortMaps = self.undistortMapCache.get(self.resolution)
+        if (self.undistortMaps is not None):
+            self.undistortedBuffer = self.prealocateSpace()
+
+        # Resumes the capture thread
+        if (self.capture is not None):
+            self.capture.resolution = self.resolution
+            self.capture.start()
+
         # Updates log
         Logger.logInfo("Capture resized", self.logStatus)
 
@@ -98,46 +235,186 @@ class USBCamera:
         """
         return np.zeros(shape = (self.resolution[1], self.resolution[0], 3), dtype = np.uint8)
 
-    def calibrateCamera(self, dirPath: str):
+    def calibrateCamera(self, dirPath: str = "/home/robolions/Documents/2023-Jetson-Code-Test", force: bool = False):
         """
-        Calibrates the camera and gets the calibration parameters.
+        Gets the calibration parameters of the camera.
+        A stored calibration is used if it was made from the current calibration images, otherwise the camera is calibrated and the result is stored.
 
         :param dirPath: The path of the directory calling this function.
+        :param force: Should the camera be calibrated even if a stored calibration matches its calibration images.
         """
-        # Instance creation
-        self.calibrate = Calibrate(self.cap, self.camNum, 15, dirPath)
+        # Instance creation. The calibration preview shares the capture thread when one is running
+        if (self.capture is not None):
+            self.calibrate = Calibrate(self.capture, self.camNum, 15, dirPath, cameraId = self.cameraId)
+        else:
+            self.calibrate = Calibrate(self.cap, self.camNum, 15, dirPath, cameraId = self.cameraId)
+
+        # Loads the stored calibration. It is still used if its images were removed, so calibrations can be copied between coprocessors on their own
+        store = CalibrationStore(dirPath)
+        store.logStatus = self.logStatus
+        profile     = store.load(self.cameraId, self.resolution)
+        fingerprint = self.calibrate.getFingerprint()
+        usable      = (profile is not None) and ((fingerprint is None) or (fingerprint == profile["fingerprint"]))
+
+        # Derives the calibration from another resolution when this resolution was never calibrated. Any images at this resolution are used to check it
+        if ((force == False) and (profile is None)):
+            profile = store.deriveProfile(self.cameraId, self.resolution, self.calibrate)
+            usable  = (profile is not None)
+
+        if ((force == False) and (usable == True)):
+            # Uses the stored calibration
+            self.camMatrix, self.camdistortion = profile["camera_matrix"], profile["distortion"]
+        else:
+            # Get results
+            ret, self.camMatrix, self.camdistortion, rvecs, tvecs = self.calibrate.calibrateCamera()
+
+            # Stores the calibration so the next startup can skip it
+            store.save(self.cameraId, self.resolution, self.camMatrix, self.camdistortion, self.calibrate.getReprojectionError(), self.calibrate.getFingerprint())
+
+        # Keeps the intrinsics at this resolution so they can be rescaled by resize
+        self.calibratedMatrix     = self.camMatrix
+        self.calibratedResolution = self.resolution
 
-        # Get results
-        ret, self.camMatrix, self.camdistortion, rvecs, tvecs = self.calibrate.calibrateCamera()
+        # The undistortion maps no longer match the intrinsics
+        self.undistortMaps     = None
+        self.undistortMapCache = {}
 
     def getStream(self):
         """
         Gets the stream from this camera's capture.
 
-        :return: The stream.
+        :return: The stream, or None if the read failed.
         """
+        # Starts timing the read
+        readStart = Profiler.now()
+
         # Reads the capture
-        __, self.stream = self.cap.read()
+        if (self.capture is not None):
+            # Takes the newest frame from the capture thread
+            self.stream, self.captureTime, self.droppedFrames = self.capture.readLatest()
+        else:
+            __, self.stream = self.cap.read()
+            self.captureTime = time.monotonic()
+        Profiler.record("camera.read", readStart)
+
+        # Tees the raw frame into the recording
+        if (self.recorder is not None):
+            self.recorder.writeFrame(self.stream, self.captureTime)
 
         return self.stream
 
-    def getUndistortedStream(self):
+    def grab(self) -> bool:
         """
-        Gets the undistorted stream from this camera's capture.
+        Grabs the next frame without decoding it, so several cameras can be grabbed back to back and decoded afterwards with ``retrieve``.
+        A threaded camera is always grabbing, so its newest frame is taken by ``retrieve`` instead.
+
+        :return: Was a frame grabbed?
+        """
+        if (self.capture is not None):
+            return True
+
+        grabbed = self.cap.grab()
+        self.captureTime = time.monotonic()
+
+        return grabbed
+
+    def retrieve(self):
+        """
+        Decodes the frame taken by ``grab``.
+
+        :return: The stream, or None if no frame could be decoded.
+        """
+        # Starts timing the decode
+        retrieveStart = Profiler.now()
+
+        # Decodes the grabbed frame
+        if (self.capture is not None):
+            self.stream, self.captureTime, self.droppedFrames = self.capture.readLatest()
+        else:
+            __, self.stream = self.cap.retrieve()
+        Profiler.record("camera.retrieve", retrieveStart)
+
+        # Tees the raw frame into the recording
+        if (self.recorder is not None):
+            self.recorder.writeFrame(self.stream, self.captureTime)
+
+        return self.stream
+
+    def getCaptureTime(self) -> float:
+        """
+        Gets the time the last stream was captured.
+
+        :return: The capture time in seconds, from ``time.monotonic()``.
+        """
+        return self.captureTime
+
+    def getInitTime(self) -> float:
+        """
+        Gets how long the camera took to open, configure and calibrate.
+
+        :return: The initialization time in seconds.
+        """
+        return self.initTime
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of frames the capture thread grabbed that were never read.
+        This is always 0 when the camera is not threaded.
 
-        :return: The undistorted stream.
+        :return: The number of dropped frames.
+        """
+        return self.droppedFrames
+
+    def createUndistortMaps(self):
+        """
+        Creates the undistortion maps for the current intrinsics and resolution.
+        The maps are stored in fixed-point form so ``cv.remap`` can use them without recomputing the distortion model.
         """
         # Creates a cameraMatrix
         newCameraMatrix, roi = cv.getOptimalNewCameraMatrix(self.camMatrix, self.camdistortion, self.resolution, 1, self.resolution)
 
-        # Undistorts the image
-        undistortedStream = cv.undistort(self.getStream(), self.camMatrix, self.camdistortion, None, newCameraMatrix)
+        # Creates the fixed-point undistortion maps
+        map1, map2 = cv.initUndistortRectifyMap(self.camMatrix, self.camdistortion, None, newCameraMatrix, self.resolution, cv.CV_16SC2)
+
+        # Moves the principal point into the cropped image
+        x, y, w, h = roi
+        croppedMatrix = newCameraMatrix.copy()
+        croppedMatrix[0, 2] -= x
+        croppedMatrix[1, 2] -= y
+
+        # Stores the maps and preallocates the undistorted stream
+        self.undistortMaps     = (map1, map2, roi, croppedMatrix)
+        self.undistortedBuffer = self.prealocateSpace()
+        self.undistortMapCache[self.resolution] = self.undistortMaps
+
+        # Updates log
+        Logger.logInfo("Undistortion maps created", self.logStatus)
+
+    def getUndistortedStream(self):
+        """
+        Gets the undistorted stream from this camera's capture.
+
+        :return: The undistorted and cropped stream, or None if the read failed.
+        :return: The intrinsic camera matrix of the undistorted stream.
+        """
+        # Creates the undistortion maps if they do not match the intrinsics or resolution
+        if (self.undistortMaps is None):
+            self.createUndistortMaps()
+        map1, map2, roi, croppedMatrix = self.undistortMaps
+
+        # Undistorts the image into the preallocated buffer, unless the read failed
+        stream = self.getStream()
+        if (stream is None):
+            return None, croppedMatrix
+        remapStart = Profiler.now()
+        cv.remap(stream, map1, map2, cv.INTER_LINEAR, dst = self.undistortedBuffer)
+        Profiler.record("camera.undistort", remapStart)
 
         # Crops the image
         x, y, w, h = roi
-        self.undistortedStream = undistortedStream[y:y+h, x:x+w]
+        self.undistortedStream = self.undistortedBuffer[y:y+h, x:x+w]
 
-        return self.stream
+        return self.undistortedStream, croppedMatrix
 
     def getEnd(self):
         """
@@ -148,11 +425,24 @@ class USBCamera:
         if (cv.waitKey(1) == ord("q")):
             print("Process Ended by User")
             cv.destroyAllWindows()
-            self.cap.release()
+            self.release()
             return True
         else:
             return False
 
+    def release(self):
+        """
+        Stops recording and the capture thread, and releases the camera.
+        """
+        self.disableRecording()
+        if (self.capture is not None):
+            self.capture.release()
+        else:
+            self.cap.release()
+
+        # Updates log
+        Logger.logInfo("Camera %s released", self.logStatus, self.camNum)
+
     def getMatrix(self):
         """
         Gets the intrinsic camera matrix.
@@ -176,15 +466,31 @@ class USBCamera:
         :param streamType: 0 for normal stream, 1 for undistorted stream.
         """
         # Gets the desired stream
-        if (self.calibrate == True):
-            if (streamType == 1):
-                self.getUndistortedStream()
-            else:
-                self.getStream()
+        if ((self.calibrate != False) and (streamType == 1)):
+            stream, newCameraMatrix = self.getUndistortedStream()
         else:
-            self.getStream()
+            stream = self.getStream()
+
+        cv.imshow("Stream " + str(self.camNum), cv.flip(stream, 1))
+
+    def enableRecording(self, path: str, jpegQuality: int = None, queueSize: int = 30):
+        """
+        Records every frame read from this camera, along with its calibration, so it can be replayed with ``FrameReplay``.
+        Frames are written on a background thread so the disk never stalls reads. If it falls behind, frames are dropped from the recording.
+
+        :param path: The directory to record into.
+        :param jpegQuality: The JPEG quality to store frames with, or None to store raw frames.
+        :param queueSize: The number of frames that can wait to be written, or None to write them on the reading thread.
+        """
+        self.recorder = FrameRecorder(path, self.camMatrix, self.camdistortion, jpegQuality, queueSize)
 
-        cv.imshow("Stream " + str(self.camNum), cv.flip(self.stream, 1))
+    def disableRecording(self):
+        """
+        Stops recording and closes the recording.
+        """
+        if (self.recorder is not None):
+            self.recorder.close()
+            self.recorder = None
 
     def enableLogging(self):
         """
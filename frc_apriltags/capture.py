@@ -0,0 +1,243 @@
+# Import Libraries
+import time
+import threading
+import numpy as np
+
+# Import Utilities
+from .Utilities import Logger
+
+# Creates the ThreadedCapture class
+class ThreadedCapture:
+    """
+    Use this class to read a ``cv2.VideoCapture`` on a background thread.
+    Frames are grabbed continuously into a triple buffer and only the newest frame is handed to the consumer.
+
+    :param cap: The ``cv2.VideoCapture`` object.
+    :param resolution: The resolution of the capture (width, height).
+    """
+    def __init__(self, cap, resolution: tuple = (0, 0)) -> None:
+        """
+        Constructor for the ThreadedCapture class.
+
+        :param cap: The ``cv2.VideoCapture`` object.
+        :param resolution: The resolution of the capture (width, height).
+        """
+        # Localizes parameters
+        self.cap        = cap
+        self.resolution = resolution
+
+        # Creates the triple buffer. The consumer owns front, the capture thread owns back, and ready holds the newest frame
+        self.buffers    = [self.prealocateSpace() for i in range(3)]
+        self.timestamps = [0.0, 0.0, 0.0]
+        self.front      = 0
+        self.ready      = 1
+        self.back       = 2
+
+        # Frame bookkeeping
+        self.newFrame      = False
+        self.success       = False
+        self.frameCount    = 0
+        self.droppedFrames = 0
+
+        # Thread variables
+        self.condition = threading.Condition()
+        self.running   = False
+        self.thread    = None
+
+        # Variables
+        self.logStatus = False
+
+    def prealocateSpace(self):
+        """
+        Prealocates space for a frame.
+
+        :return: An array of zeros with the same resolution as the capture.
+        """
+        return np.zeros(shape = (self.resolution[1], self.resolution[0], 3), dtype = np.uint8)
+
+    def start(self):
+        """
+        Starts the capture thread.
+
+        :return: This ``ThreadedCapture``.
+        """
+        # Does nothing if the thread is already running
+        if (self.running == True):
+            return self
+
+        # Starts the thread
+        self.running = True
+        self.thread  = threading.Thread(target = self.update, name = "ThreadedCapture", daemon = True)
+        self.thread.start()
+
+        # Updates log
+        Logger.logInfo("Capture thread started", self.logStatus)
+
+        return self
+
+    def stop(self):
+        """
+        Stops the capture thread and waits for it to finish.
+        """
+        # Signals the thread to stop
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+        # Waits for the thread to finish
+        if (self.thread is not None):
+            self.thread.join()
+            self.thread = None
+
+        # Updates log
+        Logger.logInfo("Capture thread stopped", self.logStatus)
+
+    def update(self):
+        """
+        Continuously grabs frames into the back buffer and publishes them as the newest frame.
+        This method runs on the capture thread.
+        """
+        while (self.running == True):
+            # Grabs the frame and records when it arrived
+            grabbed   = self.cap.grab()
+            timestamp = time.monotonic()
+
+            # Decodes into the back buffer
+            if (grabbed == True):
+                grabbed, frame = self.cap.retrieve(self.buffers[self.back])
+
+            # Waits and retries if no frame could be read
+            if (grabbed == False):
+                with self.condition:
+                    self.success = False
+                    self.condition.notify_all()
+                time.sleep(0.01)
+                continue
+
+            # Publishes the back buffer as the newest frame
+            with self.condition:
+                self.buffers[self.back]    = frame
+                self.timestamps[self.back] = timestamp
+                self.back, self.ready      = self.ready, self.back
+
+                # The previous newest frame was never read
+                if (self.newFrame == True):
+                    self.droppedFrames += 1
+
+                self.newFrame    = True
+                self.success     = True
+                self.frameCount += 1
+                self.condition.notify_all()
+
+    def readLatest(self, timeout: float = 1.0):
+        """
+        Gets the newest frame, waiting for one if the last frame has already been read.
+        The returned frame stays valid until the next call to this method.
+
+        :param timeout: The maximum time to wait for a new frame in seconds.
+        :return: The newest frame, or None if no new frame arrived within the timeout.
+        :return: The time the frame was captured, from ``time.monotonic()``.
+        :return: The number of frames dropped since the capture started.
+        """
+        with self.condition:
+            # Waits for a frame that has not been read yet
+            if (self.newFrame == False):
+                self.condition.wait_for(lambda: (self.newFrame == True) or (self.running == False), timeout)
+
+            # Never hands back a frame that was already read
+            if (self.newFrame == False):
+                return None, self.timestamps[self.front], self.droppedFrames
+
+            # Takes ownership of the newest frame
+            self.front, self.ready = self.ready, self.front
+            self.newFrame = False
+
+            return self.buffers[self.front], self.timestamps[self.front], self.droppedFrames
+
+    def read(self):
+        """
+        Reads the newest frame. Mirrors ``cv2.VideoCapture.read()`` so this class can stand in for a capture.
+
+        :return: If a new frame was read.
+        :return: The frame, or None if no new frame arrived.
+        """
+        frame, timestamp, droppedFrames = self.readLatest()
+
+        return (frame is not None), frame
+
+    def get(self, propId: int):
+        """
+        Gets a property of the underlying capture.
+
+        :param propId: The OpenCV property id.
+        :return: The property value.
+        """
+        return self.cap.get(propId)
+
+    def set(self, propId: int, value):
+        """
+        Sets a property of the underlying capture.
+        The capture thread is paused while the property is changed.
+
+        :param propId: The OpenCV property id.
+        :param value: The new property value.
+        :return: If the property was set.
+        """
+        # Pauses the thread
+        wasRunning = self.running
+        if (wasRunning == True):
+            self.stop()
+
+        # Sets the property
+        ret = self.cap.set(propId, value)
+
+        # Resumes the thread
+        if (wasRunning == True):
+            self.start()
+
+        return ret
+
+    def isOpened(self) -> bool:
+        """
+        Gets if the underlying capture is open.
+
+        :return: Is the capture open?
+        """
+        return self.cap.isOpened()
+
+    def release(self):
+        """
+        Stops the capture thread and releases the underlying capture.
+        """
+        self.stop()
+        self.cap.release()
+
+    def getTimestamp(self) -> float:
+        """
+        Gets the capture time of the last frame returned to the consumer.
+
+        :return: The capture time in seconds, from ``time.monotonic()``.
+        """
+        return self.timestamps[self.front]
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of frames that were captured but never read.
+
+        :return: The number of dropped frames.
+        """
+        return self.droppedFrames
+
+    def getFrameCount(self) -> int:
+        """
+        Gets the number of frames captured since the thread started.
+
+        :return: The number of captured frames.
+        """
+        return self.frameCount
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
@@ -1,84 +1,353 @@
 # Import Libraries
-from networktables import *
+import time
+import ntcore
+import wpiutil
 
 # Import Utilities
-from .Utilities import Logger
+from .Utilities import Logger, Profiler
+from .results   import TagResult
+
+def getNetworkClock():
+    """
+    Finds the clock NetworkTables timestamps its values with, which is ``nt::Now()``.
+    pyntcore has no public binding of it yet, so a public binding is preferred if one exists, then ``ntcore._now``.
+
+    :return: A function returning the NetworkTables time in microseconds, or None if no clock was found.
+    """
+    for module, name in ((ntcore, "now"), (wpiutil, "Now"), (ntcore, "_now")):
+        clock = getattr(module, name, None)
+        if (callable(clock) == True):
+            return clock
+
+    return None
+
+# The NetworkTables clock, found once
+networkClock = getNetworkClock()
 
 # Creates the NetworkCommunications Class
 class NetworkCommunications:
     """
     Use this class to communicate with the RoboRio over NetworkTables.
+    Values are sent through NT4 typed publishers, and every detection cycle is sent as one timestamped frame packet.
+    Each camera of a robot with several cameras should publish to its own table, such as ``TagInfo/Front``, so they do not overwrite each other.
+
+    :param tableName: The NetworkTables table to publish to.
     """
-    def __init__(self) -> None:
+    # The number of values sent for each tag in a frame packet
+    TAG_FIELDS = 8
+
+    def __init__(self, tableName: str = "TagInfo") -> None:
         """
         Constructor for the NetworkCommunications class.
+
+        :param tableName: The NetworkTables table to publish to.
         """
+        # Localizes parameters
+        self.tableName = tableName
+
         # Variables
-        self.logStatus = False
+        self.logStatus   = False
+        self.frameNumber = 0
+
+        # Gets the NT4 instance started by startNetworkComms
+        self.ntInstance = ntcore.NetworkTableInstance.getDefault()
+
+        # Create a TagInfo Table and its Publishers
+        TagInfo            = self.ntInstance.getTable(tableName)
+        self.targetValid   = TagInfo.getBooleanTopic("tv").publish()                # Boolean
+        self.bestResult    = TagInfo.getDoubleArrayTopic("BestResult").publish()    # Double[]
+        self.bestResultId  = TagInfo.getDoubleTopic("BestResultId").publish()       # Double
+        self.detectionTime = TagInfo.getDoubleTopic("DetectionTime").publish()      # Double
 
-        # Create a TagInfo Table and its Entries
-        TagInfo            = NetworkTables.getTable("TagInfo")
-        self.targetValid   = TagInfo.getEntry("tv")            # Boolean
-        self.bestResult    = TagInfo.getEntry("BestResult")    # Double[]
-        self.bestResultId  = TagInfo.getEntry("BestResultId")  # Double
-        self.detectionTime = TagInfo.getEntry("DetectionTime") # Double
+        # Create a RobotPose Publisher
+        self.robotPose = TagInfo.getDoubleArrayTopic("RobotPose").publish() # Double[]
+
+        # Create a DetectorSettings Publisher
+        self.detectorSettings = TagInfo.getDoubleArrayTopic("DetectorSettings").publish() # Double[]
+
+        # Create a Frame Publisher. Every update is kept so no frame is merged with the next one
+        self.frame = TagInfo.getDoubleArrayTopic("Frame").publish(ntcore.PubSubOptions(sendAll = True, keepDuplicates = True)) # Double[]
+
+        # Create a CameraStatus Publisher
+        self.cameraStatus = TagInfo.getDoubleArrayTopic("CameraStatus").publish() # Double[]
 
         # Updates log
-        Logger.logInfo("NetworkCommunications initialized", True)
+        Logger.logInfo("NetworkCommunications initialized on %s", True, tableName)
+        if (networkClock is None):
+            Logger.logWarning("NetworkTables clock not found, values are timestamped when they are sent", True)
 
-    def setBestResultId(self, id: int):
+    def getNetworkTime(self, captureTime: float) -> int:
+        """
+        Converts a capture time into the NetworkTables time base.
+
+        :param captureTime: The time the frame was captured, from ``time.monotonic()``.
+        :return: The matching NetworkTables time in microseconds, or 0 to publish at the current time if the NetworkTables clock could not be found.
+        """
+        if (networkClock is None):
+            return 0
+
+        return int(networkClock() - (time.monotonic() - captureTime) * 1e6)
+
+    def setBestResultId(self, id: int, timestamp: int = 0):
         """
         Sets the tag id of the best result.
 
         :param id: The AprilTag's id.
+        :param timestamp: The NetworkTables time of the value in microseconds, or 0 for the current time.
         """
-        self.bestResultId.setDouble(id)
+        self.bestResultId.set(id, timestamp)
 
-    def setBestResult(self, result):
+    def setBestResult(self, result, timestamp: int = 0):
         """
         Sends the best result over NetworkTables.
         This method will send [tagId, xTranslate, yTranslate, zTranslate, yaw, pitch, roll].
         All translation data is in meters. All rotation data is in radians.
 
         :param result: The result generated by the Detector class.
+        :param timestamp: The NetworkTables time of the value in microseconds, or 0 for the current time.
         """
         # Gets variables from result
         tagId = result[0]
-        pose  = result[1]
 
         # Sets the tag value
-        self.setBestResultId(tagId)
+        self.setBestResultId(tagId, timestamp)
+
+        if (isinstance(result, TagResult) == True):
+            # Uses the translation and rotation directly so no Pose3d is built
+            x, y, z = result.translation
+            roll, pitch, yaw = result.rotation
+        else:
+            pose = result[1]
+
+            # Extracts the x, y, and z translations relative to the field's WCS
+            x, y, z = pose.X(), pose.Y(), pose.Z()
+
+            # Extracts the tag's roll, yaw, and pitch relative to the field's WCS
+            roll, pitch, yaw = pose.rotation().X(), pose.rotation().Y(), pose.rotation().Z()
+
+        # Packs all the data
+        data = [tagId, x, y, z, roll, pitch, yaw]
 
-        # Extracts the x, y, and z translations relative to the field's WCS
-        x, y, z = pose.X(), pose.Y(), pose.Z()
+        # Sends the data
+        self.bestResult.set(data, timestamp)
 
-        # Extracts the tag's roll, yaw, and pitch relative to the field's WCS
-        roll, pitch, yaw = pose.rotation().X(), pose.rotation().Y(), pose.rotation().Z()
+    def setRobotPose(self, pose, tagsUsed: int, reprojectionError: float, timestamp: int = 0):
+        """
+        Sends the robot pose solved from every tag over NetworkTables.
+        This method will send [xTranslate, yTranslate, zTranslate, roll, pitch, yaw, tagsUsed, reprojectionError].
+        All translation data is in meters. All rotation data is in radians. The reprojection error is in pixels.
 
+        :param pose: The robot's field relative ``Pose3d``.
+        :param tagsUsed: The number of tags used to solve the pose.
+        :param reprojectionError: The RMS reprojection error of the solve.
+        :param timestamp: The NetworkTables time of the value in microseconds, or 0 for the current time.
+        """
         # Packs all the data
-        data = (tagId, x, y, z, roll, pitch, yaw)
+        rotation = pose.rotation()
+        data = [pose.X(), pose.Y(), pose.Z(), rotation.X(), rotation.Y(), rotation.Z(), tagsUsed, reprojectionError]
 
         # Sends the data
-        self.bestResult.setDoubleArray(data)
+        self.robotPose.set(data, timestamp)
 
-    def setTargetValid(self, tv: bool):
+    def setTargetValid(self, tv: bool, timestamp: int = 0):
         """
         Sets if a valid target was detected.
 
         :param tv: Is the target valid?
+        :param timestamp: The NetworkTables time of the value in microseconds, or 0 for the current time.
         """
-        self.targetValid.setBoolean(tv)
+        self.targetValid.set(tv, timestamp)
 
-    def setDetectionTimeSec(self, timeSec: float):
+    def setDetectionTimeSec(self, timeSec: float, timestamp: int = 0):
         """
         Sets the time when a detection was made.
 
         :param timeSec: The current time in seconds.
+        :param timestamp: The NetworkTables time of the value in microseconds, or 0 for the current time.
+        """
+        self.detectionTime.set(timeSec, timestamp)
+
+    def setDetectorSettings(self, latency: float, settings: dict):
+        """
+        Sends the detector's measured latency and active settings over NetworkTables.
+        This method will send [latency, quadDecimate, quadSigma, refineEdges, nthreads].
+
+        :param latency: The smoothed detection time in seconds.
+        :param settings: The settings returned by ``DetectionGovernor.getSettings()``.
+        """
+        # Packs all the data
+        data = [latency, settings["quad_decimate"], settings["quad_sigma"], settings["refine_edges"], settings["nthreads"]]
+
+        # Sends the data
+        self.detectorSettings.set(data)
+
+    def setCameraStatus(self, latency: float, tagCount: int, grabOffset: float, connected: bool = True):
+        """
+        Sends the diagnostics of one camera of a ``MultiCameraDetector`` over NetworkTables.
+        This method will send [latency, tagCount, grabOffset, connected].
+
+        :param latency: The time the camera's frame took to decode and detect in seconds.
+        :param tagCount: The number of tags the camera saw.
+        :param grabOffset: How long after the first camera of the cycle this camera was grabbed in seconds.
+        :param connected: Did the camera return a frame this cycle? Sent as 1 or 0.
+        """
+        self.cameraStatus.set([latency, tagCount, grabOffset, float(connected)])
+
+    def packFrame(self, results, captureTime: float, latency: float, age: float = 0.0) -> list:
+        """
+        Packs every tag in a frame into one array.
+        The array is [frameNumber, captureTime, latency, numTags, age] followed by [tagId, x, y, z, roll, pitch, yaw, decisionMargin] for each tag.
+        All translation data is in meters. All rotation data is in radians. Times are in seconds.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :param captureTime: The time the frame was captured in seconds.
+        :param latency: The time from capture to publishing in seconds.
+        :param age: How long before the frame the results were detected in seconds, which is 0 unless a ``FrameGate`` reused them.
+        :return: The packed frame.
+        """
+        # Packs the header
+        data = [self.frameNumber, captureTime, latency, len(results), age]
+
+        # Packs each tag
+        for result in results:
+            data.append(result.id)
+            data.extend(result.translation)
+            data.extend(result.rotation)
+            data.append(result.getDecisionMargin())
+
+        return data
+
+    def publishFrame(self, results, best = None, captureTime: float = None, age: float = 0.0):
+        """
+        Sends every result of a detection cycle over NetworkTables at once.
+        All values share the capture time as their timestamp, so the RoboRio can compensate for the camera's latency.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :param best: The result with the best decision margin, or None if no tag was seen.
+        :param captureTime: The time the frame was captured, from ``time.monotonic()``, or None to use the current time.
+        :param age: How long before the frame the results were detected in seconds, which is 0 unless a ``FrameGate`` reused them.
+        """
+        # Starts timing the publish
+        publishStart = Profiler.now()
+
+        # Gets the capture time in both time bases
+        now = time.monotonic()
+        if (captureTime is None):
+            captureTime = now
+        timestamp = self.getNetworkTime(captureTime)
+
+        # Sends the frame packet
+        self.frame.set(self.packFrame(results, timestamp / 1e6, now - captureTime, age), timestamp)
+
+        # Keeps the single value topics up to date
+        if (best is not None):
+            self.setBestResult(best, timestamp)
+            self.setDetectionTimeSec(timestamp / 1e6, timestamp)
+        self.setTargetValid(len(results) > 0, timestamp)
+
+        # Sends the frame now instead of on the next periodic update
+        self.ntInstance.flush()
+        self.frameNumber += 1
+        Profiler.record("comms.publish", publishStart)
+
+        # Updates log
+        Logger.logDebug("Published frame %d with %d tags", self.logStatus, self.frameNumber, len(results))
+
+    def getFrameNumber(self) -> int:
+        """
+        Gets how many frames have been published.
+
+        :return: The number of frames.
+        """
+        return self.frameNumber
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
+
+# Creates the NullCommunications Class
+class NullCommunications:
+    """
+    Use this class in place of ``NetworkCommunications`` when nothing should be published, such as in the worker processes of ``DetectorPool``.
+    It has the same methods, but never starts a NetworkTables client.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor for the NullCommunications class.
+        """
+        # Variables
+        self.frameNumber = 0
+        self.logStatus   = False
+
+    def getNetworkTime(self, captureTime: float) -> int:
+        """
+        Gets the NetworkTables time of a capture time, which is always the current time since nothing is sent.
+
+        :param captureTime: The time the frame was captured, from ``time.monotonic()``.
+        :return: 0, to publish at the current time.
+        """
+        return 0
+
+    def setBestResultId(self, id: int, timestamp: int = 0):
+        """
+        Discards the id of the best result.
+        """
+        pass
+
+    def setBestResult(self, result, timestamp: int = 0):
+        """
+        Discards the best result.
+        """
+        pass
+
+    def setRobotPose(self, pose, tagsUsed: int, reprojectionError: float, timestamp: int = 0):
+        """
+        Discards the robot's pose.
+        """
+        pass
+
+    def setTargetValid(self, tv: bool, timestamp: int = 0):
+        """
+        Discards if a target was found.
+        """
+        pass
+
+    def setDetectionTimeSec(self, timeSec: float, timestamp: int = 0):
+        """
+        Discards the detection time.
+        """
+        pass
+
+    def setDetectorSettings(self, latency: float, settings: dict):
+        """
+        Discards the detector's settings.
+        """
+        pass
+
+    def setCameraStatus(self, latency: float, tagCount: int, grabOffset: float, connected: bool = True):
+        """
+        Discards a camera's diagnostics.
+        """
+        pass
+
+    def publishFrame(self, results, best = None, captureTime: float = None, age: float = 0.0):
+        """
+        Discards a frame's results, counting it as published.
+        """
+        self.frameNumber += 1
+
+    def getFrameNumber(self) -> int:
+        """
+        Gets how many frames have been published.
+
+        :return: The number of frames.
         """
-        self.detectionTime.setDouble(timeSec)
+        return self.frameNumber
 
     def enableLogging(self):
         """
         Enables logging for this class.
         """
-        self.logStatus = True
\ No newline at end of file
+        self.logStatus = True
@@ -0,0 +1,279 @@
+# Import Libraries
+import cv2   as cv
+import numpy as np
+from   wpimath.geometry import *
+
+# Import Utilities
+from .Utilities import Logger, Units
+
+# Maps a vector in WPILib's camera frame (x forward, y left, z up) into OpenCV's camera frame (x right, y down, z forward)
+WPILIB_TO_OPENCV = np.array([
+    [0, -1,  0],
+    [0,  0, -1],
+    [1,  0,  0]
+], dtype = np.float64)
+
+def transformToMatrix(transform: Transform3d):
+    """
+    Converts a WPILib ``Transform3d`` into a 4x4 homogeneous matrix.
+
+    :param transform: The transform.
+    :return: The 4x4 matrix.
+    """
+    matrix = np.eye(4)
+    matrix[:3, :3] = transform.rotation().toMatrix()
+    matrix[:3, 3]  = (transform.X(), transform.Y(), transform.Z())
+
+    return matrix
+
+# Creates the PoseEstimator class
+class PoseEstimator:
+    """
+    Use this class to estimate a single field relative robot pose from every tag seen in a frame.
+    The corners of all tags are solved together with one ``cv.solvePnP`` call.
+
+    :param layout: The ``AprilTagFieldLayout`` of the field.
+    :param size: The size of the AprilTag in inches.
+    :param robotToCamera: The ``Transform3d`` from the robot's center to the camera.
+    """
+    def __init__(self, layout, size: int = 6, robotToCamera: Transform3d = Transform3d()) -> None:
+        """
+        Constructor for the PoseEstimator class.
+
+        :param layout: The ``AprilTagFieldLayout`` of the field.
+        :param size: The size of the AprilTag in inches.
+        :param robotToCamera: The ``Transform3d`` from the robot's center to the camera.
+        """
+        # Localizes parameters
+        self.layout        = layout
+        self.tagSize       = Units.inchesToMeters(size)
+        self.robotToCamera = robotToCamera
+
+        # Field relative corners of each tag, created the first time the tag is seen
+        self.fieldCorners = {}
+
+        # Variables
+        self.reprojectionError = 0.0
+        self.tagsUsed          = 0
+        self.logStatus         = False
+
+    def getFieldCorners(self, id: int):
+        """
+        Gets the field relative corners of a tag, in the order ``pupil_apriltags`` reports them.
+
+        :param id: The id of the AprilTag.
+        :return: A (4, 3) array of corners in meters, or None if the tag is not on the field.
+        """
+        if (id not in self.fieldCorners):
+            # Tags that are not part of the layout have no pose
+            if ((id < 0) or (id >= len(self.layout.getTags()))):
+                return None
+            tagPose = self.layout.getTagPose(id)
+            if (tagPose == Pose3d()):
+                return None
+
+            # The tag's x axis points out of its face, so a viewer's right is +y and up is +z.
+            # pupil_apriltags reports the corners bottom-left, bottom-right, top-right, top-left
+            half = self.tagSize / 2
+            corners = []
+            for y, z in ((-half, -half), (half, -half), (half, half), (-half, half)):
+                corner = tagPose.transformBy(Transform3d(Translation3d(0, y, z), Rotation3d()))
+                corners.append((corner.X(), corner.Y(), corner.Z()))
+
+            self.fieldCorners[id] = np.array(corners)
+
+        return self.fieldCorners[id]
+
+    def getCorrespondences(self, results):
+        """
+        Pairs the field corners of every tag in the layout with its corners in the image.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :return: An (N, 3) array of field corners in meters.
+        :return: An (N, 2) array of the matching image corners in pixels.
+        """
+        objectPoints = []
+        imagePoints  = []
+        for result in results:
+            fieldCorners = self.getFieldCorners(result.id)
+            if ((fieldCorners is not None) and (result.detection is not None)):
+                objectPoints.append(fieldCorners)
+                imagePoints.append(result.detection.corners)
+
+        if (len(objectPoints) == 0):
+            return np.zeros((0, 3)), np.zeros((0, 2))
+
+        return np.concatenate(objectPoints), np.concatenate(imagePoints).astype(np.float64)
+
+    def estimateCameraPose(self, results, camera_matrix, distortion = None):
+        """
+        Estimates the field relative pose of the camera from every tag in a frame.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients if the corners are distorted.
+        :return: The camera's ``Pose3d``, or None if no tag in the layout was seen.
+        """
+        # Pairs the field corners of each known tag with its image corners
+        objectPoints, imagePoints = self.getCorrespondences(results)
+
+        # Nothing to solve
+        self.tagsUsed = len(objectPoints) // 4
+        if (self.tagsUsed == 0):
+            return None
+
+        # Solves every corner at once. The corners of a single tag are coplanar, so IPPE is used for them
+        if (self.tagsUsed == 1):
+            flags = cv.SOLVEPNP_IPPE
+        else:
+            flags = cv.SOLVEPNP_SQPNP
+        ret, rVecs, tVecs = cv.solvePnP(objectPoints, imagePoints, camera_matrix, distortion, flags = flags)
+        if (ret == False):
+            return None
+
+        # Calculates the reprojection error
+        projected, _ = cv.projectPoints(objectPoints, rVecs, tVecs, camera_matrix, distortion)
+        self.reprojectionError = float(np.sqrt(np.mean(np.sum((projected.reshape(-1, 2) - imagePoints) ** 2, axis = 1))))
+
+        # Inverts the field-to-camera transform and changes the camera axes to WPILib's convention
+        rMatrix, _ = cv.Rodrigues(rVecs)
+        cameraRotation    = rMatrix.T @ WPILIB_TO_OPENCV
+        cameraTranslation = (-rMatrix.T @ tVecs).ravel()
+
+        return Pose3d(Translation3d(cameraTranslation[0], cameraTranslation[1], cameraTranslation[2]), Rotation3d(cameraRotation))
+
+    def estimateRobotPose(self, results, camera_matrix, distortion = None):
+        """
+        Estimates the field relative pose of the robot from every tag in a frame.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients if the corners are distorted.
+        :return: The robot's ``Pose3d``, or None if no tag in the layout was seen.
+        """
+        cameraPose = self.estimateCameraPose(results, camera_matrix, distortion)
+        if (cameraPose is None):
+            return None
+
+        # Moves from the camera to the robot's center
+        robotPose = cameraPose.transformBy(self.robotToCamera.inverse())
+
+        # Updates log
+        Logger.logDebug("Robot pose from %d tags: %s", self.logStatus, self.tagsUsed, robotPose)
+
+        return robotPose
+
+    def estimateFusedRobotPose(self, observations):
+        """
+        Estimates one field relative robot pose from the tags seen by several cameras at once.
+        The camera that sees the most tags seeds the estimate, then the robot pose is refined so the corners seen by every camera reproject with the least total error.
+
+        :param observations: A list of (results, camera_matrix, distortion, robotToCamera) for each camera, where ``robotToCamera`` is that camera's ``Transform3d``.
+        :return: The robot's ``Pose3d``, or None if no tag in the layout was seen.
+        """
+        # Pairs the corners of each camera, keeping only cameras that saw a known tag
+        cameras = []
+        for results, camera_matrix, distortion, robotToCamera in observations:
+            objectPoints, imagePoints = self.getCorrespondences(results)
+            if (len(objectPoints) > 0):
+                cameras.append((objectPoints, imagePoints, camera_matrix, distortion, transformToMatrix(robotToCamera)))
+
+        # Nothing to solve
+        if (len(cameras) == 0):
+            self.tagsUsed = 0
+            return None
+
+        # Seeds the estimate with the camera that sees the most tags
+        results, camera_matrix, distortion, robotToCamera = max(observations, key = lambda observation: len(self.getCorrespondences(observation[0])[0]))
+        cameraPose = self.estimateCameraPose(results, camera_matrix, distortion)
+        if (cameraPose is None):
+            return None
+        robotPose = cameraPose.transformBy(robotToCamera.inverse())
+        if (len(cameras) == 1):
+            return robotPose
+
+        # Refines the robot's rotation vector and translation against every corner with Levenberg-Marquardt
+        rVec, __ = cv.Rodrigues(robotPose.rotation().toMatrix())
+        params   = np.concatenate([rVec.ravel(), [robotPose.X(), robotPose.Y(), robotPose.Z()]])
+        residual = self.getFusedResiduals(params, cameras)
+        cost     = residual @ residual
+        damping  = 1e-3
+        for i in range(20):
+            # Differentiates the residuals numerically, one parameter at a time
+            jacobian = np.empty((len(residual), 6))
+            for j in range(6):
+                step = np.zeros(6)
+                step[j] = 1e-6
+                jacobian[:, j] = (self.getFusedResiduals(params + step, cameras) - residual) / 1e-6
+
+            # Takes a damped Gauss-Newton step, backing off towards gradient descent when it does not help
+            hessian = jacobian.T @ jacobian
+            delta   = np.linalg.solve(hessian + damping * np.diag(np.diag(hessian) + 1e-9), -jacobian.T @ residual)
+            nextResidual = self.getFusedResiduals(params + delta, cameras)
+            nextCost     = nextResidual @ nextResidual
+            if (nextCost < cost):
+                params, residual, damping = params + delta, nextResidual, damping * 0.1
+                converged = (cost - nextCost) < 1e-10 * max(cost, 1e-12)
+                cost = nextCost
+                if (converged == True):
+                    break
+            else:
+                damping *= 10
+
+        # Stores the error of the fused solve
+        self.tagsUsed          = sum(len(camera[0]) // 4 for camera in cameras)
+        self.reprojectionError = float(np.sqrt(cost / (len(residual) // 2)))
+
+        rMatrix, __ = cv.Rodrigues(params[:3])
+        robotPose = Pose3d(Translation3d(params[3], params[4], params[5]), Rotation3d(rMatrix))
+
+        # Updates log
+        Logger.logDebug("Fused robot pose from %d tags on %d cameras: %s", self.logStatus, self.tagsUsed, len(cameras), robotPose)
+
+        return robotPose
+
+    def getFusedResiduals(self, params, cameras):
+        """
+        Gets the reprojection error of every corner for a robot pose.
+
+        :param params: The robot's field relative rotation vector and translation.
+        :param cameras: The corners, intrinsics and robot to camera matrix of each camera.
+        :return: The x and y error of every corner in pixels, as one flat array.
+        """
+        robotRotation, __ = cv.Rodrigues(params[:3])
+
+        residuals = []
+        for objectPoints, imagePoints, camera_matrix, distortion, robotToCamera in cameras:
+            # Moves the camera onto the robot, then changes its axes to OpenCV's convention
+            cameraRotation    = robotRotation @ robotToCamera[:3, :3]
+            cameraTranslation = robotRotation @ robotToCamera[:3, 3] + params[3:]
+            rMatrix = WPILIB_TO_OPENCV @ cameraRotation.T
+            tVec    = -rMatrix @ cameraTranslation
+
+            # Projects the field corners into the camera
+            projected, __ = cv.projectPoints(objectPoints, cv.Rodrigues(rMatrix)[0], tVec, camera_matrix, distortion)
+            residuals.append((projected.reshape(-1, 2) - imagePoints).ravel())
+
+        return np.concatenate(residuals)
+
+    def getReprojectionError(self) -> float:
+        """
+        Gets the RMS reprojection error of the last solve.
+
+        :return: The reprojection error in pixels.
+        """
+        return self.reprojectionError
+
+    def getTagsUsed(self) -> int:
+        """
+        Gets how many tags were used in the last solve.
+
+        :return: The number of tags.
+        """
+        return self.tagsUsed
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
@@ -0,0 +1,196 @@
+# Import Libraries
+import cv2   as cv
+import numpy as np
+
+# Import Utilities
+from .Utilities import Logger
+
+# Creates the FrameGate class
+class FrameGate:
+    """
+    Use this class to skip detection on frames that cannot give new results.
+    Each frame is shrunk to a small thumbnail, which is compared against the thumbnail of the last detected frame and scored for sharpness.
+    A frame where almost no pixel differs from the last detected frame is static, and a frame that is much less sharp than the sharpest recent frames is motion blurred.
+    Changed pixels are counted rather than averaged, so a small tag moving across a plain background still counts as a change.
+    Sharpness also falls when the camera turns from a busy scene to a plain one, so a frame is only blurred if its gradients also line up along one direction, the way motion smears them.
+
+    :param downscale: How many times smaller the thumbnail is than the frame on each side.
+    :param changeThreshold: The difference, in gray levels, a thumbnail pixel must exceed to count as changed.
+    :param changeFraction: The fraction of thumbnail pixels that must change for a frame not to be static.
+    :param blurRatio: A frame is blurred if its sharpness is below this fraction of the recent peak sharpness.
+    :param blurCoherence: A frame is only blurred if the coherence of its gradients, from 0 when they point every way to 1 when they all line up, is at least this.
+    :param maxSkipped: The most frames in a row that may be skipped, so results are never older than this.
+    """
+    # The decisions the gate can make
+    CHANGED = "changed"
+    STATIC  = "static"
+    BLURRED = "blurred"
+
+    def __init__(self, downscale: int = 8, changeThreshold: float = 6.0, changeFraction: float = 0.0005, blurRatio: float = 0.5, blurCoherence: float = 0.3, maxSkipped: int = 30) -> None:
+        """
+        Constructor for the FrameGate class.
+
+        :param downscale: How many times smaller the thumbnail is than the frame on each side.
+        :param changeThreshold: The difference, in gray levels, a thumbnail pixel must exceed to count as changed.
+        :param changeFraction: The fraction of thumbnail pixels that must change for a frame not to be static.
+        :param blurRatio: A frame is blurred if its sharpness is below this fraction of the recent peak sharpness.
+        :param blurCoherence: A frame is only blurred if the coherence of its gradients, from 0 when they point every way to 1 when they all line up, is at least this.
+        :param maxSkipped: The most frames in a row that may be skipped, so results are never older than this.
+        """
+        # Localizes parameters
+        self.downscale       = downscale
+        self.changeThreshold = changeThreshold
+        self.changeFraction  = changeFraction
+        self.blurRatio       = blurRatio
+        self.blurCoherence   = blurCoherence
+        self.maxSkipped      = maxSkipped
+
+        # The thumbnail of the current frame and of the last detected frame
+        self.thumbnail = None
+        self.reference = None
+
+        # The measurements of the current frame, and the peak sharpness of recent frames, which fades by decay each frame
+        self.difference = 0.0
+        self.sharpness  = 0.0
+        self.coherence  = 0.0
+        self.baseline   = 0.0
+        self.decay      = 0.02
+
+        # Variables
+        self.decision  = FrameGate.CHANGED
+        self.skipped   = 0
+        self.counts    = {FrameGate.CHANGED: 0, FrameGate.STATIC: 0, FrameGate.BLURRED: 0}
+        self.logStatus = False
+
+    def check(self, gray) -> str:
+        """
+        Decides if a frame needs to be detected.
+        Frames that are detected become the reference that later frames are compared against.
+
+        :param gray: The grayscale frame.
+        :return: ``FrameGate.CHANGED`` if the frame should be detected, otherwise ``FrameGate.STATIC`` or ``FrameGate.BLURRED``.
+        """
+        # Shrinks the frame, averaging away most of the sensor noise
+        size = (max(1, gray.shape[1] // self.downscale), max(1, gray.shape[0] // self.downscale))
+        if ((self.thumbnail is None) or (self.thumbnail.shape != (size[1], size[0]))):
+            self.thumbnail = np.empty((size[1], size[0]), np.uint8)
+            self.reference = None
+        cv.resize(gray, size, dst = self.thumbnail, interpolation = cv.INTER_AREA)
+
+        # Scores the sharpness as the variance of the Laplacian
+        __, deviation  = cv.meanStdDev(cv.Laplacian(self.thumbnail, cv.CV_16S))
+        self.sharpness = float(deviation[0, 0]) ** 2
+
+        # Scores how well the gradients line up from the structure tensor of the whole thumbnail. Tags and clutter have edges every way, motion blur leaves only the edges along the motion
+        gradX, gradY   = cv.Sobel(self.thumbnail, cv.CV_32F, 1, 0), cv.Sobel(self.thumbnail, cv.CV_32F, 0, 1)
+        sumXX, sumYY   = float(cv.sumElems(gradX * gradX)[0]), float(cv.sumElems(gradY * gradY)[0])
+        sumXY          = float(cv.sumElems(gradX * gradY)[0])
+        self.coherence = np.sqrt((sumXX - sumYY) ** 2 + 4 * sumXY ** 2) / (sumXX + sumYY + 1e-6)
+
+        # Counts the pixels that changed since the last detected frame
+        if (self.reference is not None):
+            __, changed     = cv.threshold(cv.absdiff(self.thumbnail, self.reference), self.changeThreshold, 255, cv.THRESH_BINARY)
+            self.difference = cv.countNonZero(changed) / changed.size
+        else:
+            self.difference = 1.0
+
+        # Decides, never skipping more than maxSkipped frames in a row
+        if (self.skipped >= self.maxSkipped):
+            decision = FrameGate.CHANGED
+        elif (self.difference < self.changeFraction):
+            decision = FrameGate.STATIC
+        elif ((self.sharpness < self.blurRatio * self.baseline) and (self.coherence >= self.blurCoherence)):
+            decision = FrameGate.BLURRED
+        else:
+            decision = FrameGate.CHANGED
+
+        # Tracks the peak sharpness. It fades so the blur test follows the scene, but slowly enough that a long turn is still seen as blurred
+        self.baseline = max(self.sharpness, self.baseline * (1.0 - self.decay))
+
+        # Keeps the detected frame as the new reference
+        if (decision == FrameGate.CHANGED):
+            self.reference = self.thumbnail.copy()
+            self.skipped   = 0
+        else:
+            self.skipped += 1
+        self.counts[decision] += 1
+        self.decision = decision
+
+        # Updates log
+        Logger.logDebug("Gate %s: %.2f%% changed, sharpness %.1f, coherence %.2f", self.logStatus, decision, self.difference * 100, self.sharpness, self.coherence)
+
+        return decision
+
+    def shouldSkip(self, gray) -> bool:
+        """
+        Gets if detection can be skipped for a frame.
+
+        :param gray: The grayscale frame.
+        :return: Is the frame static or blurred?
+        """
+        return self.check(gray) != FrameGate.CHANGED
+
+    def getDecision(self) -> str:
+        """
+        Gets the decision made for the last frame.
+
+        :return: ``FrameGate.CHANGED``, ``FrameGate.STATIC`` or ``FrameGate.BLURRED``.
+        """
+        return self.decision
+
+    def getDifference(self) -> float:
+        """
+        Gets how much the last frame differed from the last detected frame.
+
+        :return: The fraction of thumbnail pixels that changed.
+        """
+        return self.difference
+
+    def getSharpness(self) -> float:
+        """
+        Gets the sharpness of the last frame.
+
+        :return: The variance of the thumbnail's Laplacian.
+        """
+        return self.sharpness
+
+    def getCoherence(self) -> float:
+        """
+        Gets how well the gradients of the last frame line up along one direction.
+
+        :return: The coherence from 0 to 1.
+        """
+        return self.coherence
+
+    def getHitRate(self) -> float:
+        """
+        Gets the fraction of frames that were skipped.
+
+        :return: The hit rate from 0 to 1.
+        """
+        total = sum(self.counts.values())
+
+        return (self.counts[FrameGate.STATIC] + self.counts[FrameGate.BLURRED]) / max(total, 1)
+
+    def getStats(self) -> dict:
+        """
+        Gets how many frames each decision was made for.
+
+        :return: A dictionary of ``changed``, ``static`` and ``blurred`` frame counts, and the ``hitRate``.
+        """
+        return dict(self.counts, hitRate = self.getHitRate())
+
+    def reset(self):
+        """
+        Forgets the reference frame and the statistics, so the next frame is detected.
+        """
+        self.reference = None
+        self.baseline  = 0.0
+        self.skipped   = 0
+        self.counts    = {FrameGate.CHANGED: 0, FrameGate.STATIC: 0, FrameGate.BLURRED: 0}
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
@@ -0,0 +1,352 @@
+# Import Libraries
+import os
+import time
+import numpy as np
+from   .calibration import scaleIntrinsics
+
+# Import Utilities
+from .Utilities import Logger, MathUtil
+
+# Creates the DetectionGovernor class
+class DetectionGovernor:
+    """
+    Use this class to trade detection accuracy for speed at runtime.
+    It watches how long each detection takes and adjusts the ``pupil_apriltags`` settings between frames to stay within a time budget.
+
+    :param detector: The ``pupil_apriltags.Detector`` to adjust.
+    :param targetTime: The detection time budget in seconds.
+    :param minTagPixels: The smallest a tag's edge may become after decimation, in pixels.
+    :param maxThreads: The most threads the detector may use.
+    """
+    # The decimation steps the governor moves between
+    DECIMATIONS = (1.0, 1.5, 2.0, 3.0, 4.0)
+
+    def __init__(self, detector, targetTime: float = 0.020, minTagPixels: float = 16, maxThreads: int = None) -> None:
+        """
+        Constructor for the DetectionGovernor class.
+
+        :param detector: The ``pupil_apriltags.Detector`` to adjust.
+        :param targetTime: The detection time budget in seconds.
+        :param minTagPixels: The smallest a tag's edge may become after decimation, in pixels.
+        :param maxThreads: The most threads the detector may use.
+        """
+        # Localizes parameters
+        self.detector     = detector
+        self.targetTime   = targetTime
+        self.minTagPixels = minTagPixels
+        self.maxThreads   = maxThreads if (maxThreads is not None) else (os.cpu_count() or 1)
+
+        # Starts from the detector's current settings
+        self.decimationStep = int(np.argmin([abs(d - detector.params["quad_decimate"]) for d in DetectionGovernor.DECIMATIONS]))
+        self.nthreads       = int(detector.params["nthreads"])
+
+        # Variables
+        self.latency   = 0.0
+        self.smoothing = 0.2
+        self.cooldown  = 0
+        self.logStatus = False
+
+        # Applies the starting settings
+        self.apply()
+
+    def update(self, detectionTime: float, tagSizes = ()):
+        """
+        Records the time the last detection took and adjusts the detector for the next frame.
+
+        :param detectionTime: The time the last detection took in seconds.
+        :param tagSizes: The edge length, in pixels, of each tag seen in the last frame.
+        """
+        # Smooths the measured latency
+        if (self.latency == 0.0):
+            self.latency = detectionTime
+        else:
+            self.latency += self.smoothing * (detectionTime - self.latency)
+
+        # Waits a few frames after every change so the latency can settle
+        if (self.cooldown > 0):
+            self.cooldown -= 1
+            return
+
+        # Finds the most decimation that keeps the smallest tag decodable
+        maxStep = len(DetectionGovernor.DECIMATIONS) - 1
+        if (len(tagSizes) > 0):
+            smallest = min(tagSizes)
+            while ((maxStep > 0) and (smallest / DetectionGovernor.DECIMATIONS[maxStep] < self.minTagPixels)):
+                maxStep -= 1
+
+        # Chooses the next settings
+        step     = self.decimationStep
+        nthreads = self.nthreads
+        if (self.latency > self.targetTime):
+            # Over budget, decimate more if it is safe, otherwise use more threads
+            if (step < maxStep):
+                step += 1
+            elif (nthreads < self.maxThreads):
+                nthreads += 1
+        elif (self.latency < 0.5 * self.targetTime):
+            # Well under budget, win back accuracy and free up cores
+            if (nthreads > 1):
+                nthreads -= 1
+            elif (step > 0):
+                step -= 1
+
+        # Never decimate so far that the smallest tag is lost
+        step = MathUtil.clamp(step, 0, maxStep)
+
+        # Applies the settings if they changed
+        if ((step != self.decimationStep) or (nthreads != self.nthreads)):
+            self.decimationStep = step
+            self.nthreads       = nthreads
+            self.cooldown       = 5
+            self.apply()
+
+    def apply(self):
+        """
+        Writes the current settings into the detector.
+        Heavy decimation is paired with a light blur to suppress noise, and edge refinement recovers the corner accuracy decimation loses.
+        """
+        decimation = DetectionGovernor.DECIMATIONS[self.decimationStep]
+
+        # Stores the settings
+        self.detector.params["quad_decimate"] = decimation
+        self.detector.params["quad_sigma"]    = 0.8 if (decimation >= 3.0) else 0.0
+        self.detector.params["refine_edges"]  = 1 if (decimation > 1.0) else 0
+        self.detector.params["nthreads"]      = self.nthreads
+
+        # Updates the underlying detector
+        settings = self.detector.tag_detector_ptr.contents
+        settings.quad_decimate = float(self.detector.params["quad_decimate"])
+        settings.quad_sigma    = float(self.detector.params["quad_sigma"])
+        settings.refine_edges  = int(self.detector.params["refine_edges"])
+        settings.nthreads      = int(self.detector.params["nthreads"])
+
+        # Updates log
+        Logger.logDebug(lambda: f"Detector settings: {self.getSettings()}", self.logStatus)
+
+    def getSettings(self) -> dict:
+        """
+        Gets the active detector settings.
+
+        :return: A dictionary of ``quad_decimate``, ``quad_sigma``, ``refine_edges`` and ``nthreads``.
+        """
+        return {
+            "quad_decimate": self.detector.params["quad_decimate"],
+            "quad_sigma":    self.detector.params["quad_sigma"],
+            "refine_edges":  self.detector.params["refine_edges"],
+            "nthreads":      self.detector.params["nthreads"]
+        }
+
+    def getLatency(self) -> float:
+        """
+        Gets the smoothed detection time.
+
+        :return: The smoothed detection time in seconds.
+        """
+        return self.latency
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
+
+# Creates the PowerGovernor class
+class PowerGovernor:
+    """
+    Use this class to save power while no tag is in view.
+    The camera runs at its full "track" resolution and fps while tags are seen. Once no confident tag has been seen for ``scanDelay`` seconds,
+    it is dropped to a low resolution, low fps "scan" configuration through ``USBCamera.resize``, and it is switched back as soon as a scan frame holds a confident tag.
+    The intrinsics of both configurations are scaled once up front, so poses stay correct from the first frame after a switch.
+    ``update`` resizes the camera, so it must be called from the thread that reads the camera.
+
+    :param camera: The ``USBCamera`` to govern, already at its track resolution and fps.
+    :param scanResolution: The resolution to scan at, or None for half the track resolution.
+    :param scanFps: The fps to scan at.
+    :param scanDelay: How long no confident tag may be seen before scanning, in seconds.
+    :param minConfidence: The smallest decision margin that switches the camera back to tracking.
+    :param camera_matrix: The intrinsic matrix at the track resolution, or None to use ``camera.getMatrix()``.
+    """
+    # The camera configurations
+    TRACK = "track"
+    SCAN  = "scan"
+
+    def __init__(self, camera, scanResolution: tuple = None, scanFps: int = 10, scanDelay: float = 3.0, minConfidence: float = 50, camera_matrix = None) -> None:
+        """
+        Constructor for the PowerGovernor class.
+
+        :param camera: The ``USBCamera`` to govern, already at its track resolution and fps.
+        :param scanResolution: The resolution to scan at, or None for half the track resolution.
+        :param scanFps: The fps to scan at.
+        :param scanDelay: How long no confident tag may be seen before scanning, in seconds.
+        :param minConfidence: The smallest decision margin that switches the camera back to tracking.
+        :param camera_matrix: The intrinsic matrix at the track resolution, or None to use ``camera.getMatrix()``.
+        """
+        # Localizes parameters
+        self.camera        = camera
+        self.scanDelay     = scanDelay
+        self.minConfidence = minConfidence
+
+        # The configuration of each mode
+        self.trackResolution = tuple(camera.getResolution())
+        if (scanResolution is None):
+            scanResolution = (self.trackResolution[0] // 2, self.trackResolution[1] // 2)
+        self.configs = {
+            PowerGovernor.TRACK: (self.trackResolution, camera.fps),
+            PowerGovernor.SCAN:  (tuple(scanResolution), scanFps)
+        }
+
+        # Scales the intrinsics of each mode up front
+        self.trackMatrix = camera_matrix if (camera_matrix is not None) else camera.getMatrix()
+        self.matrices    = {PowerGovernor.TRACK: self.trackMatrix, PowerGovernor.SCAN: self.scaleMatrix(scanResolution)}
+
+        # Starts in track mode. The clocks start with the first frame
+        self.mode     = PowerGovernor.TRACK
+        self.lastSeen = None
+        self.lastTime = None
+        self.lastCpu  = 0.0
+        self.switches = 0
+
+        # The time, CPU time and frames spent in each mode
+        self.modeTime   = {PowerGovernor.TRACK: 0.0, PowerGovernor.SCAN: 0.0}
+        self.modeCpu    = {PowerGovernor.TRACK: 0.0, PowerGovernor.SCAN: 0.0}
+        self.modeFrames = {PowerGovernor.TRACK: 0, PowerGovernor.SCAN: 0}
+
+        # Variables
+        self.logStatus = False
+
+    def scaleMatrix(self, resolution: tuple):
+        """
+        Scales the track intrinsics to another resolution.
+
+        :param resolution: The resolution (width, height).
+        :return: The intrinsic matrix at that resolution, or None if the camera is not calibrated.
+        """
+        if (self.trackMatrix is None):
+            return None
+
+        return scaleIntrinsics(self.trackMatrix, self.trackResolution, resolution)
+
+    def update(self, results, timestamp: float = None) -> str:
+        """
+        Records the results of a frame and switches the camera between scanning and tracking.
+        Results reused by a ``FrameGate`` do not count as seeing a tag.
+
+        :param results: The ``TagResult`` objects returned by ``Detector.detectTags``.
+        :param timestamp: The time of the frame in seconds, or None to use ``time.monotonic()``.
+        :return: The mode the next frame is captured in.
+        """
+        if (timestamp is None):
+            timestamp = time.monotonic()
+
+        # Charges the time and CPU time since the last frame to the mode the frame was captured in
+        cpu = time.process_time()
+        if (self.lastTime is None):
+            self.lastSeen = timestamp
+        else:
+            self.modeTime[self.mode] += timestamp - self.lastTime
+            self.modeCpu[self.mode]  += cpu - self.lastCpu
+        self.modeFrames[self.mode] += 1
+        self.lastTime, self.lastCpu = timestamp, cpu
+
+        # Looks for a freshly detected, confident tag
+        if (any((result.getAge() == 0) and (result.getDecisionMargin() >= self.minConfidence) for result in results)):
+            self.lastSeen = timestamp
+
+            # Tracks from the next frame on
+            if (self.mode == PowerGovernor.SCAN):
+                self.setMode(PowerGovernor.TRACK)
+        elif ((self.mode == PowerGovernor.TRACK) and (timestamp - self.lastSeen >= self.scanDelay)):
+            # Nothing has been seen for a while
+            self.setMode(PowerGovernor.SCAN)
+
+        return self.mode
+
+    def setMode(self, mode: str):
+        """
+        Reconfigures the camera for a mode.
+
+        :param mode: ``PowerGovernor.TRACK`` or ``PowerGovernor.SCAN``.
+        """
+        resolution, fps = self.configs[mode]
+        self.camera.resize(resolution, fps)
+
+        # Rescales the intrinsics if the camera chose a different resolution than the one asked for
+        if (tuple(self.camera.getResolution()) != tuple(resolution)):
+            self.configs[mode]  = (tuple(self.camera.getResolution()), fps)
+            self.matrices[mode] = self.scaleMatrix(self.camera.getResolution())
+
+        self.mode      = mode
+        self.switches += 1
+
+        # Updates log
+        Logger.logInfo("Switched to %s mode at %dx%d", self.logStatus, mode, self.configs[mode][0][0], self.configs[mode][0][1])
+
+    def getMode(self) -> str:
+        """
+        Gets the mode the camera is in.
+
+        :return: ``PowerGovernor.TRACK`` or ``PowerGovernor.SCAN``.
+        """
+        return self.mode
+
+    def getMatrix(self):
+        """
+        Gets the intrinsic matrix of the camera's current resolution.
+
+        :return: The intrinsic matrix, or None if the camera is not calibrated.
+        """
+        return self.matrices[self.mode]
+
+    def getDutyCycle(self) -> float:
+        """
+        Gets the fraction of time spent tracking.
+
+        :return: The duty cycle from 0 to 1.
+        """
+        total = self.modeTime[PowerGovernor.TRACK] + self.modeTime[PowerGovernor.SCAN]
+
+        return self.modeTime[PowerGovernor.TRACK] / total if (total > 0) else 1.0
+
+    def getCpuSavings(self) -> float:
+        """
+        Estimates the fraction of CPU time saved compared with tracking the whole time.
+        The CPU time per second of each mode is measured, so the estimate needs time in both modes.
+
+        :return: The fraction of CPU time saved, from 0 to 1.
+        """
+        trackTime = self.modeTime[PowerGovernor.TRACK]
+        totalTime = trackTime + self.modeTime[PowerGovernor.SCAN]
+        if ((trackTime <= 0) or (totalTime <= 0)):
+            return 0.0
+
+        # Compares the CPU time used with what tracking would have used at its measured rate
+        trackRate = self.modeCpu[PowerGovernor.TRACK] / trackTime
+        used      = self.modeCpu[PowerGovernor.TRACK] + self.modeCpu[PowerGovernor.SCAN]
+
+        return 1.0 - used / (trackRate * totalTime) if (trackRate > 0) else 0.0
+
+    def getStats(self) -> dict:
+        """
+        Gets how the governor has spent its time.
+
+        :return: A dictionary of the ``mode``, the number of ``switches``, the ``dutyCycle``, the estimated ``cpuSavings``,
+                 and the seconds, CPU seconds and frames spent in each mode.
+        """
+        return {
+            "mode":        self.mode,
+            "switches":    self.switches,
+            "dutyCycle":   self.getDutyCycle(),
+            "cpuSavings":  self.getCpuSavings(),
+            "trackTime":   self.modeTime[PowerGovernor.TRACK],
+            "scanTime":    self.modeTime[PowerGovernor.SCAN],
+            "trackCpu":    self.modeCpu[PowerGovernor.TRACK],
+            "scanCpu":     self.modeCpu[PowerGovernor.SCAN],
+            "trackFrames": self.modeFrames[PowerGovernor.TRACK],
+            "scanFrames":  self.modeFrames[PowerGovernor.SCAN]
+        }
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
@@ -0,0 +1,206 @@
+# Import Libraries
+import time
+from   concurrent.futures import ThreadPoolExecutor
+from   .apriltags         import Detector
+from   .communications    import NetworkCommunications
+from   .estimator         import PoseEstimator
+
+# Import Utilities
+from .Utilities import Logger, Profiler
+
+# Creates the MultiCameraDetector class
+class MultiCameraDetector:
+    """
+    Use this class to detect AprilTags with several cameras and fuse them into one robot pose.
+    Every cycle, all cameras are grabbed back to back so their frames are exposed at nearly the same time.
+    Each frame is then decoded and detected on its own thread, and the tags seen by every camera are solved together into one robot pose.
+    OpenCV and ``pupil_apriltags`` release the GIL while they work, so on a multi-core coprocessor the cameras are detected in parallel.
+    Each camera publishes its results and diagnostics to its own table under ``tableName``, and the fused pose is published to ``tableName`` itself.
+    For the grabs to line up, the cameras should not be threaded.
+    A camera that fails to grab or detect is left out of the cycle and reported as disconnected, so the other cameras keep giving a pose.
+
+    :param cameras: A dictionary of camera name to ``USBCamera``.
+    :param robotToCameras: A dictionary of camera name to the ``Transform3d`` from the robot's center to that camera.
+    :param layout: The ``AprilTagFieldLayout`` of the field.
+    :param size: The size of the AprilTag in inches.
+    :param tableName: The NetworkTables table to publish to.
+    :param detectorArgs: The keyword arguments of each camera's ``Detector``.
+    :param comms: The ``NetworkCommunications`` every camera and the fused pose publish to, or None to create a table for each camera.
+    """
+    def __init__(self, cameras: dict, robotToCameras: dict, layout, size: int = 6, tableName: str = "TagInfo", detectorArgs: dict = None, comms = None) -> None:
+        """
+        Constructor for the MultiCameraDetector class.
+
+        :param cameras: A dictionary of camera name to ``USBCamera``.
+        :param robotToCameras: A dictionary of camera name to the ``Transform3d`` from the robot's center to that camera.
+        :param layout: The ``AprilTagFieldLayout`` of the field.
+        :param size: The size of the AprilTag in inches.
+        :param tableName: The NetworkTables table to publish to.
+        :param detectorArgs: The keyword arguments of each camera's ``Detector``.
+        :param comms: The ``NetworkCommunications`` every camera and the fused pose publish to, or None to create a table for each camera.
+        """
+        if (set(cameras) != set(robotToCameras)):
+            raise ValueError("Every camera needs a robot to camera transform")
+
+        # Localizes parameters
+        self.cameras        = cameras
+        self.robotToCameras = robotToCameras
+        detectorArgs        = detectorArgs if (detectorArgs is not None) else {}
+
+        # Creates a detector for each camera, publishing to the camera's own table
+        self.comms     = comms if (comms is not None) else NetworkCommunications(tableName)
+        self.detectors = {}
+        for name in cameras:
+            cameraComms = comms if (comms is not None) else NetworkCommunications(tableName + "/" + name)
+            self.detectors[name] = Detector(size, comms = cameraComms, **detectorArgs)
+
+        # Solves the tags of every camera together
+        self.estimator = PoseEstimator(layout, size)
+
+        # Detects each camera on its own thread
+        self.executor = ThreadPoolExecutor(max_workers = len(cameras), thread_name_prefix = "MultiCameraDetector")
+
+        # The results of the last cycle
+        self.results     = {name: [] for name in cameras}
+        self.diagnostics = {name: {"latency": 0.0, "tagCount": 0, "grabOffset": 0.0, "connected": False} for name in cameras}
+        self.robotPose   = None
+        self.captureTime = 0.0
+
+        # Variables
+        self.logStatus = False
+
+    def update(self):
+        """
+        Grabs, detects and fuses one frame from every camera, and publishes the results.
+
+        :return: The robot's field relative ``Pose3d``, or None if no camera saw a tag in the layout.
+        """
+        # Starts timing the cycle
+        cycleStart = Profiler.now()
+
+        # Grabs every camera back to back, so their exposures are as close together as possible
+        grabTimes = {}
+        for name, camera in self.cameras.items():
+            if (self.grabCamera(name) == True):
+                grabTimes[name] = camera.getCaptureTime()
+        self.captureTime = min(grabTimes.values(), default = self.captureTime)
+        stageStart = Profiler.record("multicamera.grab", cycleStart)
+
+        # Decodes and detects every grabbed camera at once. Cameras that failed are left out of this cycle
+        futures = {name: self.executor.submit(self.detectCamera, name) for name in grabTimes}
+        for name in self.cameras:
+            results, latency = None, 0.0
+            if (name in futures):
+                try:
+                    results, latency = futures[name].result()
+                except Exception as e:
+                    Logger.logError("Camera %s failed to detect: %s", True, name, e)
+            connected = (results is not None)
+
+            self.results[name]     = results if (connected == True) else []
+            self.diagnostics[name] = {"latency": latency, "tagCount": len(self.results[name]), "grabOffset": grabTimes[name] - self.captureTime if (connected == True) else 0.0, "connected": connected}
+        stageStart = Profiler.record("multicamera.detect", stageStart)
+
+        # Solves the tags of every connected camera together into one pose
+        observations = [
+            (self.results[name], camera.getMatrix(), camera.camdistortion, self.robotToCameras[name])
+            for name, camera in self.cameras.items() if (self.diagnostics[name]["connected"] == True)
+        ]
+        self.robotPose = self.estimator.estimateFusedRobotPose(observations)
+        Profiler.record("multicamera.fuse", stageStart)
+
+        # Publishes the fused pose and each camera's diagnostics
+        if (self.robotPose is not None):
+            self.comms.setRobotPose(self.robotPose, self.estimator.getTagsUsed(), self.estimator.getReprojectionError(), self.comms.getNetworkTime(self.captureTime))
+        for name, detector in self.detectors.items():
+            diagnostics = self.diagnostics[name]
+            detector.comms.setCameraStatus(diagnostics["latency"], diagnostics["tagCount"], diagnostics["grabOffset"], diagnostics["connected"])
+        Profiler.record("multicamera.total", cycleStart)
+
+        # Updates log
+        Logger.logDebug("Fused %d tags from %d cameras", self.logStatus, self.estimator.getTagsUsed(), len(self.cameras))
+
+        return self.robotPose
+
+    def grabCamera(self, name: str) -> bool:
+        """
+        Grabs a camera's next frame, logging the camera if it fails.
+
+        :param name: The name of the camera.
+        :return: Was a frame grabbed?
+        """
+        try:
+            grabbed = self.cameras[name].grab()
+        except Exception as e:
+            Logger.logError("Camera %s failed to grab: %s", True, name, e)
+            return False
+
+        if (grabbed == False):
+            Logger.logWarning("Camera %s failed to grab", self.logStatus, name)
+
+        return grabbed
+
+    def detectCamera(self, name: str):
+        """
+        Decodes a camera's grabbed frame and detects the tags in it.
+        This method runs on one of the detection threads.
+
+        :param name: The name of the camera.
+        :return: A list of ``TagResult`` objects, or None if the frame could not be decoded.
+        :return: The time the decode and detection took in seconds.
+        """
+        start  = time.perf_counter()
+        camera = self.cameras[name]
+
+        # Detects in the raw frame, undistorting only the tag corners
+        stream = camera.retrieve()
+        if (stream is None):
+            Logger.logWarning("Camera %s failed to decode", self.logStatus, name)
+            return None, time.perf_counter() - start
+        results, stream = self.detectors[name].detectTags(stream, camera.getMatrix(), 0, camera.camdistortion, camera.getCaptureTime())
+
+        return results, time.perf_counter() - start
+
+    def getRobotPose(self):
+        """
+        Gets the robot pose fused from the last cycle.
+
+        :return: The robot's ``Pose3d``, or None if no camera saw a tag in the layout.
+        """
+        return self.robotPose
+
+    def getResults(self) -> dict:
+        """
+        Gets the tags each camera saw in the last cycle.
+
+        :return: A dictionary of camera name to a list of ``TagResult`` objects.
+        """
+        return self.results
+
+    def getCaptureTime(self) -> float:
+        """
+        Gets the time the first camera of the last cycle was grabbed.
+
+        :return: The capture time in seconds, from ``time.monotonic()``.
+        """
+        return self.captureTime
+
+    def getDiagnostics(self) -> dict:
+        """
+        Gets each camera's diagnostics from the last cycle.
+
+        :return: A dictionary of camera name to a dictionary of its ``latency`` and ``grabOffset`` in seconds, its ``tagCount``, and if it was ``connected``.
+        """
+        return self.diagnostics
+
+    def close(self):
+        """
+        Stops the detection threads.
+        """
+        self.executor.shutdown()
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
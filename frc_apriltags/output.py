@@ -0,0 +1,284 @@
+# Import Libraries
+import time
+import threading
+import cv2   as cv
+import numpy as np
+
+# Import Utilities
+from .Utilities import Logger, MathUtil
+
+# Creates the ThreadedOutput class
+class ThreadedOutput:
+    """
+    Use this class to send frames to a ``CameraServer`` output stream from a background thread.
+    Frames are decimated to the output frame rate, downscaled to the output resolution and handed to cscore on the worker thread,
+    and the MJPEG quality is adjusted so the stream stays within a bandwidth budget.
+
+    :param outputStream: The ``cscore.CvSource`` to send frames to.
+    :param server: The ``cscore`` MJPEG server of the output stream, or None if its quality should not be adjusted.
+    :param resolution: The resolution of the sent frames (width, height).
+    :param fps: The most frames sent per second.
+    :param bitrate: The bandwidth budget of the stream in bits per second, or None for no budget.
+    :param maxClients: The number of dashboards expected to watch the stream at once.
+    """
+    # The range of MJPEG qualities the output moves between
+    MIN_QUALITY = 10
+    MAX_QUALITY = 80
+
+    def __init__(self, outputStream, server = None, resolution: tuple = (320, 240), fps: float = 15, bitrate: float = None, maxClients: int = 1) -> None:
+        """
+        Constructor for the ThreadedOutput class.
+
+        :param outputStream: The ``cscore.CvSource`` to send frames to.
+        :param server: The ``cscore`` MJPEG server of the output stream, or None if its quality should not be adjusted.
+        :param resolution: The resolution of the sent frames (width, height).
+        :param fps: The most frames sent per second.
+        :param bitrate: The bandwidth budget of the stream in bits per second, or None for no budget.
+        :param maxClients: The number of dashboards expected to watch the stream at once.
+        """
+        # Localizes parameters
+        self.outputStream = outputStream
+        self.server       = server
+        self.resolution   = resolution
+        self.maxFps       = fps
+        self.bitrate      = bitrate
+        self.maxClients   = maxClients
+
+        # The frame handed over by the caller and the frame being sent. The caller owns pending, the worker owns sending
+        self.pending  = None
+        self.sending  = None
+        self.pendingOverlay = None
+        self.sendingOverlay = None
+        self.resized  = np.zeros(shape = (resolution[1], resolution[0], 3), dtype = np.uint8)
+        self.newFrame = False
+
+        # Adaptive settings
+        self.fps           = fps
+        self.quality       = ThreadedOutput.MAX_QUALITY
+        self.frameBytes    = 0.0
+        self.lastAccepted  = 0.0
+        self.measureEvery  = 10
+
+        # Frame bookkeeping
+        self.sentFrames      = 0
+        self.droppedFrames   = 0
+        self.decimatedFrames = 0
+
+        # Thread variables
+        self.condition = threading.Condition()
+        self.running   = False
+        self.thread    = None
+
+        # Variables
+        self.logStatus = False
+
+        # Applies the starting quality
+        self.setQuality(self.quality)
+
+    def start(self):
+        """
+        Starts the output thread.
+
+        :return: This ``ThreadedOutput``.
+        """
+        # Does nothing if the thread is already running
+        if (self.running == True):
+            return self
+
+        # Starts the thread
+        self.running = True
+        self.thread  = threading.Thread(target = self.update, name = "ThreadedOutput", daemon = True)
+        self.thread.start()
+
+        # Updates log
+        Logger.logInfo("Output thread started", self.logStatus)
+
+        return self
+
+    def stop(self):
+        """
+        Stops the output thread and waits for it to finish.
+        """
+        # Signals the thread to stop
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+        # Waits for the thread to finish
+        if (self.thread is not None):
+            self.thread.join()
+            self.thread = None
+
+        # Updates log
+        Logger.logInfo("Output thread stopped", self.logStatus)
+
+    def putFrame(self, image, overlay = None) -> bool:
+        """
+        Hands a frame to the output thread and returns immediately.
+        Frames that arrive faster than the output frame rate are skipped, and a frame that is replaced before it was sent is counted as dropped.
+
+        :param image: The frame to send.
+        :param overlay: A function that takes the downscaled frame and its scale and draws onto it, such as from ``TagVisualizer.getOverlay``. It runs on the output thread.
+        :return: Was the frame accepted?
+        """
+        # Skips frames to hold the output frame rate
+        now = time.monotonic()
+        if (now - self.lastAccepted < 1.0 / self.fps):
+            self.decimatedFrames += 1
+            return False
+        self.lastAccepted = now
+
+        with self.condition:
+            # Copies the frame, since the caller may reuse its buffer
+            if ((self.pending is None) or (self.pending.shape != image.shape)):
+                self.pending = np.empty_like(image)
+            np.copyto(self.pending, image)
+            self.pendingOverlay = overlay
+
+            # The last frame was never sent
+            if (self.newFrame == True):
+                self.droppedFrames += 1
+
+            self.newFrame = True
+            self.condition.notify_all()
+
+        return True
+
+    def update(self):
+        """
+        Continuously downscales and sends the newest frame, and adapts the stream to the bandwidth budget.
+        This method runs on the output thread.
+        """
+        while (self.running == True):
+            # Waits for a frame and takes ownership of it
+            with self.condition:
+                self.condition.wait_for(lambda: (self.newFrame == True) or (self.running == False))
+                if (self.running == False):
+                    break
+                self.pending, self.sending = self.sending, self.pending
+                self.pendingOverlay, self.sendingOverlay = None, self.pendingOverlay
+                self.newFrame = False
+
+            # Nothing is watching, so nothing is sent
+            if (self.outputStream.isEnabled() == False):
+                continue
+
+            # Downscales the frame
+            if ((self.sending.shape[1], self.sending.shape[0]) != self.resolution):
+                cv.resize(self.sending, self.resolution, dst = self.resized, interpolation = cv.INTER_AREA)
+                frame = self.resized
+            else:
+                frame = self.sending
+
+            # Draws the overlay at the output resolution, which is cheaper than drawing on the full frame
+            if (self.sendingOverlay is not None):
+                self.sendingOverlay(frame, frame.shape[1] / self.sending.shape[1])
+
+            # Measures the size of a frame at the current quality every few frames
+            if ((self.bitrate is not None) and (self.sentFrames % self.measureEvery == 0)):
+                self.adapt(frame)
+
+            # Sends the frame
+            self.outputStream.putFrame(frame)
+            self.sentFrames += 1
+
+    def adapt(self, frame):
+        """
+        Encodes a frame at the current quality and adjusts the quality and frame rate to fit the bandwidth budget.
+        Quality is lowered first, and the frame rate only once the quality is at its lowest.
+
+        :param frame: The downscaled frame.
+        """
+        # Measures the encoded size of a frame
+        ret, encoded = cv.imencode(".jpg", frame, [cv.IMWRITE_JPEG_QUALITY, self.quality])
+        if (ret == False):
+            return
+        self.frameBytes = len(encoded)
+
+        # Adjusts the settings
+        quality, fps = self.quality, self.fps
+        if (self.getBitrate() > self.bitrate):
+            # Over budget
+            if (quality > ThreadedOutput.MIN_QUALITY):
+                quality -= 10
+            else:
+                fps *= 0.8
+        elif (self.getBitrate() < 0.6 * self.bitrate):
+            # Well under budget
+            if (fps < self.maxFps):
+                fps *= 1.25
+            else:
+                quality += 10
+
+        # Applies the settings if they changed
+        self.fps = MathUtil.clamp(fps, 1.0, self.maxFps)
+        quality  = MathUtil.clamp(quality, ThreadedOutput.MIN_QUALITY, ThreadedOutput.MAX_QUALITY)
+        if (quality != self.quality):
+            self.setQuality(quality)
+
+    def setQuality(self, quality: int):
+        """
+        Sets the MJPEG quality of the stream.
+
+        :param quality: The quality from 0 to 100.
+        """
+        self.quality = quality
+        if (self.server is not None):
+            self.server.getProperty("compression").set(quality)
+
+        # Updates log
+        Logger.logDebug("Stream quality %d at %.1f fps", self.logStatus, quality, self.fps)
+
+    def getBitrate(self) -> float:
+        """
+        Gets the estimated bandwidth of the stream.
+
+        :return: The estimated bandwidth in bits per second.
+        """
+        return 8 * self.frameBytes * self.fps * self.maxClients
+
+    def getQuality(self) -> int:
+        """
+        Gets the MJPEG quality of the stream.
+
+        :return: The quality from 0 to 100.
+        """
+        return self.quality
+
+    def getFPS(self) -> float:
+        """
+        Gets the output frame rate.
+
+        :return: The most frames sent per second.
+        """
+        return self.fps
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of frames that were replaced before they could be sent.
+
+        :return: The number of dropped frames.
+        """
+        return self.droppedFrames
+
+    def getDecimatedFrames(self) -> int:
+        """
+        Gets the number of frames skipped to hold the output frame rate.
+
+        :return: The number of skipped frames.
+        """
+        return self.decimatedFrames
+
+    def getSentFrames(self) -> int:
+        """
+        Gets the number of frames sent to the output stream.
+
+        :return: The number of sent frames.
+        """
+        return self.sentFrames
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
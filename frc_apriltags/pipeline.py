@@ -0,0 +1,376 @@
+# Import Libraries
+import time
+import threading
+import numpy as np
+from   collections import deque
+
+# Import Utilities
+from .Utilities import Logger
+
+# Creates the FrameQueue class
+class FrameQueue:
+    """
+    Use this class to hand items between the stages of a ``VisionPipeline``.
+    The policy decides what happens when an item is put into a full queue:
+    ``FrameQueue.LATEST`` throws out everything queued so only the newest item is kept,
+    ``FrameQueue.DROP_OLDEST`` throws out the oldest item,
+    and ``FrameQueue.BLOCK`` waits for space.
+
+    :param maxSize: The most items the queue holds.
+    :param policy: ``FrameQueue.LATEST``, ``FrameQueue.DROP_OLDEST`` or ``FrameQueue.BLOCK``.
+    """
+    # Full queue policies
+    LATEST      = "latest"
+    DROP_OLDEST = "dropOldest"
+    BLOCK       = "block"
+
+    def __init__(self, maxSize: int = 1, policy: str = "latest") -> None:
+        """
+        Constructor for the FrameQueue class.
+
+        :param maxSize: The most items the queue holds.
+        :param policy: ``FrameQueue.LATEST``, ``FrameQueue.DROP_OLDEST`` or ``FrameQueue.BLOCK``.
+        """
+        if (policy not in (FrameQueue.LATEST, FrameQueue.DROP_OLDEST, FrameQueue.BLOCK)):
+            raise ValueError(f"Unknown queue policy {policy!r}")
+
+        # Localizes parameters
+        self.maxSize = maxSize
+        self.policy  = policy
+
+        # Variables
+        self.items     = deque()
+        self.condition = threading.Condition()
+        self.closed    = False
+        self.dropped   = 0
+
+    def put(self, item, timeout: float = None) -> bool:
+        """
+        Adds an item to the queue, making room for it as the policy says.
+
+        :param item: The item to add.
+        :param timeout: The longest time a ``BLOCK`` queue waits for space in seconds, or None to wait forever.
+        :return: Was the item added? Only a closed queue or a ``BLOCK`` queue that timed out refuses an item.
+        """
+        with self.condition:
+            if (self.policy == FrameQueue.BLOCK):
+                # Waits for space
+                self.condition.wait_for(lambda: (len(self.items) < self.maxSize) or (self.closed == True), timeout)
+                if (len(self.items) >= self.maxSize):
+                    return False
+            elif (self.policy == FrameQueue.LATEST):
+                # Throws out everything that is still queued
+                self.dropped += len(self.items)
+                self.items.clear()
+            elif (len(self.items) >= self.maxSize):
+                # Throws out the oldest item
+                self.items.popleft()
+                self.dropped += 1
+
+            if (self.closed == True):
+                return False
+
+            self.items.append(item)
+            self.condition.notify_all()
+
+        return True
+
+    def get(self, timeout: float = None):
+        """
+        Takes the oldest item from the queue, waiting for one if the queue is empty.
+
+        :param timeout: The longest time to wait in seconds, or None to wait forever.
+        :return: The item, or None if the queue was closed or the wait timed out.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: (len(self.items) > 0) or (self.closed == True), timeout)
+            if (len(self.items) == 0):
+                return None
+
+            item = self.items.popleft()
+            self.condition.notify_all()
+
+        return item
+
+    def close(self):
+        """
+        Closes the queue. Items that are still queued can be taken, and then ``get`` returns None.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def getDepth(self) -> int:
+        """
+        Gets the number of queued items.
+
+        :return: The queue depth.
+        """
+        return len(self.items)
+
+    def getDropped(self) -> int:
+        """
+        Gets the number of items thrown out to make room for newer ones.
+
+        :return: The number of dropped items.
+        """
+        return self.dropped
+
+# Creates the VisionPipeline class
+class VisionPipeline:
+    """
+    Use this class to run the capture, detection and streaming of a camera on separate threads, so each stage works on a frame while the others do.
+    Detection only ever takes the newest frame, and streaming throws out its oldest frame when it falls behind, so a slow stage never delays the one before it.
+    Results are published to NetworkTables on the detection thread as soon as they are found.
+    Failed reads are counted and retried, so only the end of a ``FrameReplay`` stops the pipeline on its own, and an error in any stage is logged and counted without stopping it.
+
+    :param camera: The ``USBCamera`` to read, or anything with ``getStream()`` and ``getCaptureTime()``, such as a ``FrameReplay``.
+    :param detector: The ``Detector`` to run on each frame.
+    :param camera_matrix: The camera's intrinsic matrix, or None to use ``camera.getMatrix()``.
+    :param streaming: The ``Streaming`` to send processed frames to, or None to not stream.
+    :param undistort: Should frames be read with ``getUndistortedStream()`` when the camera is calibrated.
+    :param vizualization: The ``vizualization`` level of the streamed frames. Tags are drawn by streaming rather than detection.
+    :param streamDepth: The most processed frames queued for streaming.
+    """
+    def __init__(self, camera, detector, camera_matrix = None, streaming = None, undistort: bool = True, vizualization: int = 0, streamDepth: int = 2) -> None:
+        """
+        Constructor for the VisionPipeline class.
+
+        :param camera: The ``USBCamera`` to read, or anything with ``getStream()`` and ``getCaptureTime()``, such as a ``FrameReplay``.
+        :param detector: The ``Detector`` to run on each frame.
+        :param camera_matrix: The camera's intrinsic matrix, or None to use ``camera.getMatrix()``.
+        :param streaming: The ``Streaming`` to send processed frames to, or None to not stream.
+        :param undistort: Should frames be read with ``getUndistortedStream()`` when the camera is calibrated.
+        :param vizualization: The ``vizualization`` level of the streamed frames. Tags are drawn by streaming rather than detection.
+        :param streamDepth: The most processed frames queued for streaming.
+        """
+        # Localizes parameters
+        self.camera        = camera
+        self.detector      = detector
+        self.camera_matrix = camera_matrix if (camera_matrix is not None) else camera.getMatrix()
+        self.streaming     = streaming
+        self.vizualization = vizualization
+
+        # Undistorts only when the camera can and has been calibrated
+        self.undistort = (undistort == True) and hasattr(camera, "getUndistortedStream") and (getattr(camera, "camdistortion", None) is not None)
+
+        # The queues between the stages
+        self.detectQueue = FrameQueue(1, FrameQueue.LATEST)
+        self.streamQueue = FrameQueue(streamDepth, FrameQueue.DROP_OLDEST)
+
+        # The latest results
+        self.lock        = threading.Lock()
+        self.results     = []
+        self.captureTime = 0.0
+
+        # The number of frames each stage has finished
+        self.counts    = {"capture": 0, "detect": 0, "stream": 0}
+        self.startTime = 0.0
+
+        # The number of failed reads, and of errors raised in each stage
+        self.failedReads = 0
+        self.errors      = {"capture": 0, "detect": 0, "stream": 0}
+
+        # Thread variables
+        self.running = False
+        self.threads = []
+
+        # Variables
+        self.logStatus = False
+
+    def start(self):
+        """
+        Starts a thread for each stage.
+
+        :return: This ``VisionPipeline``.
+        """
+        # Does nothing if the threads are already running
+        if (self.running == True):
+            return self
+
+        # Starts the threads
+        self.running   = True
+        self.startTime = time.monotonic()
+        self.threads   = [
+            threading.Thread(target = self.captureLoop, name = "VisionPipeline.capture", daemon = True),
+            threading.Thread(target = self.detectLoop, name = "VisionPipeline.detect", daemon = True)
+        ]
+        if (self.streaming is not None):
+            self.threads.append(threading.Thread(target = self.streamLoop, name = "VisionPipeline.stream", daemon = True))
+        for thread in self.threads:
+            thread.start()
+
+        # Updates log
+        Logger.logInfo("Vision pipeline started with %d stages", self.logStatus, len(self.threads))
+
+        return self
+
+    def stop(self):
+        """
+        Stops every stage and waits for them to finish.
+        """
+        self.running = False
+        self.detectQueue.close()
+        self.streamQueue.close()
+        self.join()
+
+        # Updates log
+        Logger.logInfo("Vision pipeline stopped", self.logStatus)
+
+    def join(self, timeout: float = None):
+        """
+        Waits for every stage to finish, which happens once a ``FrameReplay`` runs out of frames or the pipeline is stopped.
+
+        :param timeout: The longest time to wait for each stage in seconds, or None to wait forever.
+        """
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def captureLoop(self):
+        """
+        Reads frames and hands the newest to detection.
+        This method runs on the capture thread.
+        """
+        while (self.running == True):
+            try:
+                # Reads the frame along with the intrinsics that match it
+                if (self.undistort == True):
+                    stream, camera_matrix = self.camera.getUndistortedStream()
+                else:
+                    stream, camera_matrix = self.camera.getStream(), self.camera_matrix
+
+                if (stream is None):
+                    # The recording ran out of frames
+                    if ((hasattr(self.camera, "hasEnded") == True) and (self.camera.hasEnded() == True)):
+                        break
+
+                    # Retries a failed read after a short wait, so an unplugged camera does not spin
+                    self.failedReads += 1
+                    Logger.logWarning("Camera read failed, %d failed reads so far", self.logStatus, self.failedReads)
+                    time.sleep(0.01)
+                    continue
+
+                # Copies the frame, since the camera reuses its buffer for the next one
+                self.detectQueue.put((np.array(stream), camera_matrix, self.camera.getCaptureTime()))
+                self.counts["capture"] += 1
+            except Exception as e:
+                self.logStageError("capture", e)
+                time.sleep(0.01)
+
+        # Lets detection finish the last frame
+        self.detectQueue.close()
+
+    def detectLoop(self):
+        """
+        Detects tags in the newest frame, publishes the results and hands the frame to streaming.
+        This method runs on the detection thread.
+        """
+        while (True):
+            item = self.detectQueue.get()
+            if (item is None):
+                break
+            stream, camera_matrix, captureTime = item
+
+            try:
+                # Detects and publishes. Tags are drawn by streaming, so detection never waits on drawing
+                results, stream = self.detector.detectTags(stream, camera_matrix, 0, captureTime = captureTime)
+                with self.lock:
+                    self.results, self.captureTime = results, captureTime
+                self.counts["detect"] += 1
+
+                # Hands the frame and the projected tags to streaming
+                if (self.streaming is not None):
+                    overlay = None
+                    if (self.vizualization != 0):
+                        overlay = self.detector.visualizer.getOverlay(camera_matrix, [result.poseMatrix for result in results], None, self.vizualization)
+                    self.streamQueue.put((stream, overlay))
+            except Exception as e:
+                self.logStageError("detect", e)
+
+        # Lets streaming finish the last frame
+        self.streamQueue.close()
+
+    def streamLoop(self):
+        """
+        Sends processed frames to the driver station.
+        This method runs on the streaming thread.
+        """
+        while (True):
+            item = self.streamQueue.get()
+            if (item is None):
+                break
+            stream, overlay = item
+
+            try:
+                self.streaming.streamImage(stream, overlay)
+                self.counts["stream"] += 1
+            except Exception as e:
+                self.logStageError("stream", e)
+
+    def logStageError(self, stage: str, error: Exception):
+        """
+        Counts and logs an error raised in a stage, which then carries on with the next frame.
+
+        :param stage: The name of the stage.
+        :param error: The error that was raised.
+        """
+        self.errors[stage] += 1
+        Logger.logError("Vision pipeline %s stage raised %s: %s", True, stage, type(error).__name__, error)
+
+    def getResults(self):
+        """
+        Gets the results of the newest frame that has been detected.
+
+        :return: A list of ``TagResult`` objects.
+        :return: The time the frame was captured, from ``time.monotonic()``.
+        """
+        with self.lock:
+            return self.results, self.captureTime
+
+    def getThroughput(self) -> dict:
+        """
+        Gets the average number of frames each stage has finished per second since the pipeline started.
+
+        :return: A dictionary of stage name to frames per second.
+        """
+        elapsed = max(time.monotonic() - self.startTime, 1e-9)
+
+        return {stage: count / elapsed for stage, count in self.counts.items()}
+
+    def getQueueDepths(self) -> dict:
+        """
+        Gets the number of frames waiting for each stage.
+
+        :return: A dictionary of stage name to queue depth.
+        """
+        return {"detect": self.detectQueue.getDepth(), "stream": self.streamQueue.getDepth()}
+
+    def getDroppedFrames(self) -> dict:
+        """
+        Gets the number of frames each stage skipped because a newer frame arrived first.
+
+        :return: A dictionary of stage name to dropped frames.
+        """
+        return {"detect": self.detectQueue.getDropped(), "stream": self.streamQueue.getDropped()}
+
+    def getFailedReads(self) -> int:
+        """
+        Gets the number of times the camera failed to return a frame.
+
+        :return: The number of failed reads.
+        """
+        return self.failedReads
+
+    def getErrors(self) -> dict:
+        """
+        Gets the number of errors each stage raised and carried on from.
+
+        :return: A dictionary of stage name to errors.
+        """
+        return self.errors
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
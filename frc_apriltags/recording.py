@@ -0,0 +1,414 @@
+# Import Libraries
+import os
+import time
+import queue
+import threading
+import cv2   as cv
+import numpy as np
+
+# Import Utilities
+from .Utilities import Logger
+
+# The index record of each frame: where its bytes start, how many there are, and when it was captured
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("size", "<u4"), ("timestamp", "<f8")])
+
+# Creates the FrameRecorder class
+class FrameRecorder:
+    """
+    Use this class to record frames to disk so they can be replayed with ``FrameReplay``.
+    A recording is a directory holding the frame bytes, a fixed-size index record for each frame, and the camera's calibration.
+    Both files are only ever appended to, so a recording can be reopened and extended with frames of the same shape and format.
+    Frames that are None, such as a failed camera read, or that do not match the recording's shape are skipped and counted.
+    With a queue size, frames are encoded and written on a background thread so recording never stalls the caller,
+    and frames that arrive while the queue is full are dropped and counted instead.
+
+    :param path: The directory to record into.
+    :param camera_matrix: The camera's intrinsic calibration matrix, if known.
+    :param distortion: The camera's distortion coefficients, if known.
+    :param jpegQuality: The JPEG quality to store frames with, or None to store raw frames.
+    :param queueSize: The number of frames that can wait to be written on the background thread, or None to write them on the caller's thread.
+    """
+    def __init__(self, path: str, camera_matrix = None, distortion = None, jpegQuality: int = None, queueSize: int = None) -> None:
+        """
+        Constructor for the FrameRecorder class.
+
+        :param path: The directory to record into.
+        :param camera_matrix: The camera's intrinsic calibration matrix, if known.
+        :param distortion: The camera's distortion coefficients, if known.
+        :param jpegQuality: The JPEG quality to store frames with, or None to store raw frames.
+        :param queueSize: The number of frames that can wait to be written on the background thread, or None to write them on the caller's thread.
+        :raises ValueError: If the recording already holds frames stored in the other format.
+        """
+        # Localizes parameters
+        self.path          = path
+        self.camera_matrix = camera_matrix
+        self.distortion    = distortion
+        self.jpegQuality   = jpegQuality
+        self.queueSize     = queueSize
+
+        # Opens the recording for appending
+        os.makedirs(path, exist_ok = True)
+        self.framesFile = open(os.path.join(path, "frames.bin"), "ab")
+        self.indexFile  = open(os.path.join(path, "index.bin"), "ab")
+        self.offset     = self.framesFile.tell()
+        self.frameCount = self.indexFile.tell() // INDEX_DTYPE.itemsize
+        self.shape      = None
+
+        # Keeps the shape and format of the frames already in the recording, and its calibration if none was given
+        metadataPath = os.path.join(path, "metadata.npz")
+        if ((self.frameCount > 0) and (os.path.exists(metadataPath) == True)):
+            with np.load(metadataPath) as metadata:
+                if (bool(metadata["jpeg"]) != (jpegQuality is not None)):
+                    self.framesFile.close()
+                    self.indexFile.close()
+                    raise ValueError(f"The recording at {path} stores {'JPEG' if (bool(metadata['jpeg']) == True) else 'raw'} frames")
+                self.shape = tuple(int(size) for size in metadata["shape"])
+                if ((self.camera_matrix is None) and (metadata["camera_matrix"].size > 0)):
+                    self.camera_matrix = metadata["camera_matrix"]
+                if ((self.distortion is None) and (metadata["distortion"].size > 0)):
+                    self.distortion = metadata["distortion"]
+
+        # Variables
+        self.record        = np.zeros(1, dtype = INDEX_DTYPE)
+        self.skippedFrames = 0
+        self.droppedFrames = 0
+        self.logStatus     = False
+
+        # Starts the writer thread
+        self.queue  = None
+        self.writer = None
+        if (queueSize is not None):
+            self.queue  = queue.Queue(maxsize = queueSize)
+            self.writer = threading.Thread(target = self.writeQueued, name = "FrameRecorder", daemon = True)
+            self.writer.start()
+
+        # Updates log
+        Logger.logInfo("Recording to %s", True, path)
+
+    def writeFrame(self, frame, timestamp: float = None):
+        """
+        Appends a frame to the recording.
+
+        :param frame: The frame to record, or None to count a failed read.
+        :param timestamp: The time the frame was captured, from ``time.monotonic()``, or None to use the current time.
+        """
+        # Skips frames that were not read or that the recording cannot hold
+        if ((frame is None) or ((self.shape is not None) and (frame.shape != self.shape))):
+            self.skippedFrames += 1
+            Logger.logWarning("Frame skipped, %d frames skipped so far", self.logStatus, self.skippedFrames)
+            return
+
+        if (timestamp is None):
+            timestamp = time.monotonic()
+
+        # Stores the frame's shape with the first frame
+        if (self.shape is None):
+            self.shape = frame.shape
+            self.writeMetadata()
+
+        # Writes the frame on the caller's thread
+        if (self.queue is None):
+            self.storeFrame(frame, timestamp)
+            return
+
+        # Queues a copy of the frame, since the caller may reuse its buffer, or drops it if the writer is behind
+        try:
+            self.queue.put_nowait((frame.copy(), timestamp))
+        except queue.Full:
+            self.droppedFrames += 1
+            Logger.logWarning("Frame dropped, %d frames dropped so far", self.logStatus, self.droppedFrames)
+
+    def writeQueued(self):
+        """
+        Writes queued frames until the recording is closed.
+        This method runs on the writer thread.
+        """
+        while (True):
+            item = self.queue.get()
+            if (item is None):
+                return
+            self.storeFrame(*item)
+
+    def storeFrame(self, frame, timestamp: float):
+        """
+        Encodes a frame and appends it and its index record to the recording.
+
+        :param frame: The frame to store.
+        :param timestamp: The time the frame was captured, from ``time.monotonic()``.
+        """
+        # Encodes the frame
+        if (self.jpegQuality is not None):
+            ret, data = cv.imencode(".jpg", frame, [cv.IMWRITE_JPEG_QUALITY, self.jpegQuality])
+        else:
+            data = np.ascontiguousarray(frame)
+
+        # Appends the frame and its index record
+        self.framesFile.write(data.data)
+        self.record[0] = (self.offset, data.nbytes, timestamp)
+        self.indexFile.write(self.record.tobytes())
+        self.offset     += data.nbytes
+        self.frameCount += 1
+
+    def writeMetadata(self):
+        """
+        Writes the frame shape, format and calibration of the recording.
+        """
+        np.savez(
+            os.path.join(self.path, "metadata.npz"),
+            shape         = np.array(self.shape if (self.shape is not None) else [], dtype = np.int64),
+            jpeg          = np.array(self.jpegQuality is not None),
+            camera_matrix = np.array(self.camera_matrix if (self.camera_matrix is not None) else []),
+            distortion    = np.array(self.distortion if (self.distortion is not None) else [])
+        )
+
+    def getFrameCount(self) -> int:
+        """
+        Gets the number of frames in the recording.
+
+        :return: The number of frames.
+        """
+        return self.frameCount
+
+    def getSkippedFrames(self) -> int:
+        """
+        Gets the number of frames that were skipped because they were None or did not match the recording's shape.
+
+        :return: The number of skipped frames.
+        """
+        return self.skippedFrames
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of frames that were dropped because the writer thread's queue was full.
+
+        :return: The number of dropped frames.
+        """
+        return self.droppedFrames
+
+    def close(self):
+        """
+        Writes any queued frames, then flushes and closes the recording.
+        A recording closed before its first frame still gets its metadata, so it can be opened by ``FrameReplay``.
+        """
+        # Stops the writer thread once the queue is empty
+        if (self.writer is not None):
+            self.queue.put(None)
+            self.writer.join()
+            self.writer = None
+
+        self.framesFile.close()
+        self.indexFile.close()
+
+        if (os.path.exists(os.path.join(self.path, "metadata.npz")) == False):
+            self.writeMetadata()
+
+        # Updates log
+        Logger.logInfo("Recorded %d frames to %s, %d skipped, %d dropped", self.logStatus, self.frameCount, self.path, self.skippedFrames, self.droppedFrames)
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
+
+# Creates the FrameReplay class
+class FrameReplay:
+    """
+    Use this class to replay a recording made by ``FrameRecorder``.
+    The recording is memory-mapped, so raw frames are read straight from the file into one reused buffer without being read ahead.
+    It can stand in for a ``USBCamera`` or a ``cv2.VideoCapture`` as the source of ``Detector.detectTags``.
+
+    :param path: The directory of the recording.
+    :param realtime: Should frames be returned at the speed they were recorded, instead of as fast as possible.
+    :param loop: Should the replay start over once it reaches the end.
+    """
+    def __init__(self, path: str, realtime: bool = False, loop: bool = False) -> None:
+        """
+        Constructor for the FrameReplay class.
+
+        :param path: The directory of the recording.
+        :param realtime: Should frames be returned at the speed they were recorded, instead of as fast as possible.
+        :param loop: Should the replay start over once it reaches the end.
+        """
+        # Localizes parameters
+        self.path     = path
+        self.realtime = realtime
+        self.loop     = loop
+
+        # Loads the recording's shape, format and calibration
+        with np.load(os.path.join(path, "metadata.npz")) as metadata:
+            self.shape         = tuple(int(size) for size in metadata["shape"]) if (metadata["shape"].size > 0) else None
+            self.jpeg          = bool(metadata["jpeg"])
+            self.camera_matrix = metadata["camera_matrix"] if (metadata["camera_matrix"].size > 0) else None
+            self.distortion    = metadata["distortion"] if (metadata["distortion"].size > 0) else None
+
+        # Memory-maps the frames and the index. Empty files cannot be mapped, so a recording without frames is replayed from empty arrays
+        self.frames = self.mapFile("frames.bin", np.uint8)
+        self.index  = self.mapFile("index.bin", INDEX_DTYPE)
+
+        # Prealocates the buffer raw frames are copied into, so they can be drawn on like a camera's frames
+        self.buffer = np.zeros(self.shape, dtype = np.uint8) if ((self.shape is not None) and (self.jpeg == False)) else None
+
+        # Variables
+        self.position    = 0
+        self.stream      = None
+        self.captureTime  = 0.0
+        self.recordedTime = 0.0
+        self.startTime    = None
+        self.logStatus   = False
+
+    def mapFile(self, name: str, dtype):
+        """
+        Memory-maps a file of the recording.
+
+        :param name: The name of the file.
+        :param dtype: The type of the file's records.
+        :return: The read-only memory map, or an empty array if the file is empty.
+        """
+        filePath = os.path.join(self.path, name)
+        if ((os.path.exists(filePath) == False) or (os.path.getsize(filePath) == 0)):
+            return np.zeros(0, dtype = dtype)
+
+        return np.memmap(filePath, dtype = dtype, mode = "r")
+
+    def getFrame(self, position: int):
+        """
+        Gets a frame of the recording.
+        Raw frames are copied into a buffer that is reused by the next call, so copy the frame to keep it.
+
+        :param position: The number of the frame.
+        :return: The frame.
+        """
+        offset, size, timestamp = self.index[position]
+        data = self.frames[offset:offset + size]
+
+        if (self.jpeg == True):
+            return cv.imdecode(data, cv.IMREAD_UNCHANGED)
+
+        np.copyto(self.buffer, data.reshape(self.shape))
+
+        return self.buffer
+
+    def getStream(self):
+        """
+        Gets the next frame of the recording.
+
+        :return: The frame, or None once the recording has ended.
+        """
+        # Ends or starts over at the end of the recording
+        if (self.position >= len(self.index)):
+            if ((self.loop == False) or (len(self.index) == 0)):
+                self.stream = None
+                return None
+            self.position  = 0
+            self.startTime = None
+
+        # Waits until the frame's recorded time
+        timestamp = float(self.index[self.position]["timestamp"])
+        if (self.realtime == True):
+            if (self.startTime is None):
+                self.startTime = time.monotonic() - (timestamp - float(self.index[0]["timestamp"]))
+            captureTime = self.startTime + (timestamp - float(self.index[0]["timestamp"]))
+            delay = captureTime - time.monotonic()
+            if (delay > 0):
+                time.sleep(delay)
+        else:
+            # Frames come as fast as they are read, so each is captured when it is read, like a live camera
+            captureTime = time.monotonic()
+
+        # Reads the frame
+        self.stream       = self.getFrame(self.position)
+        self.captureTime  = captureTime
+        self.recordedTime = timestamp
+        self.position    += 1
+
+        return self.stream
+
+    def hasEnded(self) -> bool:
+        """
+        Gets if the replay has returned its last frame and will not start over.
+
+        :return: Has the replay ended?
+        """
+        return (self.position >= len(self.index)) and ((self.loop == False) or (len(self.index) == 0))
+
+    def read(self):
+        """
+        Reads the next frame. Mirrors ``cv2.VideoCapture.read()`` so this class can stand in for a capture.
+
+        :return: If a frame was read.
+        :return: The frame.
+        """
+        stream = self.getStream()
+
+        return (stream is not None), stream
+
+    def __iter__(self):
+        # Yields each frame with its capture time
+        while (True):
+            stream = self.getStream()
+            if (stream is None):
+                return
+            yield stream, self.captureTime
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def seek(self, position: int):
+        """
+        Moves the replay to a frame.
+
+        :param position: The number of the frame to return next.
+        """
+        self.position  = position
+        self.startTime = None
+
+    def getCaptureTime(self) -> float:
+        """
+        Gets the capture time of the last frame on the current clock, so it can be published like a live camera's.
+        When replaying in realtime, this is when the frame is due since the replay started, otherwise it is when the frame was read.
+
+        :return: The capture time in seconds, from ``time.monotonic()``.
+        """
+        return self.captureTime
+
+    def getRecordedTime(self) -> float:
+        """
+        Gets the capture time of the last frame as it was recorded.
+
+        :return: The capture time in seconds, from ``time.monotonic()`` when it was recorded.
+        """
+        return self.recordedTime
+
+    def getMatrix(self):
+        """
+        Gets the intrinsic camera matrix stored with the recording.
+
+        :return: The camera's intrinsic matrix, or None if it was not recorded.
+        """
+        return self.camera_matrix
+
+    def getDistortion(self):
+        """
+        Gets the distortion coefficients stored with the recording.
+
+        :return: The camera's distortion coefficients, or None if they were not recorded.
+        """
+        return self.distortion
+
+    def getResolution(self):
+        """
+        Gets the resolution of the recording.
+
+        :return: The resolution (width, height), or None if the recording has no frames.
+        """
+        if (self.shape is None):
+            return None
+
+        return (self.shape[1], self.shape[0])
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
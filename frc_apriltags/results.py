@@ -0,0 +1,135 @@
+# Import Libraries
+import numpy as np
+from   wpimath.geometry import *
+
+# Creates the TagResult class
+class TagResult:
+    """
+    Use this class to access a tag detected by the Detector class.
+    It can be used like the ``[tagId, pose3d]`` pair the Detector used to return, but the ``Pose3d`` is only built when it is asked for.
+
+    :param id: The id of the AprilTag.
+    :param translation: The field relative x, y and z of the tag in meters.
+    :param rotation: The field relative roll, pitch and yaw of the tag in radians.
+    :param poseMatrix: The 3x4 pose of the tag relative to the camera.
+    :param detection: The ``pupil_apriltags`` detection of the tag.
+    """
+    def __init__(self, id: int, translation, rotation, poseMatrix = None, detection = None) -> None:
+        """
+        Constructor for the TagResult class.
+
+        :param id: The id of the AprilTag.
+        :param translation: The field relative x, y and z of the tag in meters.
+        :param rotation: The field relative roll, pitch and yaw of the tag in radians.
+        :param poseMatrix: The 3x4 pose of the tag relative to the camera.
+        :param detection: The ``pupil_apriltags`` detection of the tag.
+        """
+        # Localizes parameters
+        self.id          = id
+        self.translation = translation
+        self.rotation    = rotation
+        self.poseMatrix  = poseMatrix
+        self.detection   = detection
+
+        # The Pose3d is built on request
+        self.pose3d = None
+
+        # The number of frames since the tag was detected, which grows while a ``FrameGate`` reuses the result
+        self.age = 0
+
+    def getId(self) -> int:
+        """
+        Gets the id of the tag.
+
+        :return: The id of the AprilTag.
+        """
+        return self.id
+
+    def getPose3d(self) -> Pose3d:
+        """
+        Gets the field relative pose of the tag, building it the first time it is asked for.
+
+        :return: A WPILib ``Pose3d`` object.
+        """
+        if (self.pose3d is None):
+            self.pose3d = Pose3d(
+                Translation3d(self.translation[0], self.translation[1], self.translation[2]),
+                Rotation3d(self.rotation[0], self.rotation[1], self.rotation[2])
+            )
+
+        return self.pose3d
+
+    def getAge(self) -> int:
+        """
+        Gets how many frames ago the tag was detected.
+
+        :return: 0 if the tag was detected in the last frame, otherwise the number of frames the result has been reused for.
+        """
+        return self.age
+
+    def getDecisionMargin(self) -> float:
+        """
+        Gets the decision margin of the tag's decode.
+
+        :return: The decision margin, or 0 if the detection is not known.
+        """
+        if (self.detection is None):
+            return 0.0
+
+        return self.detection.decision_margin
+
+    def __getitem__(self, index: int):
+        # Matches the old [tagId, pose3d] results
+        return (self.id, self.getPose3d())[index]
+
+    def __iter__(self):
+        return iter((self.id, self.getPose3d()))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __repr__(self) -> str:
+        return f"TagResult(id={self.id}, translation={self.translation}, rotation={self.rotation})"
+
+def getFieldPoses(poseMatrices):
+    """
+    Converts a batch of ``pupil_apriltags`` poses into field relative translations and rotations in one pass.
+    This gives the same values as ``Detector.getPose3D`` without creating any WPILib objects.
+
+    :param poseMatrices: An (N, 3, 4) array of tag poses relative to the camera.
+    :return: An (N, 3) array of x, y and z translations in meters.
+    :return: An (N, 3) array of roll, pitch and yaw rotations in radians.
+    """
+    poseMatrices = np.asarray(poseMatrices, dtype = np.float64).reshape(-1, 3, 4)
+
+    # Gets the tag's roll, pitch and yaw in the AprilTags WCS the same way Rotation3d does
+    tempRoll  = np.arctan2(poseMatrices[:, 2, 1], poseMatrices[:, 2, 2])
+    tempPitch = -np.arcsin(np.clip(poseMatrices[:, 2, 0], -1.0, 1.0))
+    tempYaw   = np.arctan2(poseMatrices[:, 1, 0], poseMatrices[:, 0, 0])
+
+    # Get the camera's measured X, Y, and Z
+    tempX = poseMatrices[:, 2, 3]
+    tempY = -poseMatrices[:, 0, 3]
+    tempZ = -poseMatrices[:, 1, 3]
+
+    # Rotation3d(yaw, -roll, -pitch) normalizes its angles, so they are read back from the rotation matrix it would build
+    sinA, cosA = np.sin(tempYaw), np.cos(tempYaw)
+    sinB, cosB = np.sin(-tempRoll), np.cos(-tempRoll)
+    sinC, cosC = np.sin(-tempPitch), np.cos(-tempPitch)
+
+    rotations = np.empty((len(poseMatrices), 3))
+    rotations[:, 0] = np.arctan2(cosB * sinA, cosB * cosA)
+    rotations[:, 1] = np.arcsin(np.clip(sinB, -1.0, 1.0))
+    rotations[:, 2] = np.arctan2(sinC * cosB, cosC * cosB)
+
+    # Calulates the field relative X and Y coordinate
+    translations = np.empty((len(poseMatrices), 3))
+    cosYaw, sinYaw = np.cos(rotations[:, 2]), np.sin(rotations[:, 2])
+    translations[:, 0] = tempX * cosYaw + tempY * sinYaw
+    translations[:, 1] = tempY * cosYaw - tempX * sinYaw
+
+    # Calulates the field relative Z coordinate
+    angle = np.pi + rotations[:, 1]
+    translations[:, 2] = tempX * np.sin(angle) + tempZ * np.cos(angle)
+
+    return translations, rotations
@@ -0,0 +1,480 @@
+# Import Libraries
+import time
+import queue
+import cv2   as cv
+import numpy as np
+import multiprocessing
+from   multiprocessing import shared_memory
+from   .results        import TagResult, getFieldPoses
+
+# Import Utilities
+from .Utilities import Logger
+
+# The header of each slot: the number of the frame in it, or -1 while it is being written, and when the frame was captured
+SLOT_DTYPE = np.dtype([("sequence", "<i8"), ("timestamp", "<f8")])
+
+# The compact result of each tag sent back by a worker. The field names match ``pupil_apriltags`` detections, so a record can stand in for one
+RESULT_DTYPE = np.dtype([
+    ("tag_id",          "<i4"),
+    ("hamming",         "<i4"),
+    ("decision_margin", "<f4"),
+    ("pose_err",        "<f8"),
+    ("center",          "<f8", (2,)),
+    ("corners",         "<f8", (4, 2)),
+    ("pose",            "<f8", (3, 4))
+])
+
+# Creates the SharedFrameRing class
+class SharedFrameRing:
+    """
+    Use this class to share frames between processes without copying or pickling them.
+    Frames are written into a ring of slots in shared memory, and other processes read them as NumPy views of the same memory.
+    Every frame has a sequence number, so a reader can tell when the slot it is reading has been overwritten by a newer frame.
+    The slot headers are only read and written under a lock shared by every process. Taking the lock is a full memory barrier,
+    so on weakly ordered CPUs such as the Jetson's ARM cores a reader never sees a slot's sequence number before the frame and timestamp written ahead of it.
+
+    :param shape: The shape of each frame, such as (height, width, 3).
+    :param slots: The number of frames the ring holds before the oldest is overwritten.
+    :param name: The name of an existing ring to attach to, or None to create a new ring.
+    :param dtype: The data type of each frame.
+    :param lock: The lock of the ring being attached to, or None to create a new ring.
+    """
+    def __init__(self, shape: tuple, slots: int = 4, name: str = None, dtype = np.uint8, lock = None) -> None:
+        """
+        Constructor for the SharedFrameRing class.
+
+        :param shape: The shape of each frame, such as (height, width, 3).
+        :param slots: The number of frames the ring holds before the oldest is overwritten.
+        :param name: The name of an existing ring to attach to, or None to create a new ring.
+        :param dtype: The data type of each frame.
+        :param lock: The lock of the ring being attached to, or None to create a new ring.
+        """
+        # Localizes parameters
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        self.owner = (name is None)
+
+        # Guards the slot headers. The lock can be handed to spawned processes, such as the workers of ``DetectorPool``
+        self.lock = lock if (lock is not None) else multiprocessing.get_context("spawn").Lock()
+
+        # Lays out the slot headers, then each frame on a cache line boundary
+        headerBytes = SLOT_DTYPE.itemsize * slots
+        self.frameOffset = -(-headerBytes // 64) * 64
+        self.frameBytes  = -(-int(np.prod(self.shape)) * self.dtype.itemsize // 64) * 64
+        size = self.frameOffset + self.frameBytes * slots
+
+        # Creates or attaches to the shared memory
+        if (self.owner == True):
+            self.memory = shared_memory.SharedMemory(create = True, size = size)
+        else:
+            # Only the creator should free the memory. Before Python 3.13 attaching always tracks it, which is harmless for processes spawned by the creator since they share its tracker
+            try:
+                self.memory = shared_memory.SharedMemory(name = name, track = False)
+            except TypeError:
+                self.memory = shared_memory.SharedMemory(name = name)
+
+        # Views of the headers and frames
+        self.headers = np.ndarray((slots,), dtype = SLOT_DTYPE, buffer = self.memory.buf)
+        self.frames  = [np.ndarray(self.shape, dtype = self.dtype, buffer = self.memory.buf, offset = self.frameOffset + i * self.frameBytes) for i in range(slots)]
+
+        # Starts with every slot empty
+        if (self.owner == True):
+            self.headers["sequence"]  = -1
+            self.headers["timestamp"] = 0.0
+
+        # Variables
+        self.sequence  = 0
+        self.logStatus = False
+
+    def getSpec(self) -> tuple:
+        """
+        Gets what another process needs to attach to this ring.
+        The lock can only be pickled while a process is being started, so the spec must be passed as one of its arguments.
+
+        :return: A (shape, slots, name, dtype, lock) tuple to pass to the constructor.
+        """
+        return (self.shape, self.slots, self.memory.name, self.dtype.str, self.lock)
+
+    def beginWrite(self):
+        """
+        Claims the next slot so a frame can be written straight into it, such as with ``cv2.VideoCapture.retrieve``.
+        The slot is invalid until ``endWrite`` is called.
+
+        :return: The sequence number of the frame.
+        :return: The slot's frame array to write into.
+        """
+        sequence = self.sequence
+        slot     = sequence % self.slots
+        with self.lock:
+            self.headers["sequence"][slot] = -1
+
+        return sequence, self.frames[slot]
+
+    def endWrite(self, sequence: int, timestamp: float = None):
+        """
+        Publishes a frame written after ``beginWrite``.
+
+        :param sequence: The sequence number returned by ``beginWrite``.
+        :param timestamp: The time the frame was captured, from ``time.monotonic()``, or None to use the current time.
+        """
+        slot = sequence % self.slots
+        with self.lock:
+            self.headers["timestamp"][slot] = timestamp if (timestamp is not None) else time.monotonic()
+            self.headers["sequence"][slot]  = sequence
+        self.sequence = sequence + 1
+
+    def write(self, frame, timestamp: float = None) -> int:
+        """
+        Copies a frame into the next slot.
+
+        :param frame: The frame, with the ring's shape.
+        :param timestamp: The time the frame was captured, from ``time.monotonic()``, or None to use the current time.
+        :return: The sequence number of the frame.
+        """
+        sequence, slotFrame = self.beginWrite()
+        np.copyto(slotFrame, frame)
+        self.endWrite(sequence, timestamp)
+
+        return sequence
+
+    def read(self, sequence: int):
+        """
+        Gets a frame without copying it.
+        The view is only trustworthy while ``isValid`` returns True, so check it again once the frame has been used.
+
+        :param sequence: The sequence number of the frame.
+        :return: A view of the frame, or None if it has been overwritten.
+        :return: The time the frame was captured.
+        """
+        slot = sequence % self.slots
+        with self.lock:
+            timestamp = float(self.headers["timestamp"][slot])
+            valid     = (int(self.headers["sequence"][slot]) == sequence)
+        if (valid == False):
+            return None, 0.0
+
+        return self.frames[slot], timestamp
+
+    def isValid(self, sequence: int) -> bool:
+        """
+        Gets if a frame is still in its slot.
+
+        :param sequence: The sequence number of the frame.
+        :return: Has the frame not been overwritten?
+        """
+        with self.lock:
+            return int(self.headers["sequence"][sequence % self.slots]) == sequence
+
+    def close(self):
+        """
+        Detaches from the shared memory, and frees it if this ring created it.
+        """
+        # Drops the views so the memory can be released
+        self.headers = None
+        self.frames  = []
+        self.memory.close()
+        if (self.owner == True):
+            self.memory.unlink()
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
+
+def detectorWorker(ringSpecs: list, detectorArgs: dict, tasks, results):
+    """
+    Detects tags in frames from shared rings until it is sent None.
+    This runs in the worker processes of ``DetectorPool``. The workers only find tags, so their detectors never publish anything.
+
+    :param ringSpecs: The ``getSpec()`` of every ring.
+    :param detectorArgs: The keyword arguments of the ``Detector``, except for ``comms``.
+    :param tasks: The queue of (ring, sequence, camera_matrix, distortion) tasks.
+    :param results: The queue to send (ring, sequence, timestamp, results) back on. Results are None if the frame was overwritten, or the error message if detection raised.
+    """
+    from .apriltags      import Detector
+    from .communications import NullCommunications
+
+    # Attaches to every ring
+    rings = [SharedFrameRing(*spec) for spec in ringSpecs]
+    detector = Detector(**dict(detectorArgs, comms = NullCommunications()))
+
+    while (True):
+        task = tasks.get()
+        if (task is None):
+            break
+        ringIndex, sequence, camera_matrix, distortion = task
+        timestamp = 0.0
+
+        # Always answers the task, so the pool never waits on a frame that failed
+        try:
+            results.put((ringIndex, sequence) + detectFrame(rings[ringIndex], sequence, detector, camera_matrix, distortion))
+        except Exception as e:
+            results.put((ringIndex, sequence, timestamp, f"{type(e).__name__}: {e}"))
+
+    for ring in rings:
+        ring.close()
+
+def detectFrame(ring, sequence: int, detector, camera_matrix, distortion):
+    """
+    Detects tags in a frame of a shared ring and packs the results.
+    This runs in the worker processes of ``DetectorPool``.
+
+    :param ring: The ``SharedFrameRing`` holding the frame.
+    :param sequence: The sequence number of the frame.
+    :param detector: The worker's ``Detector``.
+    :param camera_matrix: The camera's intrinsic calibration matrix.
+    :param distortion: The camera's distortion coefficients, or None if the frame is already undistorted.
+    :return: The time the frame was captured.
+    :return: The packed results, or None if the frame was overwritten.
+    """
+    # Reads the frame. A color frame is converted into a private grayscale copy, after which the slot may be overwritten
+    frame, timestamp = ring.read(sequence)
+    if ((frame is not None) and (frame.ndim == 3)):
+        frame = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        if (ring.isValid(sequence) == False):
+            frame = None
+
+    if (frame is None):
+        return timestamp, None
+
+    detections, poseMatrices = detector.findTags(frame, camera_matrix, distortion)
+
+    # Throws out the results if the frame was overwritten while it was being read
+    if (ring.isValid(sequence) == False):
+        return timestamp, None
+
+    # Packs the results
+    packed = np.zeros(len(detections), dtype = RESULT_DTYPE)
+    for i, tag in enumerate(detections):
+        packed[i] = (tag.tag_id, tag.hamming, tag.decision_margin, tag.pose_err, tag.center, tag.corners, poseMatrices[i])
+
+    return timestamp, packed
+
+# Creates the DetectorPool class
+class DetectorPool:
+    """
+    Use this class to detect tags on several processes, so detection is not limited to one core by Python's GIL.
+    Frames are handed to the workers through ``SharedFrameRing`` objects, and only their sequence numbers and the compact results are sent between processes.
+    A frame is only submitted when a worker is free, so the workers always detect the newest frames.
+    Frames whose detection raised are counted and logged, and if a worker dies the pool is restarted.
+    The workers are spawned, so they import the ``__main__`` script that created the pool. That script must create the pool under ``if __name__ == "__main__":``,
+    or every worker runs the whole script again.
+
+    :param rings: The ``SharedFrameRing`` of each camera.
+    :param workers: The number of worker processes, or None for one per core.
+    :param detectorArgs: The keyword arguments of each worker's ``Detector``. The workers never publish, so ``comms`` is ignored.
+    """
+    def __init__(self, rings: list, workers: int = None, detectorArgs: dict = None) -> None:
+        """
+        Constructor for the DetectorPool class.
+
+        :param rings: The ``SharedFrameRing`` of each camera.
+        :param workers: The number of worker processes, or None for one per core.
+        :param detectorArgs: The keyword arguments of each worker's ``Detector``. The workers never publish, so ``comms`` is ignored.
+        """
+        # Localizes parameters
+        self.rings        = rings
+        self.workers      = workers if (workers is not None) else (multiprocessing.cpu_count() or 1)
+        self.detectorArgs = detectorArgs if (detectorArgs is not None) else {}
+
+        # Spawned workers start clean instead of inheriting the capture's state
+        self.context   = multiprocessing.get_context("spawn")
+        self.tasks     = self.context.Queue()
+        self.results   = self.context.Queue()
+        self.processes = []
+        self.ringSpecs = []
+
+        # Frame bookkeeping
+        self.inFlight       = 0
+        self.droppedFrames  = 0
+        self.overwritten    = 0
+        self.finishedFrames = 0
+        self.failedFrames   = 0
+        self.restarts       = 0
+
+        # Variables
+        self.logStatus = False
+
+    def start(self):
+        """
+        Starts the worker processes.
+
+        :return: This ``DetectorPool``.
+        """
+        self.ringSpecs = [ring.getSpec() for ring in self.rings]
+        self.processes = [self.startWorker(i) for i in range(self.workers)]
+
+        # Updates log
+        Logger.logInfo("Detector pool started with %d workers", self.logStatus, self.workers)
+
+        return self
+
+    def startWorker(self, index: int):
+        """
+        Starts a worker process.
+
+        :param index: The number of the worker.
+        :return: The worker's process.
+        """
+        process = self.context.Process(target = detectorWorker, args = (self.ringSpecs, self.detectorArgs, self.tasks, self.results), name = f"DetectorPool-{index}", daemon = True)
+        process.start()
+
+        return process
+
+    def checkWorkers(self):
+        """
+        Restarts the workers if any of them died.
+        A worker killed while waiting for a task can leave the queues locked, so every worker is restarted on new queues and the frames in flight are dropped.
+        """
+        dead = [i for i, process in enumerate(self.processes) if (process.is_alive() == False)]
+        if (len(dead) == 0):
+            return
+
+        # Updates log
+        Logger.logError("Detector pool workers %s died with exit codes %s, restarting the pool", True, dead, [self.processes[i].exitcode for i in dead])
+
+        # Replaces the workers and their queues
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self.tasks     = self.context.Queue()
+        self.results   = self.context.Queue()
+        self.processes = [self.startWorker(i) for i in range(self.workers)]
+
+        # The frames in flight will never be answered
+        self.droppedFrames += self.inFlight
+        self.inFlight       = 0
+        self.restarts      += 1
+
+    def stop(self):
+        """
+        Stops the worker processes once they finish their frames.
+        """
+        for process in self.processes:
+            self.tasks.put(None)
+        for process in self.processes:
+            process.join()
+        self.processes = []
+
+        # Updates log
+        Logger.logInfo("Detector pool stopped", self.logStatus)
+
+    def submit(self, ringIndex: int, sequence: int, camera_matrix, distortion = None) -> bool:
+        """
+        Hands a frame to a free worker.
+        If every worker is busy the frame is dropped, since a newer frame will be ready by the time one is free.
+
+        :param ringIndex: The index of the frame's ring.
+        :param sequence: The sequence number of the frame.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param distortion: The camera's distortion coefficients, or None if the frame is already undistorted.
+        :return: Was the frame handed to a worker?
+        """
+        self.checkWorkers()
+        if (self.inFlight >= self.workers):
+            self.droppedFrames += 1
+            return False
+
+        self.tasks.put((ringIndex, sequence, np.asarray(camera_matrix, dtype = np.float64), distortion))
+        self.inFlight += 1
+
+        return True
+
+    def getResults(self, timeout: float = 0.0):
+        """
+        Gets the results of a finished frame.
+
+        :param timeout: The longest time to wait for a frame to finish in seconds, or None to wait forever.
+        :return: The index of the frame's ring, or None if no frame finished in time.
+        :return: The time the frame was captured.
+        :return: A list of ``TagResult`` objects.
+        :return: The result with the best decision margin, or None if no tag was seen.
+        """
+        self.checkWorkers()
+        while (True):
+            # Waits for a frame to finish
+            try:
+                if (timeout == 0.0):
+                    ringIndex, sequence, timestamp, packed = self.results.get_nowait()
+                else:
+                    ringIndex, sequence, timestamp, packed = self.results.get(timeout = timeout)
+            except queue.Empty:
+                return None, 0.0, [], None
+            self.inFlight -= 1
+
+            # Skips frames that were overwritten before they were detected
+            if (packed is None):
+                self.overwritten += 1
+                continue
+
+            # Skips frames whose detection raised
+            if (isinstance(packed, str) == True):
+                self.failedFrames += 1
+                Logger.logError("Detector pool failed to detect frame %d: %s", True, sequence, packed)
+                continue
+            self.finishedFrames += 1
+
+            # Builds the results. Each record stands in for the pupil_apriltags detection
+            packed = packed.view(np.recarray)
+            translations, rotations = getFieldPoses(packed.pose)
+            results = [TagResult(int(tag.tag_id), translations[i], rotations[i], tag.pose, tag) for i, tag in enumerate(packed)]
+            best = max(results, key = lambda result: result.getDecisionMargin()) if (len(results) > 0) else None
+
+            return ringIndex, timestamp, results, best
+
+    def getInFlight(self) -> int:
+        """
+        Gets the number of frames being detected.
+
+        :return: The number of busy workers.
+        """
+        return self.inFlight
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of frames dropped because every worker was busy.
+
+        :return: The number of dropped frames.
+        """
+        return self.droppedFrames
+
+    def getOverwrittenFrames(self) -> int:
+        """
+        Gets the number of frames overwritten in their ring before a worker finished reading them.
+        If this grows, the rings need more slots.
+
+        :return: The number of overwritten frames.
+        """
+        return self.overwritten
+
+    def getFailedFrames(self) -> int:
+        """
+        Gets the number of frames whose detection raised an error.
+
+        :return: The number of failed frames.
+        """
+        return self.failedFrames
+
+    def getRestarts(self) -> int:
+        """
+        Gets the number of times the pool was restarted because a worker died.
+
+        :return: The number of restarts.
+        """
+        return self.restarts
+
+    def getFinishedFrames(self) -> int:
+        """
+        Gets the number of frames detected.
+
+        :return: The number of frames.
+        """
+        return self.finishedFrames
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
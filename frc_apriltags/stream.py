@@ -1,9 +1,12 @@
 # Import Libraries
+import time
 import numpy as np
 from   cscore import CameraServer as CS
 
 # Import Utilities
-from .Utilities import Logger
+from .Utilities import Logger, Profiler
+from .output    import ThreadedOutput
+from .recording import FrameRecorder
 
 # Creates the BasicStreaming Class
 class Streaming():
@@ -14,8 +17,11 @@ class Streaming():
     :param path: Can be found on Linux by running ``find /dev/v4l``.
     :param resolution: Width by height.
     :param fps: Frames per second.
+    :param threaded: Should processed frames be downscaled and sent from a background thread.
+    :param outputResolution: The width by height of the sent frames when threaded. Defaults to the camera resolution.
+    :param bitrate: The bandwidth budget of the sent stream in bits per second when threaded, or None for no budget.
     """
-    def __init__(self, camNum: int, path: str = None, resolution: tuple = (640, 480), fps: int = 15) -> None:
+    def __init__(self, camNum: int, path: str = None, resolution: tuple = (640, 480), fps: int = 15, threaded: bool = False, outputResolution: tuple = None, bitrate: float = None) -> None:
         """
         Constructor for the BasicStreaming class.
 
@@ -23,9 +29,18 @@ class Streaming():
         :param path: Can be found on Linux by running ``find /dev/v4l``.
         :param resolution: Width by height.
         :param fps: Frames per second.
+        :param threaded: Should processed frames be downscaled and sent from a background thread.
+        :param outputResolution: The width by height of the sent frames when threaded. Defaults to the camera resolution.
+        :param bitrate: The bandwidth budget of the sent stream in bits per second when threaded, or None for no budget.
         """
+        # Times the initialization
+        startTime = time.monotonic()
+
         # Variables
         self.resolution = resolution
+        self.output     = None
+        self.recorder   = None
+        self.logStatus  = False
 
         # Creates a CameraServer
         CS.enableLogging()
@@ -44,14 +59,30 @@ class Streaming():
         self.sink = CS.getVideo(self.camera)
 
         # Creates an output stream
-        self.outputStream = CS.putVideo(name = "Processed Camera" + str(camNum), width = resolution[0], height = resolution[1])
+        if (threaded == True):
+            # Frames are downscaled, decimated and sent with an adaptive quality on the output thread
+            outputResolution  = outputResolution if (outputResolution is not None) else resolution
+            self.outputStream = CS.putVideo(name = "Processed Camera" + str(camNum), width = outputResolution[0], height = outputResolution[1])
+            server            = CS.getServer("serve_Processed Camera" + str(camNum))
+            self.output       = ThreadedOutput(self.outputStream, server, outputResolution, fps, bitrate).start()
+        else:
+            self.outputStream = CS.putVideo(name = "Processed Camera" + str(camNum), width = resolution[0], height = resolution[1])
 
         # Preallocates for images
         self.img = self.prealocateSpace()
 
         # Updates log
-        Logger.logInfo("Stream initialized for camera" + str(camNum), True)
+        self.initTime = time.monotonic() - startTime
+        Logger.logInfo("Stream initialized for camera %s in %.2f seconds", True, camNum, self.initTime)
     
+    def getInitTime(self) -> float:
+        """
+        Gets how long the stream took to start.
+
+        :return: The initialization time in seconds.
+        """
+        return self.initTime
+
     def prealocateSpace(self):
         """
         Prealocates space for the stream.
@@ -66,15 +97,21 @@ class Streaming():
 
         :return: A frame.
         """
-        time, self.img = self.sink.grabFrame(self.img)
+        frameTime, self.img = self.sink.grabFrame(self.img)
+
+        # Tees the frame into the recording
+        if (self.recorder is not None):
+            self.recorder.writeFrame(self.img, time.monotonic())
 
         return self.img
 
-    def streamImage(self, image):
+    def streamImage(self, image, overlay = None):
         """
         Streams the camera back to ShuffleBoard for driver use.
+        When threaded, this only hands the image to the output thread and returns immediately.
 
         :param img: A processed stream.
+        :param overlay: A function that takes the sent frame and its scale and draws onto it, such as from ``TagVisualizer.getOverlay``. When threaded, it runs on the output thread after the frame is downscaled.
         :return: The processed stream.
         """
         # Variables
@@ -87,10 +124,60 @@ class Streaming():
             img = self.getStream()
 
         # Sends a processed image back to ShuffleBoard
-        self.outputStream.putFrame(img)
+        putStart = Profiler.now()
+        if (self.output is not None):
+            self.output.putFrame(img, overlay)
+        else:
+            if (overlay is not None):
+                overlay(img, 1.0)
+            self.outputStream.putFrame(img)
+        Profiler.record("stream.put", putStart)
 
         return img
 
+    def enableRecording(self, path: str, jpegQuality: int = None):
+        """
+        Records every frame grabbed from the stream so it can be replayed with ``FrameReplay``.
+
+        :param path: The directory to record into.
+        :param jpegQuality: The JPEG quality to store frames with, or None to store raw frames.
+        """
+        self.recorder = FrameRecorder(path, jpegQuality = jpegQuality)
+
+    def disableRecording(self):
+        """
+        Stops recording and closes the recording.
+        """
+        if (self.recorder is not None):
+            self.recorder.close()
+            self.recorder = None
+
+    def release(self):
+        """
+        Stops recording and the output thread, and removes the camera and output stream from the ``CameraServer``.
+        """
+        self.disableRecording()
+        if (self.output is not None):
+            self.output.stop()
+            self.output = None
+        CS.removeCamera(self.camera.getName())
+        CS.removeCamera(self.outputStream.getName())
+
+        # Updates log
+        Logger.logInfo("Stream released", self.logStatus)
+
+    def getDroppedFrames(self) -> int:
+        """
+        Gets the number of processed frames that were replaced before the output thread could send them.
+        This is always 0 when the stream is not threaded.
+
+        :return: The number of dropped frames.
+        """
+        if (self.output is None):
+            return 0
+
+        return self.output.getDroppedFrames()
+
     def enableLogging(self):
         """
         Enables logging for this class.
@@ -0,0 +1,124 @@
+# Import Libraries
+import numpy as np
+
+# Import Utilities
+from .Utilities import Logger
+
+# Creates the TagTracker class
+class TagTracker:
+    """
+    Use this class to predict where tags will be in the next frame so detection can run on small regions instead of the full frame.
+
+    :param reacquireInterval: A full-frame scan runs at least once every this many frames.
+    :param padding: How far to grow each predicted region, as a fraction of the tag's size in pixels.
+    :param minPadding: The smallest padding around a predicted region in pixels.
+    :param maxAge: Tracks that have not been seen for this many seconds are dropped.
+    """
+    def __init__(self, reacquireInterval: int = 15, padding: float = 0.5, minPadding: int = 16, maxAge: float = 0.25) -> None:
+        """
+        Constructor for the TagTracker class.
+
+        :param reacquireInterval: A full-frame scan runs at least once every this many frames.
+        :param padding: How far to grow each predicted region, as a fraction of the tag's size in pixels.
+        :param minPadding: The smallest padding around a predicted region in pixels.
+        :param maxAge: Tracks that have not been seen for this many seconds are dropped.
+        """
+        # Localizes parameters
+        self.reacquireInterval = reacquireInterval
+        self.padding           = padding
+        self.minPadding        = minPadding
+        self.maxAge            = maxAge
+
+        # Per-tag state. Each track stores its corners, the corner velocity in pixels per second, and when it was last seen
+        self.tracks = {}
+
+        # Variables
+        self.framesSinceScan = 0
+        self.trackLost       = False
+        self.logStatus       = False
+
+    def needsFullScan(self) -> bool:
+        """
+        Gets if the next frame should be scanned in full.
+
+        :return: Should the full frame be scanned?
+        """
+        return (len(self.tracks) == 0) or (self.trackLost == True) or (self.framesSinceScan >= self.reacquireInterval)
+
+    def predictRegions(self, resolution: tuple, timestamp: float):
+        """
+        Predicts a padded region around where each tracked tag will be.
+
+        :param resolution: The resolution of the frame (width, height).
+        :param timestamp: The time of the frame in seconds.
+        :return: A list of regions as (x, y, width, height) in pixels.
+        """
+        regions = []
+        for id, (corners, velocity, lastSeen) in self.tracks.items():
+            # Moves the corners by the tag's velocity
+            predicted = corners + velocity * (timestamp - lastSeen)
+
+            # Grows the bounding box of the predicted corners
+            low  = predicted.min(axis = 0)
+            high = predicted.max(axis = 0)
+            pad  = max(self.padding * np.max(high - low), self.minPadding)
+            low  = np.floor(low - pad).astype(int)
+            high = np.ceil(high + pad).astype(int)
+
+            # Keeps the region inside the frame
+            x0, y0 = max(low[0], 0), max(low[1], 0)
+            x1, y1 = min(high[0], resolution[0]), min(high[1], resolution[1])
+            if ((x1 > x0) and (y1 > y0)):
+                regions.append((x0, y0, x1 - x0, y1 - y0))
+
+        return regions
+
+    def update(self, detections, timestamp: float, fullScan: bool):
+        """
+        Updates the tracks with the detections from a frame.
+
+        :param detections: The detections found in the frame, with corners in full-frame coordinates.
+        :param timestamp: The time of the frame in seconds.
+        :param fullScan: Was the full frame scanned?
+        """
+        # Counts frames since the last full scan
+        if (fullScan == True):
+            self.framesSinceScan = 0
+        else:
+            self.framesSinceScan += 1
+
+        # Updates the tracks of the tags that were seen
+        seen = set()
+        for tag in detections:
+            corners = np.asarray(tag.corners, dtype = np.float64)
+            if (tag.tag_id in self.tracks):
+                lastCorners, velocity, lastSeen = self.tracks[tag.tag_id]
+                dt = timestamp - lastSeen
+                if (dt > 0):
+                    velocity = (corners - lastCorners) / dt
+            else:
+                velocity = np.zeros((4, 2))
+
+            self.tracks[tag.tag_id] = (corners, velocity, timestamp)
+            seen.add(tag.tag_id)
+
+        # A tracked tag that was searched for and not found forces a full scan
+        self.trackLost = any(id not in seen for id in self.tracks)
+
+        # Drops tracks that have not been seen recently
+        for id in [id for id, track in self.tracks.items() if (timestamp - track[2] > self.maxAge)]:
+            del self.tracks[id]
+            Logger.logDebug("Track lost for tag %d", self.logStatus, id)
+
+    def reset(self):
+        """
+        Drops all tracks so the next frame is scanned in full.
+        """
+        self.tracks = {}
+        self.trackLost = False
+
+    def enableLogging(self):
+        """
+        Enables logging for this class.
+        """
+        self.logStatus = True
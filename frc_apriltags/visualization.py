@@ -0,0 +1,120 @@
+# Import Libraries
+import cv2   as cv
+import numpy as np
+
+# Import Utilities
+from .Utilities import Units
+
+# The colors of the pose box and the x, y and z axes (BGR)
+BOX_COLOR  = (0, 255, 0)
+AXIS_COLOR = ((0, 0, 255), (0, 255, 0), (255, 0, 0))
+
+# The number of fractional bits of the points handed to cv.polylines, so downscaled drawings keep sub-pixel accuracy
+SHIFT = 4
+
+# Creates the TagVisualizer class
+class TagVisualizer:
+    """
+    Use this class to draw the pose box and axes of every detected tag.
+    The model of the box and axes is built once for the tag size, every tag is projected with one ``cv.projectPoints`` call,
+    and all the lines of each color are drawn with one ``cv.polylines`` call.
+    Projection and drawing are separate, so the lines can be drawn later, such as on a downscaled frame on the output thread.
+
+    :param size: The size of the AprilTag in inches.
+    """
+    def __init__(self, size: int = 6) -> None:
+        """
+        Constructor for the TagVisualizer class.
+
+        :param size: The size of the AprilTag in inches.
+        """
+        halfSize = Units.inchesToMeters(size) / 2
+
+        # The tag's face, the face of the box a tag width towards the camera, then the tag's center and the ends of its axes
+        self.modelPoints = np.array([
+            [-1, -1,  0], [ 1, -1,  0], [ 1,  1,  0], [-1,  1,  0],
+            [-1, -1, -2], [ 1, -1, -2], [ 1,  1, -2], [-1,  1, -2],
+            [ 0,  0,  0], [ 2,  0,  0], [ 0, -2,  0], [ 0,  0, -2]
+        ], dtype = np.float64) * halfSize
+
+        # The lines of the box, as indices into the model. The edges between the faces are drawn as closed two point lines
+        self.boxLines = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 4], [1, 5], [2, 6], [3, 7]]
+
+        # The lines of each axis
+        self.axisLines = [[8, 9], [8, 10], [8, 11]]
+
+    def project(self, camera_matrix, poseMatrices, distortion = None):
+        """
+        Projects the box and axes of every tag into the image at once.
+
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param poseMatrices: An (N, 3, 4) array of each tag's pose relative to the camera.
+        :param distortion: The camera's distortion coefficients if the image is distorted.
+        :return: An (N, 12, 2) array of the model points of each tag in pixels.
+        """
+        poseMatrices = np.asarray(poseMatrices, dtype = np.float64).reshape(-1, 3, 4)
+
+        # Moves the model of every tag into the camera's frame
+        cameraPoints = np.einsum("nij,kj->nki", poseMatrices[:, :, :3], self.modelPoints) + poseMatrices[:, None, :, 3]
+
+        # Throws out tags with any point behind the camera, since they cannot be projected
+        cameraPoints = cameraPoints[np.all(cameraPoints[:, :, 2] > 1e-6, axis = 1)]
+        if (len(cameraPoints) == 0):
+            return np.zeros((0, len(self.modelPoints), 2))
+
+        # Projects every point with one call
+        imagePoints, _ = cv.projectPoints(cameraPoints.reshape(-1, 1, 3), np.zeros(3), np.zeros(3), camera_matrix, distortion)
+
+        return imagePoints.reshape(-1, len(self.modelPoints), 2)
+
+    def drawPoints(self, img, imagePoints, vizualization: int = 3, scale: float = 1.0):
+        """
+        Draws projected tags onto an image.
+
+        :param img: The image to write on.
+        :param imagePoints: The points returned by ``project``.
+        :param vizualization: 1 - Boxes, 2 - Axes, 3 - Boxes + Axes.
+        :param scale: The size of the image relative to the image the points were projected for.
+        """
+        if (len(imagePoints) == 0):
+            return
+
+        # Moves the points to the image's scale in fixed point
+        points = np.round(imagePoints * scale * (1 << SHIFT)).astype(np.int32)
+
+        # Draws every box at once
+        if ((vizualization == 1) or (vizualization == 3)):
+            lines = [np.ascontiguousarray(points[:, line]) for line in self.boxLines]
+            cv.polylines(img, [tag for line in lines for tag in line], True, BOX_COLOR, 1, cv.LINE_AA, SHIFT)
+
+        # Draws every axis of one color at once
+        if ((vizualization == 2) or (vizualization == 3)):
+            for line, color in zip(self.axisLines, AXIS_COLOR):
+                cv.polylines(img, list(np.ascontiguousarray(points[:, line])), False, color, 2, cv.LINE_8, SHIFT)
+
+    def draw(self, img, camera_matrix, poseMatrices, distortion = None, vizualization: int = 3):
+        """
+        Projects and draws the box and axes of every tag.
+
+        :param img: The image to write on.
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param poseMatrices: An (N, 3, 4) array of each tag's pose relative to the camera.
+        :param distortion: The camera's distortion coefficients if the image is distorted.
+        :param vizualization: 1 - Boxes, 2 - Axes, 3 - Boxes + Axes.
+        """
+        self.drawPoints(img, self.project(camera_matrix, poseMatrices, distortion), vizualization)
+
+    def getOverlay(self, camera_matrix, poseMatrices, distortion = None, vizualization: int = 3):
+        """
+        Projects every tag now and returns a function that draws them later.
+        The function can be handed to ``Streaming.streamImage`` so the lines are drawn on the output thread, after the frame is downscaled.
+
+        :param camera_matrix: The camera's intrinsic calibration matrix.
+        :param poseMatrices: An (N, 3, 4) array of each tag's pose relative to the camera.
+        :param distortion: The camera's distortion coefficients if the image is distorted.
+        :param vizualization: 1 - Boxes, 2 - Axes, 3 - Boxes + Axes.
+        :return: A function that takes an image and its scale, and draws the tags onto it.
+        """
+        imagePoints = self.project(camera_matrix, poseMatrices, distortion)
+
+        return lambda img, scale = 1.0: self.drawPoints(img, imagePoints, vizualization, scale)
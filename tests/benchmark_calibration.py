@@ -0,0 +1,90 @@
+# Import Libraries
+import os
+import time
+import shutil
+import tempfile
+import cv2   as cv
+import numpy as np
+from   frc_apriltags             import Calibrate, CalibrationStore
+from   frc_apriltags.calibration import scaleIntrinsics
+from   synthetic                 import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numImages  = 30
+rng = np.random.default_rng(2199)
+
+class StillCapture:
+    # Stands in for a cv2.VideoCapture that only reports its resolution
+    def __init__(self, resolution: tuple):
+        self.resolution = resolution
+
+    def get(self, propId: int):
+        return {cv.CAP_PROP_FRAME_WIDTH: self.resolution[0], cv.CAP_PROP_FRAME_HEIGHT: self.resolution[1]}[propId]
+
+def renderImages(dirPath: str, resolution: tuple, camMatrix, count: int):
+    # Renders calibration images of the chessboard at random poses
+    imagePath = dirPath + f"/camera0-{resolution[0]}x{resolution[1]}-images/"
+    os.makedirs(imagePath, exist_ok = True)
+    for i in range(count):
+        frame = np.full((resolution[1], resolution[0]), 100, np.uint8)
+        rotation = rotationFromEuler(rng.uniform(-0.4, 0.4), rng.uniform(-0.4, 0.4), rng.uniform(-0.2, 0.2))
+        renderChessboard(frame, rotation, [rng.uniform(-0.05, 0.05), rng.uniform(-0.03, 0.03), rng.uniform(0.4, 0.6)], camMatrix)
+        cv.imwrite(imagePath + f"{i + 1}.png", cv.cvtColor(frame, cv.COLOR_GRAY2BGR))
+
+    return imagePath
+
+def timeCalibration(dirPath: str, workers: int):
+    # Times a headless calibration and stores its result
+    calibrate = Calibrate(StillCapture(resolution), 0, numImages, dirPath, headless = True, workers = workers)
+    start = time.perf_counter()
+    ret, matrix, distortion, rVecs, tVecs = calibrate.calibrateCamera()
+    seconds = time.perf_counter() - start
+    CalibrationStore(dirPath).save("camera0", resolution, matrix, distortion, calibrate.getReprojectionError(), calibrate.getFingerprint())
+    return seconds, matrix
+
+def timeStoredCalibration(dirPath: str):
+    # Times what USBCamera does at startup when a stored calibration matches the images
+    start = time.perf_counter()
+    calibrate = Calibrate(StillCapture(resolution), 0, numImages, dirPath)
+    profile   = CalibrationStore(dirPath).load("camera0", resolution)
+    assert profile["fingerprint"] == calibrate.getFingerprint()
+    return time.perf_counter() - start, profile["camera_matrix"]
+
+def printMatrix(name: str, seconds: float, matrix, trueMatrix):
+    print(f"{name:>12}: {seconds:.2f} s, fx {matrix[0, 0]:.1f} (true {trueMatrix[0, 0]:.1f}), cx {matrix[0, 2]:.1f} (true {trueMatrix[0, 2]:.1f}), cy {matrix[1, 2]:.1f} (true {trueMatrix[1, 2]:.1f})")
+
+if (__name__ == "__main__"):
+    camMatrix = createCameraMatrix(resolution)
+    dirPath   = tempfile.mkdtemp()
+    imagePath = renderImages(dirPath, resolution, camMatrix, numImages)
+
+    # Times a cold run on one thread, a cold run on every core, then a cached run
+    for name, workers, clearCache in (("1 thread", 1, True), (f"{os.cpu_count()} threads", None, True), ("Cached", None, False)):
+        if (clearCache == True):
+            shutil.rmtree(imagePath + "corners/", ignore_errors = True)
+        seconds, matrix = timeCalibration(dirPath, workers)
+        printMatrix(name, seconds, matrix, camMatrix)
+
+    # Times loading the stored calibration instead of calibrating
+    seconds, matrix = timeStoredCalibration(dirPath)
+    printMatrix("Stored", seconds, matrix, camMatrix)
+
+    # Derives other resolutions and checks them against a few images taken at each.
+    # The 640x480 mode is binned differently than the model assumes, so it should be rejected
+    store = CalibrationStore(dirPath)
+    print(f"\nStored error at {resolution[0]}x{resolution[1]}: {store.load('camera0', resolution)['reprojectionError']:.3f} px")
+    binned = np.diag([0.5, 480 / 720, 1.0]) @ camMatrix
+    binned[0, 2], binned[1, 2] = 319.5, 239.5
+    for target, trueMatrix in (((640, 360), scaleIntrinsics(camMatrix, resolution, (640, 360))), ((960, 720), scaleIntrinsics(camMatrix, resolution, (960, 720))), ((640, 480), binned)):
+        renderImages(dirPath, target, trueMatrix, 5)
+        start   = time.perf_counter()
+        derived = store.deriveProfile("camera0", target, Calibrate(StillCapture(target), 0, 5, dirPath))
+        seconds = time.perf_counter() - start
+        if (derived is None):
+            print(f"{str(target[0]) + 'x' + str(target[1]):>12}: rejected")
+        else:
+            printMatrix(f"{target[0]}x{target[1]}", seconds, derived["camera_matrix"], trueMatrix)
+            print(f"{'':>14}error {derived['reprojectionError']:.3f} px")
+
+    shutil.rmtree(dirPath)
@@ -0,0 +1,105 @@
+# Import Libraries
+import time
+import cv2   as cv
+import numpy as np
+
+# Benchmark settings
+numCameras = 3
+resolution = (1280, 720)
+fps        = 30
+
+# Simulated V4L2 timings in seconds, in the range measured on UVC cameras
+openTime        = 1.0
+ioctlTime       = 0.15
+renegotiateTime = 0.6
+
+# The camera number that fails to open
+unpluggedCamera = 9
+
+class SimulatedCapture:
+    """
+    Stands in for ``cv.VideoCapture`` on a UVC camera. Every call blocks like the ioctl it makes,
+    and changing the pixel format after the resolution makes the driver negotiate the resolution and fps again.
+    """
+    renegotiations = 0
+    released       = 0
+
+    def __init__(self, *args) -> None:
+        time.sleep(openTime)
+        if (args[0] == unpluggedCamera):
+            raise RuntimeError(f"Camera {args[0]} is not plugged in")
+        self.properties = {cv.CAP_PROP_FRAME_WIDTH: 640, cv.CAP_PROP_FRAME_HEIGHT: 480, cv.CAP_PROP_FPS: 30, cv.CAP_PROP_FOURCC: 0}
+        self.modeSet    = False
+
+    def set(self, prop, value) -> bool:
+        time.sleep(ioctlTime)
+        if (prop in (cv.CAP_PROP_FRAME_WIDTH, cv.CAP_PROP_FRAME_HEIGHT, cv.CAP_PROP_FPS)):
+            self.modeSet = True
+        elif ((prop == cv.CAP_PROP_FOURCC) and (self.modeSet == True)):
+            time.sleep(renegotiateTime)
+            SimulatedCapture.renegotiations += 1
+        self.properties[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.properties.get(prop, 0)
+
+    def release(self):
+        SimulatedCapture.released += 1
+
+    def read(self):
+        return True, np.zeros((int(self.properties[cv.CAP_PROP_FRAME_HEIGHT]), int(self.properties[cv.CAP_PROP_FRAME_WIDTH]), 3), np.uint8)
+
+# Opens cameras through the simulated driver
+cv.VideoCapture = SimulatedCapture
+from frc_apriltags import USBCamera
+from frc_apriltags.camera import findCameras, openCameras
+
+def openFormatLast(camNum: int):
+    # Opens a camera the way USBCamera used to, setting the format after the resolution and fps
+    cap = cv.VideoCapture(camNum)
+    cap.set(cv.CAP_PROP_FRAME_WIDTH, resolution[0])
+    cap.set(cv.CAP_PROP_FRAME_HEIGHT, resolution[1])
+    cap.set(cv.CAP_PROP_FPS, fps)
+    cap.set(cv.CAP_PROP_FOURCC, cv.VideoWriter_fourcc(*'MJPG'))
+    return cap
+
+def timeStartup(name: str, startup):
+    # Times a startup and counts the renegotiations it caused
+    SimulatedCapture.renegotiations = 0
+    start = time.perf_counter()
+    initTimes = startup()
+    total = time.perf_counter() - start
+
+    perCamera = ", ".join(f"{initTime:.2f}" for initTime in initTimes)
+    print(f"{name:<30} {total:5.2f} s total, {SimulatedCapture.renegotiations} renegotiations, per camera: {perCamera} s")
+
+def serialFormatLast():
+    times = []
+    for i in range(numCameras):
+        start = time.perf_counter()
+        openFormatLast(i)
+        times.append(time.perf_counter() - start)
+    return times
+
+def serialUSBCamera():
+    return [USBCamera(i, resolution = resolution, fps = fps).getInitTime() for i in range(numCameras)]
+
+def concurrentUSBCamera():
+    cameras, initTimes = openCameras({f"camera{i}": {"camNum": i, "resolution": resolution, "fps": fps} for i in range(numCameras)})
+    return list(initTimes.values())
+
+if (__name__ == "__main__"):
+    # Lists the cameras plugged into this machine
+    print(f"Cameras found in /dev/v4l: {findCameras()}")
+    print(f"{numCameras} simulated cameras: {openTime} s to open, {ioctlTime} s per ioctl, {renegotiateTime} s to renegotiate")
+
+    timeStartup("One at a time, format last", serialFormatLast)
+    timeStartup("One at a time, format first", serialUSBCamera)
+    timeStartup("openCameras", concurrentUSBCamera)
+
+    # Fails to open one camera, which should release the others
+    try:
+        openCameras({f"camera{i}": {"camNum": i, "resolution": resolution, "fps": fps} for i in (0, 1, unpluggedCamera)})
+    except RuntimeError as e:
+        print(f"openCameras raised '{e}' and released {SimulatedCapture.released} of the 2 cameras that opened")
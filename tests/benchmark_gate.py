@@ -0,0 +1,122 @@
+# Import Libraries
+import time
+import tempfile
+import cv2   as cv
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import Detector, FrameGate, FrameRecorder, FrameReplay
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolution  = (1280, 720)
+fps         = 30
+idleFrames  = 90
+driveFrames = 150
+
+# Creates the camera and the field
+layout    = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+camMatrix = createCameraMatrix(resolution, hfov = 90)
+rng       = np.random.default_rng(2199)
+
+def renderFrame(x: float, yaw: float, blur: int):
+    # Renders the field from a camera pose, smeared by the camera's motion, with sensor noise
+    frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+    renderField(frame, layout, Pose3d(Translation3d(x, 2.5, 0.5), Rotation3d(0, -0.05, np.pi + yaw)), camMatrix)
+
+    return addNoise(motionBlurFrame(frame, blur), 2.0, rng)
+
+# Renders a match: parked, driving towards the grid while turning, then parked again
+segments = []
+frames   = []
+for i in range(idleFrames):
+    frames.append(renderFrame(5.0, 0.0, 0))
+    segments.append("idle")
+for i in range(driveFrames):
+    # Turning quickly smears the frame along the turn
+    yawRate = 0.04 * np.cos(i / 8)
+    blur    = int(abs(yawRate) * camMatrix[0, 0])
+    frames.append(renderFrame(5.0 - 1.2 * i / driveFrames, 0.3 * np.sin(i / 8), blur))
+    segments.append("whip" if (blur >= 20) else "drive")
+for i in range(idleFrames):
+    frames.append(renderFrame(3.8, 0.3 * np.sin(driveFrames / 8), 0))
+    segments.append("idle")
+segments = np.array(segments)
+
+class AgeCommunications(NullCommunications):
+    # Records the age of every published frame
+    def __init__(self):
+        self.ages = []
+
+    def publishFrame(self, results, best = None, captureTime: float = None, age: float = 0.0):
+        self.ages.append(age)
+
+# Instance creation, with NetworkTables stubbed out
+comms    = AgeCommunications()
+detector = Detector(size = 6, comms = comms)
+
+def runMatch(path):
+    # Replays the recording, measuring the CPU time of each frame
+    cpuTimes = []
+    found    = []
+    ages     = []
+    skipped  = []
+    for frame, captureTime in FrameReplay(path):
+        start = time.process_time()
+        results, __ = detector.detectTags(frame, camMatrix, captureTime = captureTime)
+        cpuTimes.append(time.process_time() - start)
+        found.append(len(results))
+        ages.append(max([result.getAge() for result in results], default = 0))
+        skipped.append((detector.gate is not None) and (detector.gate.getDecision() != FrameGate.CHANGED))
+
+    return np.array(cpuTimes) * 1000, np.array(found), np.array(ages), np.array(skipped)
+
+if (__name__ == "__main__"):
+    with tempfile.TemporaryDirectory() as path:
+        # Records the match
+        recorder = FrameRecorder(path, camMatrix, None, 95)
+        for i, frame in enumerate(frames):
+            recorder.writeFrame(frame, i / fps)
+        recorder.close()
+
+        # Replays the match with every frame detected, then with the gate
+        detector.disableGate()
+        fullTimes, fullFound, __, __ = runMatch(path)
+        detector.enableGate()
+        comms.ages = []
+        gateTimes, gateFound, gateAges, gateSkipped = runMatch(path)
+        stats = detector.getGateStats()
+
+    # Times the gate on its own
+    gate  = FrameGate()
+    start = time.process_time()
+    for frame in frames:
+        gate.check(frame)
+    gateCost = (time.process_time() - start) / len(frames) * 1000
+
+    print(f"{len(frames)} frames: {np.sum(segments == 'idle')} parked, {np.sum(segments != 'idle')} driving, {np.sum(segments == 'whip')} of them smeared by 20 px or more")
+    print(f"Gate check:      {gateCost:.3f} ms of CPU per frame")
+    print(f"Gate decisions:  {stats['changed']} detected, {stats['static']} static, {stats['blurred']} blurred, {stats['hitRate'] * 100:.1f}% skipped")
+    for name in ("idle", "drive", "whip"):
+        mask = (segments == name)
+        print(f"{name:<6} detect every frame: {fullTimes[mask].mean():6.2f} ms CPU per frame, gated: {gateTimes[mask].mean():6.2f} ms, {np.mean(gateSkipped[mask]) * 100:5.1f}% skipped")
+    print(f"Match CPU time:  {fullTimes.sum():.0f} ms detecting every frame, {gateTimes.sum():.0f} ms gated ({(1 - gateTimes.sum() / fullTimes.sum()) * 100:.1f}% saved)")
+    print(f"Oldest reused result: {gateAges.max()} frames")
+    print(f"Frames published while gated: {len(comms.ages)} of {len(frames)}, {np.count_nonzero(comms.ages)} with reused results, oldest {max(comms.ages) * 1000:.1f} ms old")
+
+    # Checks what skipping cost: driving frames that were skipped even though detecting them would have found tags
+    skippedFinds = gateSkipped & (fullFound > 0) & (segments != "idle")
+    print(f"Driving frames skipped while tags were decodable: {np.sum(skippedFinds)}")
+    print(f"Tags found on smeared frames when detected anyway: {fullFound[segments == 'whip'].sum()} in {np.sum(segments == 'whip')} frames")
+
+    # Checks that turning from a busy scene to a sharp tag on a plain wall is not mistaken for blur
+    gate    = FrameGate()
+    clutter = cv.resize(rng.integers(0, 255, (72, 128), dtype = np.uint8), resolution, interpolation = cv.INTER_NEAREST)
+    for i in range(10):
+        gate.check(addNoise(np.roll(clutter, i * 3, 1), 2.0, rng))
+    wallSkipped = 0
+    for i in range(60):
+        frame = np.full((resolution[1], resolution[0]), 150, np.uint8)
+        renderTag(frame, 1, rotationFromEuler(0.0, 0.1, 0.0), [-0.3 + i * 0.01, 0.0, 1.5], camMatrix, 0.1524)
+        wallSkipped += gate.shouldSkip(addNoise(frame, 2.0, rng))
+    print(f"Sharp tag on a plain wall after a busy scene: {wallSkipped} of 60 frames skipped")
@@ -0,0 +1,50 @@
+# Import Libraries
+import time
+import logging
+import tempfile
+import numpy as np
+from   frc_apriltags.Utilities import Logger
+
+# Benchmark settings
+iterations = 100000
+samples    = 5000
+
+def timeCalls(call, count: int) -> float:
+    # Gets the mean time of a call in nanoseconds
+    start = time.perf_counter()
+    for i in range(count):
+        call()
+    return (time.perf_counter() - start) / count * 1e9
+
+def timeEachCall(call, count: int):
+    # Gets the time of every call in microseconds
+    times = np.empty(count)
+    for i in range(count):
+        start = time.perf_counter()
+        call()
+        times[i] = time.perf_counter() - start
+    return times * 1e6
+
+pose = np.arange(6.0)
+
+# Times calls that are turned off by logStatus
+print(f"Disabled, f-string:      {timeCalls(lambda: Logger.logDebug(f'Pose: {pose}', False), iterations):8.1f} ns per call")
+print(f"Disabled, lazy format:   {timeCalls(lambda: Logger.logDebug('Pose: %s', False, pose), iterations):8.1f} ns per call")
+
+# Times calls that are filtered by level before a log path is set
+print(f"Filtered by level:       {timeCalls(lambda: Logger.logDebug('Pose: %s', True, pose), iterations):8.1f} ns per call")
+
+with tempfile.TemporaryDirectory() as dirPath:
+    # Times enabled calls through the background writer
+    Logger.setLogPath(dirPath, maxBytes = 100000, backupCount = 2)
+    queued = timeEachCall(lambda: Logger.logDebug('Pose: %s', True, pose), samples)
+    Logger.stop()
+
+    # Times the same calls written synchronously
+    syncLogger = logging.getLogger("benchmark")
+    syncLogger.addHandler(logging.FileHandler(dirPath + "/sync.log"))
+    syncLogger.setLevel(logging.DEBUG)
+    synchronous = timeEachCall(lambda: syncLogger.debug('Pose: %s', pose), samples)
+
+for name, times in (("Enabled, queued", queued), ("Enabled, synchronous", synchronous)):
+    print(f"{name + ':':24} {np.percentile(times, 50):8.2f} us p50, {np.percentile(times, 99):8.2f} us p99, {times.max():8.2f} us max")
@@ -0,0 +1,138 @@
+# Import Libraries
+import os
+import time
+import cv2   as cv
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import MultiCameraDetector
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+fps        = 30
+duration   = 3.0
+speed      = 0.5
+
+# Three cameras on the front of the robot, looking ahead and to either side
+robotToCameras = {
+    "front": Transform3d(Translation3d(0.30,  0.00, 0.5), Rotation3d(0, -0.05,  0.0)),
+    "left":  Transform3d(Translation3d(0.20,  0.25, 0.5), Rotation3d(0, -0.05,  0.6)),
+    "right": Transform3d(Translation3d(0.20, -0.25, 0.5), Rotation3d(0, -0.05, -0.6))
+}
+
+# Creates the cameras and the field
+layout    = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+camMatrix = createCameraMatrix(resolution)
+rng       = np.random.default_rng(2199)
+
+def getRobotPose(t: float):
+    # The robot drives sideways along the grid
+    return Pose3d(Translation3d(3.0, 1.75 + speed * t, 0.0), Rotation3d(0, 0, np.pi))
+
+class SimulatedCamera:
+    """
+    Stands in for a free-running ``USBCamera``. ``grab`` waits for the camera's next frame like ``cv.VideoCapture.grab``,
+    and ``retrieve`` decodes the frame from JPEG like an MJPG camera.
+    """
+    def __init__(self, robotToCamera, phase: float) -> None:
+        self.phase         = phase
+        self.camdistortion = None
+        self.captureTime   = 0.0
+        self.startTime     = 0.0
+        self.connected     = True
+
+        # Renders every frame the camera takes during the match
+        self.frames = []
+        for index in range(int((duration + 0.5) * fps)):
+            frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+            renderField(frame, layout, getRobotPose((index + phase) / fps).transformBy(robotToCamera), camMatrix)
+            frame = addNoise(frame, 4.0, rng)
+            self.frames.append(cv.imencode(".jpg", frame, [cv.IMWRITE_JPEG_QUALITY, 90])[1])
+
+    def start(self, startTime: float):
+        self.startTime = startTime
+
+    def grab(self) -> bool:
+        # An unplugged camera fails to grab straight away
+        if (self.connected == False):
+            return False
+
+        # Waits for the next frame
+        index = int(np.floor((time.monotonic() - self.startTime) * fps - self.phase)) + 1
+        self.captureTime = self.startTime + (index + self.phase) / fps
+        time.sleep(max(0.0, self.captureTime - time.monotonic()))
+        self.index = index
+
+        return True
+
+    def retrieve(self):
+        if (self.connected == False):
+            return None
+        return cv.imdecode(self.frames[self.index], cv.IMREAD_GRAYSCALE)
+
+    def getCaptureTime(self) -> float:
+        return self.captureTime
+
+    def getMatrix(self):
+        return camMatrix
+
+def runMatch(cycle):
+    # Runs cycles until the match ends, measuring how old the first frame is when the pose is ready, how far apart the frames were taken, and the position error
+    startTime = time.monotonic()
+    for camera in cameras.values():
+        camera.start(startTime)
+
+    latencies, spreads, errors = [], [], []
+    while (time.monotonic() - startTime < duration):
+        robotPose, captureTimes = cycle()
+        latencies.append(time.monotonic() - min(captureTimes))
+        spreads.append(max(captureTimes) - min(captureTimes))
+
+        # Compares against where the robot was in the middle of the frames
+        if (robotPose is not None):
+            truth = getRobotPose(np.mean(captureTimes) - startTime)
+            errors.append(robotPose.translation().distance(truth.translation()))
+
+    return np.array(latencies) * 1000, np.array(spreads) * 1000, np.array(errors) * 1000
+
+def runSequential():
+    # Reads and detects one camera after another, the way separate camera loops would
+    observations = []
+    captureTimes = []
+    for name, camera in cameras.items():
+        camera.grab()
+        results, __ = manager.detectors[name].detectTags(camera.retrieve(), camMatrix, captureTime = camera.getCaptureTime())
+        observations.append((results, camMatrix, None, robotToCameras[name]))
+        captureTimes.append(camera.getCaptureTime())
+
+    return manager.estimator.estimateFusedRobotPose(observations), captureTimes
+
+def runManager():
+    # Grabs every camera back to back, then detects them in parallel
+    robotPose = manager.update()
+
+    return robotPose, [camera.getCaptureTime() for camera in cameras.values() if (camera.connected == True)]
+
+if (__name__ == "__main__"):
+    # Each camera runs freely, so their frames start at different times
+    cameras = {name: SimulatedCamera(transform, i / len(robotToCameras)) for i, (name, transform) in enumerate(robotToCameras.items())}
+    manager = MultiCameraDetector(cameras, robotToCameras, layout, comms = NullCommunications())
+
+    print(f"{len(cameras)} cameras at {fps} fps, robot driving at {speed} m/s, {os.cpu_count()} CPU core(s)")
+    for name, cycle in (("One camera at a time", runSequential), ("MultiCameraDetector", runManager)):
+        latencies, spreads, errors = runMatch(cycle)
+        print(f"{name:<21} {len(latencies):3d} poses, first frame {latencies.mean():6.1f} ms old when the pose is ready, frames {spreads.mean():5.1f} ms apart, "
+              f"position error {errors.mean():5.1f} mm mean, {errors.max():5.1f} mm max")
+
+    # Shows the diagnostics each camera publishes
+    for name, diagnostics in manager.getDiagnostics().items():
+        print(f"  {name:<6} {diagnostics['latency'] * 1000:6.1f} ms to decode and detect, {diagnostics['tagCount']} tags, grabbed {diagnostics['grabOffset'] * 1000:5.1f} ms after the first camera")
+
+    # Unplugs a camera, which should leave the others fusing a pose
+    cameras["left"].connected = False
+    latencies, spreads, errors = runMatch(runManager)
+    print(f"Left camera unplugged: {len(errors)} of {len(latencies)} cycles gave a pose, position error {errors.mean():5.1f} mm mean, "
+          f"left reported {'connected' if (manager.getDiagnostics()['left']['connected'] == True) else 'disconnected'}")
+
+    manager.close()
@@ -0,0 +1,60 @@
+# Import Libraries
+import time
+import numpy as np
+from   cscore import CameraServer as CS
+from   frc_apriltags import ThreadedOutput
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numFrames  = 300
+loopRate   = 60
+budget     = 0.5e6
+
+# Renders a textured frame so the JPEG size is realistic
+rng   = np.random.default_rng(2199)
+frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+camMatrix = createCameraMatrix(resolution)
+renderTag(frame, 1, rotationFromEuler(0.0, 0.2, 0.0), [0.0, 0.0, 1.0], camMatrix, 0.1524)
+frame = cv.cvtColor(addNoise(frame, 12, rng), cv.COLOR_GRAY2BGR)
+
+class WatchedSource:
+    # Stands in for a CvSource with a dashboard watching it, and times each putFrame
+    def __init__(self, source):
+        self.source = source
+        self.times  = []
+
+    def isEnabled(self) -> bool:
+        return True
+
+    def putFrame(self, image):
+        start = time.perf_counter()
+        self.source.putFrame(image)
+        self.times.append(time.perf_counter() - start)
+
+# Times synchronous sends at the full resolution
+source = WatchedSource(CS.putVideo("Synchronous", resolution[0], resolution[1]))
+for i in range(numFrames):
+    source.putFrame(frame)
+print(f"Synchronous putFrame: p50 {1000 * np.percentile(source.times, 50):.3f} ms, p99 {1000 * np.percentile(source.times, 99):.3f} ms")
+
+# Times the full resolution JPEG compression cscore does for every watching client
+start = time.perf_counter()
+for i in range(20):
+    cv.imencode(".jpg", frame, [cv.IMWRITE_JPEG_QUALITY, 80])
+print(f"Full resolution JPEG: {(time.perf_counter() - start) / 20 * 1000:.3f} ms per frame per client")
+
+# Times the caller's side of the threaded output at the loop rate
+source = WatchedSource(CS.putVideo("Threaded", 320, 180))
+output = ThreadedOutput(source, CS.getServer("serve_Threaded"), (320, 180), fps = 30, bitrate = budget).start()
+times  = []
+for i in range(numFrames):
+    start = time.perf_counter()
+    output.putFrame(frame)
+    times.append(time.perf_counter() - start)
+    time.sleep(1.0 / loopRate)
+output.stop()
+
+print(f"Threaded putFrame:    p50 {1000 * np.percentile(times, 50):.3f} ms, p99 {1000 * np.percentile(times, 99):.3f} ms")
+print(f"Sent {output.getSentFrames()}, skipped {output.getDecimatedFrames()} to hold {output.getFPS():.1f} fps, dropped {output.getDroppedFrames()}")
+print(f"Quality {output.getQuality()}, estimated {output.getBitrate() / 1e6:.2f} Mbps of a {budget / 1e6:.2f} Mbps budget")
@@ -0,0 +1,79 @@
+# Import Libraries
+import time
+import shutil
+import tempfile
+import cv2   as cv
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import Detector, FrameRecorder, FrameReplay, VisionPipeline
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+fps        = 30
+numFrames  = 150
+rng = np.random.default_rng(2199)
+
+class LatencyCommunications(NullCommunications):
+    # Measures how long after a replayed frame arrived its results were published
+    def __init__(self, replay):
+        self.replay    = replay
+        self.latencies = []
+
+    def publishFrame(self, results, best = None, captureTime: float = None, age: float = 0.0):
+        self.latencies.append(time.monotonic() - captureTime)
+
+class EncodingStreaming:
+    # Stands in for Streaming by paying for the MJPEG encode cscore does
+    def streamImage(self, image, overlay = None):
+        if (overlay is not None):
+            overlay(image, 1.0)
+        cv.imencode(".jpg", image, [cv.IMWRITE_JPEG_QUALITY, 80])
+        return image
+
+# Records a drive past the blue alliance grid at the camera frame rate
+layout    = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+camMatrix = createCameraMatrix(resolution)
+dirPath   = tempfile.mkdtemp()
+recorder  = FrameRecorder(dirPath, camMatrix)
+for i in range(numFrames):
+    cameraPose = Pose3d(Translation3d(3.0, 1.0 + 4.0 * i / numFrames, 0.5), Rotation3d(0, -0.05, np.pi + 0.2 * np.sin(i / 20)))
+    frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+    renderField(frame, layout, cameraPose, camMatrix)
+    recorder.writeFrame(cv.cvtColor(addNoise(frame, 4.0, rng), cv.COLOR_GRAY2BGR), i / fps)
+recorder.close()
+
+# Instance creation. One detector is reused, since pupil_apriltags does not like being torn down
+detector = Detector(size = 6)
+streaming = EncodingStreaming()
+
+def runSerial():
+    # The loop from tests/detector.py: capture, detect, publish and stream one after another
+    replay = FrameReplay(dirPath, realtime = True)
+    detector.comms = LatencyCommunications(replay)
+    start = time.monotonic()
+    for stream, captureTime in replay:
+        results, stream = detector.detectTags(stream, camMatrix, captureTime = captureTime)
+        streaming.streamImage(stream)
+    return time.monotonic() - start, detector.comms.latencies, {}, {}
+
+def runPipeline():
+    # The same stages on their own threads
+    replay = FrameReplay(dirPath, realtime = True)
+    detector.comms = LatencyCommunications(replay)
+    pipeline = VisionPipeline(replay, detector, camMatrix, streaming)
+    start = time.monotonic()
+    pipeline.start().join()
+    return time.monotonic() - start, detector.comms.latencies, pipeline.getThroughput(), pipeline.getDroppedFrames()
+
+# Runs both loops over the same recording
+print(f"{numFrames} frames at {resolution[0]}x{resolution[1]}, {fps} fps")
+print(f"{'Loop':>9} {'Seconds':>8} {'Detected':>9} {'FPS':>6} {'p50 ms':>7} {'p99 ms':>7} {'Max ms':>7}  Stage FPS / dropped")
+for name, run in (("Serial", runSerial), ("Pipeline", runPipeline)):
+    seconds, latencies, throughput, dropped = run()
+    latencies = np.array(latencies) * 1000
+    stages = ", ".join(f"{stage} {rate:.1f}/{dropped.get(stage, 0)}" for stage, rate in throughput.items())
+    print(f"{name:>9} {seconds:8.2f} {len(latencies):9d} {len(latencies) / seconds:6.1f} {np.percentile(latencies, 50):7.1f} {np.percentile(latencies, 99):7.1f} {latencies.max():7.1f}  {stages}")
+
+shutil.rmtree(dirPath)
@@ -0,0 +1,48 @@
+# Import Libraries
+import time
+import cv2   as cv
+import numpy as np
+from   frc_apriltags import Detector
+
+# Benchmark settings
+iterations = 200
+rng = np.random.default_rng(2199)
+
+# Instance creation
+detector = Detector(size = 6)
+
+def randomPoses(count: int):
+    # Creates random tag poses in front of the camera
+    poses = np.empty((count, 3, 4))
+    for i in range(count):
+        poses[i, :, :3], _ = cv.Rodrigues(rng.normal(size = 3))
+        poses[i, :, 3]     = rng.uniform((-1, -1, 0.5), (1, 1, 5))
+    return poses
+
+# Checks that both conversions agree
+poses = randomPoses(100)
+translations, rotations = detector.getFieldPoses(poses)
+maxError = 0.0
+for i in range(len(poses)):
+    pose = detector.getPose3D(poses[i])
+    expected = (pose.X(), pose.Y(), pose.Z(), pose.rotation().X(), pose.rotation().Y(), pose.rotation().Z())
+    maxError = max(maxError, np.max(np.abs(np.concatenate([translations[i], rotations[i]]) - expected)))
+print(f"Largest difference from getPose3D: {maxError:.2e}")
+
+# Times both conversions for several tag counts
+for count in (1, 4, 8, 16):
+    poses = randomPoses(count)
+    detector.getFieldPoses(poses)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        for pose in poses:
+            detector.getPose3D(pose)
+    perTag = (time.perf_counter() - start) / (iterations * count) * 1e6
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        detector.getFieldPoses(poses)
+    batched = (time.perf_counter() - start) / (iterations * count) * 1e6
+
+    print(f"{count} tags: getPose3D {perTag:.1f} us per tag, getFieldPoses {batched:.1f} us per tag")
@@ -0,0 +1,103 @@
+# Import Libraries
+import time
+import numpy as np
+from   frc_apriltags import Detector, PowerGovernor
+from   frc_apriltags.calibration import scaleIntrinsics
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+fps        = 30
+duration   = 30.0
+windows    = ((8.0, 14.0), (22.0, 25.0))
+
+# Where the tag is while it is in view
+tagRotation    = rotationFromEuler(0.0, 0.2, 0.0)
+tagTranslation = np.array([0.1, 0.05, 2.0])
+
+class SimulatedCamera:
+    """
+    Stands in for a ``USBCamera``, rendering the scene at whatever resolution it is resized to.
+    Every resolution is the full sensor scaled down, so its true intrinsics are the track intrinsics scaled by ``scaleIntrinsics``.
+    """
+    def __init__(self, resolution: tuple, fps: int) -> None:
+        self.trackResolution = resolution
+        self.trackMatrix     = createCameraMatrix(resolution)
+        self.frames          = {}
+        self.time            = 0.0
+        self.resize(resolution, fps)
+
+    def resize(self, cameraRes: tuple, fps: int):
+        self.resolution = tuple(cameraRes)
+        self.fps        = fps
+        self.camMatrix  = scaleIntrinsics(self.trackMatrix, self.trackResolution, cameraRes)
+
+    def getStream(self):
+        # Renders each resolution of each scene once
+        visible = any(start <= self.time < end for start, end in windows)
+        key     = (self.resolution, visible)
+        if (key not in self.frames):
+            frame = np.full((self.resolution[1], self.resolution[0]), 128, np.uint8)
+            if (visible == True):
+                renderTag(frame, 1, tagRotation, tagTranslation, self.camMatrix, 0.1524)
+            self.frames[key] = frame
+
+        return self.frames[key]
+
+    def getMatrix(self):
+        return self.camMatrix
+
+    def getResolution(self):
+        return self.resolution
+
+def runMatch(governed: bool):
+    # Steps through the match one frame at a time, at the fps the camera is set to
+    camera   = SimulatedCamera(resolution, fps)
+    governor = PowerGovernor(camera, scanFps = 10, scanDelay = 2.0) if (governed == True) else None
+    cpuTime  = 0.0
+    frames   = []
+    while (camera.time < duration):
+        matrix = governor.getMatrix() if (governed == True) else camera.getMatrix()
+        stream = camera.getStream()
+
+        # Measures the CPU time of detection
+        start = time.process_time()
+        results, __ = detector.detectTags(stream, matrix)
+        cpuTime += time.process_time() - start
+
+        # Records the frame, with the distance between the found and true tag position
+        errors = [np.linalg.norm(result.poseMatrix[:, 3] - tagTranslation) for result in results]
+        mode   = governor.getMode() if (governed == True) else PowerGovernor.TRACK
+        frames.append((camera.time, mode, len(results), max(errors, default = 0.0)))
+
+        if (governed == True):
+            governor.update(results, camera.time)
+        camera.time += 1 / camera.fps
+
+    return cpuTime, frames, governor
+
+# Instance creation, with NetworkTables stubbed out
+detector = Detector(size = 6, comms = NullCommunications())
+
+if (__name__ == "__main__"):
+    fullCpu, fullFrames, __       = runMatch(False)
+    govCpu,  govFrames,  governor = runMatch(True)
+    stats = governor.getStats()
+
+    print(f"{duration:.0f} s match with a tag in view for {sum(end - start for start, end in windows):.0f} s")
+    print(f"Always tracking: {len(fullFrames)} frames, {fullCpu:.2f} s of CPU time")
+    print(f"Governed:        {len(govFrames)} frames ({stats['trackFrames']} tracking, {stats['scanFrames']} scanning), {govCpu:.2f} s of CPU time")
+    print(f"Duty cycle:      {stats['dutyCycle'] * 100:.1f}% tracking, {stats['switches']} switches")
+    print(f"CPU saved:       {(1 - govCpu / fullCpu) * 100:.1f}% measured, {stats['cpuSavings'] * 100:.1f}% estimated by the governor")
+
+    # Measures how quickly tracking resumes once the tag comes into view
+    for start, end in windows:
+        inView = [frame for frame in govFrames if (start <= frame[0] < end)]
+        scans  = [frame for frame in inView if (frame[1] == PowerGovernor.SCAN)]
+        track  = [frame for frame in inView if ((frame[1] == PowerGovernor.TRACK) and (frame[2] > 0))]
+        print(f"Tag in view at {start:.0f} s: {len(scans)} scan frame(s) before tracking, first tracked frame after {(track[0][0] - start) * 1000:.0f} ms")
+
+    # Checks the poses stay correct at both resolutions
+    for mode, name in ((PowerGovernor.SCAN, "scanning"), (PowerGovernor.TRACK, "tracking")):
+        errors = [frame[3] for frame in govFrames if ((frame[1] == mode) and (frame[2] > 0))]
+        print(f"Largest position error while {name}: {max(errors, default = 0.0) * 1000:.2f} mm over {len(errors)} frames")
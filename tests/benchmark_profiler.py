@@ -0,0 +1,40 @@
+# Import Libraries
+import time
+import numpy as np
+from   frc_apriltags import Detector
+from   frc_apriltags.Utilities import Profiler
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numFrames  = 200
+
+# Creates the camera
+camMatrix = createCameraMatrix(resolution)
+
+# Renders a frame with two tags
+frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+renderTag(frame, 1, rotationFromEuler(0.0, 0.2, 0.0), [-0.4, 0.05, 2.0], camMatrix, 0.1524)
+renderTag(frame, 2, rotationFromEuler(0.0, 0.2, 0.0), [0.4, 0.05, 2.1],  camMatrix, 0.1524)
+
+# Instance creation, with NetworkTables stubbed out
+detector = Detector(size = 6, comms = NullCommunications())
+
+def runFrames() -> float:
+    # Times the whole sequence
+    start = time.perf_counter()
+    for i in range(numFrames):
+        detector.detectTags(frame, camMatrix, 1)
+    return (time.perf_counter() - start) / numFrames * 1000
+
+# Compares the frame time with the profiler disabled and enabled
+runFrames()
+disabled = runFrames()
+Profiler.enable()
+enabled = runFrames()
+print(f"Profiler disabled: {disabled:.3f} ms per frame, enabled: {enabled:.3f} ms per frame")
+
+# Prints where the time went
+print(f"{'Stage':>20} {'Mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+for stage, summary in Profiler.getSummary().items():
+    print(f"{stage:>20} {1000 * summary['mean']:8.3f} {1000 * summary['p50']:8.3f} {1000 * summary['p95']:8.3f} {1000 * summary['p99']:8.3f}")
@@ -0,0 +1,60 @@
+# Import Libraries
+import time
+import tempfile
+import numpy as np
+from   frc_apriltags import Detector, FrameRecorder, FrameReplay
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numFrames  = 120
+
+# Creates the camera
+camMatrix = createCameraMatrix(resolution)
+
+# Renders a sequence of a tag drifting across the frame
+frames = []
+for i in range(numFrames):
+    frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+    renderTag(frame, 1, rotationFromEuler(0.0, 0.2, 0.0), [-0.5 + i / numFrames, 0.05, 2.0], camMatrix, 0.1524)
+    frames.append(frame)
+
+# Instance creation, with NetworkTables stubbed out
+detector = Detector(size = 6, comms = NullCommunications())
+
+def timeDetection(source) -> float:
+    # Gets the mean time of reading and detecting each frame in milliseconds
+    start = time.perf_counter()
+    found = 0
+    for frame, captureTime in source:
+        results, __ = detector.detectTags(frame, camMatrix, captureTime = captureTime)
+        found += len(results)
+    return (time.perf_counter() - start) / numFrames * 1000, found
+
+# Times detection on frames held in memory
+inMemory, found = timeDetection((frame, time.monotonic()) for frame in frames)
+print(f"In memory:              {inMemory:.3f} ms per frame, {found} tags found")
+
+for name, jpegQuality, queueSize in (("Raw", None, None), ("JPEG", 90, None), ("Queued JPEG", 90, 30)):
+    with tempfile.TemporaryDirectory() as path:
+        # Records the sequence at the camera's frame rate, timing only what the caller waits for
+        recorder = FrameRecorder(path, camMatrix, np.zeros(5), jpegQuality, queueSize)
+        record = 0.0
+        for frame in frames:
+            start = time.perf_counter()
+            recorder.writeFrame(frame)
+            record += time.perf_counter() - start
+            time.sleep(max(0.0, 1 / 30 - (time.perf_counter() - start)))
+        recorder.close()
+        record = record / numFrames * 1000
+
+        # Times reading alone, then reading and detecting
+        replay = FrameReplay(path)
+        start = time.perf_counter()
+        for frame, captureTime in replay:
+            pass
+        read = (time.perf_counter() - start) / numFrames * 1000
+
+        replay.seek(0)
+        replayed, found = timeDetection(replay)
+        print(f"{name + ' replay:':23} {replayed:.3f} ms per frame, {found} tags found, read {read:.3f} ms, record {record:.3f} ms, {recorder.getDroppedFrames()} dropped")
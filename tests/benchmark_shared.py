@@ -0,0 +1,117 @@
+# Import Libraries
+import time
+import multiprocessing
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import Detector, SharedFrameRing, DetectorPool
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numFrames  = 60
+numCameras = 2
+handoffs   = 200
+
+def queueEcho(frames, replies):
+    # Receives pickled frames and replies with one pixel
+    while (True):
+        frame = frames.get()
+        if (frame is None):
+            break
+        replies.put(int(frame[0, 0, 0]))
+
+def ringEcho(spec, sequences, replies):
+    # Receives sequence numbers and replies with one pixel read from the shared ring
+    ring = SharedFrameRing(*spec)
+    while (True):
+        sequence = sequences.get()
+        if (sequence is None):
+            break
+        frame, timestamp = ring.read(sequence)
+        replies.put(int(frame[0, 0, 0]))
+    ring.close()
+
+def timeHandoff(target, args, send, frames, replies):
+    # Times handing a frame to another process and hearing back from it
+    process = multiprocessing.get_context("spawn").Process(target = target, args = args)
+    process.start()
+    times = []
+    for i in range(handoffs):
+        start = time.perf_counter()
+        send(frames[i % len(frames)])
+        replies.get()
+        times.append(time.perf_counter() - start)
+    send(None)
+    process.join()
+    return np.array(times[10:]) * 1000
+
+# Spawned workers import this script, so the benchmark only runs from the main process
+if (__name__ == "__main__"):
+    context = multiprocessing.get_context("spawn")
+    rng = np.random.default_rng(2199)
+
+    # Renders a sequence for each camera, looking at the blue alliance grid from different spots
+    layout    = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+    camMatrix = createCameraMatrix(resolution)
+    sequences = []
+    for camera in range(numCameras):
+        frames = []
+        for i in range(numFrames):
+            cameraPose = Pose3d(Translation3d(2.5 + camera, 1.0 + 4.0 * i / numFrames, 0.5), Rotation3d(0, -0.05, np.pi + 0.3 * (camera - 0.5)))
+            frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+            renderField(frame, layout, cameraPose, camMatrix)
+            frames.append(np.ascontiguousarray(np.repeat(addNoise(frame, 4.0, rng)[:, :, None], 3, axis = 2)))
+        sequences.append(frames)
+
+    # Compares pickling a frame through a queue with sending its sequence number
+    print(f"Handing a {resolution[0]}x{resolution[1]} BGR frame to another process and back, {handoffs} times")
+    frames, replies = context.Queue(), context.Queue()
+    times = timeHandoff(queueEcho, (frames, replies), frames.put, sequences[0], replies)
+    print(f"{'Pickled':>12}: p50 {np.percentile(times, 50):.3f} ms, p99 {np.percentile(times, 99):.3f} ms")
+
+    ring = SharedFrameRing(sequences[0][0].shape)
+    numbers, replies = context.Queue(), context.Queue()
+    times = timeHandoff(ringEcho, (ring.getSpec(), numbers, replies), lambda frame: numbers.put(ring.write(frame) if (frame is not None) else None), sequences[0], replies)
+    print(f"{'Shared ring':>12}: p50 {np.percentile(times, 50):.3f} ms, p99 {np.percentile(times, 99):.3f} ms  (includes copying the frame into the ring)")
+    ring.close()
+
+    # Detects every frame of every camera on one process
+    print(f"\nDetecting {numFrames} frames from each of {numCameras} cameras on {multiprocessing.cpu_count()} cores")
+    detector = Detector(size = 6, comms = NullCommunications())
+    start = time.perf_counter()
+    for i in range(numFrames):
+        for camera in range(numCameras):
+            detector.detectTags(sequences[camera][i], camMatrix)
+    seconds = time.perf_counter() - start
+    print(f"{'1 process':>12}: {numCameras * numFrames / seconds:6.1f} frames/s")
+
+    # Detects with a pool of workers, waiting for a free worker so no frame is dropped
+    for workers in (1, 2, 4):
+        rings = [SharedFrameRing(sequences[camera][0].shape, slots = 2 * workers + 2) for camera in range(numCameras)]
+        pool  = DetectorPool(rings, workers).start()
+
+        # Warms up every worker
+        for camera in range(workers):
+            pool.submit(0, rings[0].write(sequences[0][0]), camMatrix)
+        while (pool.getInFlight() > 0):
+            pool.getResults(None)
+        finished = pool.getFinishedFrames()
+
+        start = time.perf_counter()
+        tags  = 0
+        for i in range(numFrames):
+            for camera in range(numCameras):
+                while (pool.getInFlight() >= workers):
+                    ringIndex, timestamp, results, best = pool.getResults(None)
+                    tags += len(results)
+                pool.submit(camera, rings[camera].write(sequences[camera][i]), camMatrix)
+        while (pool.getInFlight() > 0):
+            ringIndex, timestamp, results, best = pool.getResults(None)
+            tags += len(results)
+        seconds = time.perf_counter() - start
+
+        print(f"{str(workers) + ' workers':>12}: {(pool.getFinishedFrames() - finished) / seconds:6.1f} frames/s, {tags} tags, {pool.getOverwrittenFrames()} overwritten")
+        pool.stop()
+        for ring in rings:
+            ring.close()
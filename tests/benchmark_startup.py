@@ -0,0 +1,70 @@
+# Import Libraries
+import os
+import sys
+import time
+import subprocess
+
+# The statements each entry point runs
+entryPoints = (
+    ("Package",    "import frc_apriltags"),
+    ("Units",      "from frc_apriltags.Utilities import Units"),
+    ("Streaming",  "from frc_apriltags import Streaming"),
+    ("Detector",   "from frc_apriltags import Detector"),
+    ("Everything", "import frc_apriltags; [getattr(frc_apriltags, name) for name in frc_apriltags.__all__]")
+)
+
+# Times a cold start from import to the first detection published to NetworkTables
+firstDetection = """
+import time
+start = time.perf_counter()
+import numpy as np
+from frc_apriltags import Detector
+from synthetic import createCameraMatrix, renderTag, rotationFromEuler
+imported = time.perf_counter()
+detector = Detector(size = 6)
+created = time.perf_counter()
+camMatrix = createCameraMatrix((640, 480))
+frame = np.full((480, 640), 128, np.uint8)
+renderTag(frame, 1, rotationFromEuler(0.0, 0.2, 0.0), [0.0, 0.0, 1.5], camMatrix, 0.1524)
+rendered = time.perf_counter()
+results, __ = detector.detectTags(frame, camMatrix)
+published = time.perf_counter()
+print(f"{1000 * (imported - start):.1f} {1000 * (created - imported):.1f} {1000 * (published - rendered):.1f} {len(results)}", flush = True)
+"""
+
+# Runs from this directory so synthetic.py can be imported
+testsPath = os.path.dirname(os.path.abspath(__file__))
+env = dict(os.environ, PYTHONPATH = os.pathsep.join([testsPath, os.environ.get("PYTHONPATH", "")]))
+
+def importTimes(statement: str):
+    # Runs a statement in a new interpreter with -X importtime
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env = env, capture_output = True, text = True)
+    wallTime = (time.perf_counter() - start) * 1000
+    if (output.returncode != 0):
+        raise RuntimeError(output.stderr.splitlines()[-1])
+
+    # Reads the cumulative time of every top level import, in milliseconds
+    modules = {}
+    for line in output.stderr.splitlines():
+        if (line.startswith("import time:") == False) or ("cumulative" in line):
+            continue
+        __, cumulative, name = line[len("import time:"):].split("|")
+        if (name.startswith("  ") == False):
+            modules[name.strip()] = int(cumulative) / 1000
+
+    return wallTime, modules
+
+# Reports each entry point
+print(f"{'Entry point':>11} {'Wall ms':>8} {'Import ms':>9}  Slowest imports")
+for name, statement in entryPoints:
+    wallTime, modules = importTimes(statement)
+    slowest = sorted(modules.items(), key = lambda item: -item[1])[:4]
+    print(f"{name:>11} {wallTime:8.1f} {sum(modules.values()):9.1f}  " + ", ".join(f"{module} {ms:.1f}" for module, ms in slowest))
+
+# Reports the cold start to the first published detection
+output = subprocess.run([sys.executable, "-c", firstDetection], env = env, capture_output = True, text = True)
+if (len(output.stdout) == 0):
+    raise RuntimeError(output.stderr.splitlines()[-1])
+imported, created, published, found = output.stdout.split()[:4]
+print(f"First detection: import {imported} ms, Detector() {created} ms, detectTags and publish {published} ms, {found} tags found")
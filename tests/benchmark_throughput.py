@@ -0,0 +1,90 @@
+# Import Libraries
+import time
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import Detector
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolutions = ((360, 240), (640, 480), (1280, 720))
+conditions  = (("clean", 0.0, 0.0), ("blur", 1.5, 0.0), ("noise", 0.0, 6.0), ("blur + noise", 1.5, 6.0))
+numFrames   = 40
+tagSize     = 0.1524
+rng = np.random.default_rng(2199)
+
+# Loads the field
+layout = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+
+# Creates random camera poses in front of the blue alliance grid, looking back at tags 5 to 8
+cameraPoses = []
+for i in range(numFrames):
+    translation = Translation3d(rng.uniform(1.8, 4.5), rng.uniform(0.8, 5.5), rng.uniform(0.3, 0.8))
+    rotation    = Rotation3d(rng.normal(0, 0.03), rng.uniform(-0.15, 0.05), np.pi + rng.uniform(-0.4, 0.4))
+    cameraPoses.append(Pose3d(translation, rotation))
+
+def renderSequence(resolution, camera_matrix, blur: float, noise: float):
+    # Renders a frame for every camera pose along with the tags that should be found in it
+    frames = []
+    truths = []
+    for cameraPose in cameraPoses:
+        frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+        truths.append(renderField(frame, layout, cameraPose, camera_matrix, tagSize))
+        frames.append(addNoise(blurFrame(frame, blur), noise, rng))
+
+    return frames, truths
+
+def rotationError(rA, rB) -> float:
+    # Gets the angle between two rotation matrices in degrees
+    return np.degrees(np.arccos(np.clip((np.trace(rA.T @ rB) - 1) / 2, -1.0, 1.0)))
+
+def runSequence(detector, frames, truths, camera_matrix):
+    # Times every frame and compares its results to the truth
+    times = []
+    expected, found = 0, 0
+    tagErrors, angleErrors, robotErrors = [], [], []
+    for frame, truth, cameraPose in zip(frames, truths, cameraPoses):
+        start = time.perf_counter()
+        results, __ = detector.detectTags(frame, camera_matrix)
+        times.append(time.perf_counter() - start)
+
+        # Compares each tag's camera relative pose to the truth
+        expected += len(truth)
+        for result in results:
+            if (result.id in truth):
+                found += 1
+                __, rMatrix, tVec = truth[result.id]
+                tagErrors.append(np.linalg.norm(result.poseMatrix[:, 3] - tVec))
+                angleErrors.append(rotationError(result.poseMatrix[:, :3], rMatrix))
+
+        # Compares the solved camera pose to the truth
+        robotPose = detector.getRobotPose()
+        if ((len(results) > 0) and (robotPose is not None)):
+            robotErrors.append(robotPose.translation().distance(cameraPose.translation()))
+
+    return np.array(times) * 1000, expected, found, tagErrors, angleErrors, robotErrors
+
+# Instance creation, with NetworkTables stubbed out
+detector = Detector(size = 6, comms = NullCommunications())
+detector.enableFieldPose(layout)
+
+# Runs every configuration
+print(f"{'Resolution':>10} {'Condition':>13} {'FPS':>7} {'p50 ms':>7} {'p99 ms':>7} {'Recall':>7} {'Tag err cm':>10} {'Tag err deg':>11} {'Robot err cm':>12}")
+for resolution in resolutions:
+    camMatrix = createCameraMatrix(resolution)
+
+    for name, blur, noise in conditions:
+        frames, truths = renderSequence(resolution, camMatrix, blur, noise)
+
+        # Warms up the detector before timing it
+        detector.detectTags(frames[0], camMatrix)
+        detector.robotPose = None
+
+        times, expected, found, tagErrors, angleErrors, robotErrors = runSequence(detector, frames, truths, camMatrix)
+
+        # Reports the results
+        recall    = found / expected if (expected > 0) else 0.0
+        tagErr    = f"{100 * np.median(tagErrors):.2f}" if (len(tagErrors) > 0) else "-"
+        angleErr  = f"{np.median(angleErrors):.2f}" if (len(angleErrors) > 0) else "-"
+        robotErr  = f"{100 * np.median(robotErrors):.2f}" if (len(robotErrors) > 0) else "-"
+        print(f"{resolution[0]}x{resolution[1]:<4} {name:>13} {1000 / times.mean():7.1f} {np.percentile(times, 50):7.2f} {np.percentile(times, 99):7.2f} {recall:7.2f} {tagErr:>10} {angleErr:>11} {robotErr:>12}")
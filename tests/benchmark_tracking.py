@@ -0,0 +1,42 @@
+# Import Libraries
+import time
+import numpy as np
+from   frc_apriltags import Detector
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+numFrames  = 120
+
+# Creates the camera
+camMatrix = createCameraMatrix(resolution)
+
+# Renders a sequence of the robot slowly lining up on two tags
+frames = []
+for i in range(numFrames):
+    drift = 0.1 * np.sin(i / 20)
+    frame = np.full((resolution[1], resolution[0]), 128, np.uint8)
+    renderTag(frame, 1, rotationFromEuler(0.0, 0.2 + drift, 0.0), [-0.4 + drift, 0.05, 2.0], camMatrix, 0.1524)
+    renderTag(frame, 2, rotationFromEuler(0.0, 0.2 + drift, 0.0), [0.4 + drift, 0.05, 2.1],  camMatrix, 0.1524)
+    frames.append(frame)
+
+def runSequence(detector):
+    # Times every frame of the sequence
+    times = []
+    found = 0
+    for frame in frames:
+        start = time.perf_counter()
+        results, __ = detector.detectTags(frame, camMatrix)
+        times.append(time.perf_counter() - start)
+        found += len(results)
+
+    return np.array(times) * 1000, found
+
+# Runs the sequence in scan mode and in track mode
+scanDetector  = Detector(size = 6)
+trackDetector = Detector(size = 6)
+trackDetector.enableTracking(reacquireInterval = 15)
+
+for name, detector in (("Scan mode", scanDetector), ("Track mode", trackDetector)):
+    times, found = runSequence(detector)
+    print(f"{name}: mean {times.mean():.2f} ms, p50 {np.percentile(times, 50):.2f} ms, p99 {np.percentile(times, 99):.2f} ms, {found}/{2 * numFrames} tags found")
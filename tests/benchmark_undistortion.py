@@ -0,0 +1,71 @@
+# Import Libraries
+import time
+import cv2   as cv
+import numpy as np
+from   frc_apriltags import Detector
+from   synthetic     import *
+
+# Benchmark settings
+resolution = (1280, 720)
+iterations = 50
+distortion = np.array([[-0.32, 0.12, 0.001, -0.0005, -0.02]])
+
+# Creates the camera
+camMatrix = createCameraMatrix(resolution)
+distortionMaps = createDistortionMaps(resolution, camMatrix, distortion)
+
+# Known tag poses relative to the camera
+tagPoses = {
+    1: (rotationFromEuler(0.0, 0.3, 0.0),  [-0.6, 0.0, 2.0]),
+    2: (rotationFromEuler(0.1, -0.2, 0.0), [0.5, -0.2, 2.5]),
+    3: (rotationFromEuler(0.0, 0.0, 0.2),  [0.0, 0.3, 1.5]),
+}
+
+# Renders the tags and distorts the frame
+ideal = np.full((resolution[1], resolution[0]), 128, np.uint8)
+for tagId, (rMatrix, tVecs) in tagPoses.items():
+    renderTag(ideal, tagId, rMatrix, tVecs, camMatrix, 0.1524)
+stream = cv.cvtColor(distortFrame(ideal, distortionMaps), cv.COLOR_GRAY2BGR)
+
+# Creates the same maps getUndistortedStream uses
+newCamMatrix, roi = cv.getOptimalNewCameraMatrix(camMatrix, distortion, resolution, 1, resolution)
+map1, map2 = cv.initUndistortRectifyMap(camMatrix, distortion, None, newCamMatrix, resolution, cv.CV_16SC2)
+x, y, w, h = roi
+croppedMatrix = newCamMatrix.copy()
+croppedMatrix[0, 2] -= x
+croppedMatrix[1, 2] -= y
+undistorted = np.zeros_like(stream)
+
+# Instance creation
+detector = Detector(size = 6)
+
+def fullFrame():
+    # Undistorts the whole frame before detecting
+    cv.remap(stream, map1, map2, cv.INTER_LINEAR, dst = undistorted)
+    return detector.detectTags(undistorted[y:y+h, x:x+w], croppedMatrix)[0]
+
+def pointLevel():
+    # Detects on the distorted frame and only undistorts the corners
+    return detector.detectTags(stream, camMatrix, distortion = distortion)[0]
+
+# Times both paths
+for name, method in (("Full-frame undistort", fullFrame), ("Point-level undistort", pointLevel)):
+    method()
+    start = time.perf_counter()
+    for i in range(iterations):
+        results = method()
+    elapsed = (time.perf_counter() - start) / iterations * 1000
+    print(f"{name}: {elapsed:.2f} ms per frame, {len(results)} tags")
+
+# Compares the poses from both paths against the rendered poses
+def poseError(pose, truth):
+    translationError = pose.translation().distance(truth.translation()) * 1000
+    rotationError    = np.degrees(abs((pose.rotation() - truth.rotation()).angle))
+    return f"{translationError:.1f} mm, {rotationError:.2f} deg"
+
+fullResults  = {tagId: pose for tagId, pose in fullFrame()}
+pointResults = {tagId: pose for tagId, pose in pointLevel()}
+for tagId in sorted(fullResults.keys() & pointResults.keys()):
+    rMatrix, tVecs = tagPoses[tagId]
+    truth = detector.getPose3D(np.concatenate([rMatrix, np.reshape(tVecs, (3, 1))], axis = 1))
+    print(f"Tag {tagId}: full-frame error {poseError(fullResults[tagId], truth)}, point-level error {poseError(pointResults[tagId], truth)}")
@@ -0,0 +1,65 @@
+# Import Libraries
+import time
+import cv2   as cv
+import numpy as np
+from   wpimath.geometry import *
+from   frc_apriltags import Detector
+from   frc_apriltags.Utilities import AprilTagFieldLayout
+from   synthetic     import *
+
+# Benchmark settings
+resolution       = (1280, 720)
+outputResolution = (320, 180)
+repeats          = 300
+
+# Renders every tag of the blue alliance grid and the substations into one frame by viewing them from mid-field
+layout    = AprilTagFieldLayout.fromJson("2023-chargedup", False)
+camMatrix = createCameraMatrix(resolution, hfov = 90)
+frame     = np.full((resolution[1], resolution[0]), 128, np.uint8)
+truths    = renderField(frame, layout, Pose3d(Translation3d(5.0, 2.5, 0.5), Rotation3d(0, -0.05, np.pi)), camMatrix)
+
+# Detects the tags to get their poses
+detector = Detector(size = 6, comms = NullCommunications())
+results, __ = detector.detectTags(frame, camMatrix)
+color = cv.cvtColor(frame, cv.COLOR_GRAY2BGR)
+small = cv.resize(color, outputResolution, interpolation = cv.INTER_AREA)
+
+def timeDrawing(draw, image) -> np.ndarray:
+    # Times drawing onto a fresh copy of the frame
+    times = []
+    for i in range(repeats):
+        img = image.copy()
+        start = time.perf_counter()
+        draw(img)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+def drawPerTag(img, poseMatrices, centers):
+    # The old drawing: two projections and a line at a time for every tag
+    for pose, center in zip(poseMatrices, centers):
+        detector.draw_pose_box(img, camMatrix, pose)
+        detector.draw_pose_axes(img, camMatrix, pose, center)
+
+# Draws the tags that were found, then 16 tags made by shifting copies of them sideways
+for copies in (1, 4):
+    poseMatrices = np.concatenate([[np.concatenate([result.poseMatrix[:, :3], result.poseMatrix[:, 3:] + [[0.25 * shift], [0], [0]]], axis = 1) for result in results] for shift in range(copies)])
+    centers      = [center for shift in range(copies) for center in (cv.projectPoints(pose[:, 3], np.zeros(3), np.zeros(3), camMatrix, None)[0].ravel() for pose in poseMatrices[shift * len(results):(shift + 1) * len(results)])]
+    overlay      = detector.visualizer.getOverlay(camMatrix, poseMatrices)
+    print(f"{len(poseMatrices)} tags at {resolution[0]}x{resolution[1]}, drawn {repeats} times")
+
+    # Times each way of drawing. With an overlay, only the projection is paid for on the detection thread, and the lines are drawn after the output thread downscales the frame
+    for name, draw, image in (
+        ("Per tag", lambda img: drawPerTag(img, poseMatrices, centers), color),
+        ("Batched", lambda img: detector.visualizer.draw(img, camMatrix, poseMatrices), color),
+        ("Projection only", lambda img: detector.visualizer.getOverlay(camMatrix, poseMatrices), color),
+        (f"Overlay at {outputResolution[0]}x{outputResolution[1]}", lambda img: overlay(img, outputResolution[0] / resolution[0]), small)
+    ):
+        times = timeDrawing(draw, image)
+        print(f"{name:>20}: p50 {np.percentile(times, 50):.3f} ms, p99 {np.percentile(times, 99):.3f} ms")
+
+# Checks that both drawings put the lines in the same place
+old, new = color.copy(), color.copy()
+drawPerTag(old, poseMatrices, centers)
+detector.visualizer.draw(new, camMatrix, poseMatrices)
+oldMask, newMask = np.any(old != color, axis = 2), np.any(new != color, axis = 2)
+print(f"Drawn pixels: {oldMask.sum()} per tag, {newMask.sum()} batched, {(oldMask & newMask).sum() / oldMask.sum():.0%} shared")
@@ -29,11 +29,11 @@ detector = Detector(size = 6)
 
 # Main loop
 while (True):
-    # Gets the stream
-    stream = camera.getUndistortedStream()
+    # Gets the undistorted stream and its camera matrix
+    stream, camMatrix = camera.getUndistortedStream()
 
-    # Runs April Tag detection on the undistorted image
-    results, stream = detector.detectTags(stream, camMatrix, 0)
+    # Runs April Tag detection on the undistorted image, timestamping the results with the capture time
+    results, stream = detector.detectTags(stream, camMatrix, 0, captureTime = camera.getCaptureTime())
 
     # Press q to end the program
     if ( camera.getEnd() == True ):
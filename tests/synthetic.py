@@ -0,0 +1,301 @@
+# Import Libraries
+import cv2   as cv
+import numpy as np
+from   frc_apriltags import NullCommunications
+
+# The tag16h5 codes, in tag id order
+TAG16H5_CODES = [
+    0x27c8, 0x31b6, 0x3859, 0x569c, 0x6c76, 0x7ddb, 0xaf09, 0xf5a1, 0xfb8b, 0x1cb9,
+    0x28ca, 0xe8dc, 0x1426, 0x5770, 0x9253, 0xb702, 0x063a, 0x8f34, 0xb4c0, 0x51ec,
+    0xe6f0, 0x5fa4, 0xdd43, 0x1aaa, 0xe62f, 0x6dbc, 0xb6eb, 0xde10, 0x154d, 0xb57a
+]
+
+# The cell of each code bit inside the black border, most significant bit first
+TAG16H5_BIT_X = [1, 2, 3, 2, 4, 4, 4, 3, 4, 3, 2, 3, 1, 1, 1, 2]
+TAG16H5_BIT_Y = [1, 1, 1, 2, 1, 2, 3, 2, 4, 4, 4, 3, 4, 3, 2, 3]
+
+# A tag16h5 tag is 8 cells wide including the white border, the black border is 6 cells wide
+TAG_TOTAL_CELLS  = 8
+TAG_BORDER_CELLS = 6
+
+def createCameraMatrix(resolution: tuple, hfov: float = 70.0):
+    """
+    Creates an ideal intrinsic matrix for a camera.
+
+    :param resolution: The resolution of the camera (width, height).
+    :param hfov: The horizontal field of view in degrees.
+    :return: The intrinsic camera matrix.
+    """
+    # Calculates the focal length from the field of view
+    f = (resolution[0] / 2) / np.tan(np.radians(hfov) / 2)
+
+    return np.array([
+        [f, 0, (resolution[0] - 1) / 2],
+        [0, f, (resolution[1] - 1) / 2],
+        [0, 0, 1]
+    ])
+
+def createTagImage(id: int, pixelsPerCell: int = 32):
+    """
+    Creates an image of a tag16h5 tag, including its white border.
+
+    :param id: The id of the tag.
+    :param pixelsPerCell: The width of each cell in pixels.
+    :return: A grayscale image of the tag.
+    """
+    # Starts with a white tag and a black border
+    cells = np.full((TAG_TOTAL_CELLS, TAG_TOTAL_CELLS), 255, np.uint8)
+    cells[1:7, 1:7] = 0
+
+    # Sets the white bits of the code
+    code = TAG16H5_CODES[id]
+    for i in range(16):
+        if ((code >> (15 - i)) & 1):
+            cells[1 + TAG16H5_BIT_Y[i], 1 + TAG16H5_BIT_X[i]] = 255
+
+    # Scales the cells up
+    size = TAG_TOTAL_CELLS * pixelsPerCell
+    return cv.resize(cells, (size, size), interpolation = cv.INTER_NEAREST)
+
+def renderTag(frame, id: int, rMatrix, tVec, camera_matrix, tagSize: float, pixelsPerCell: int = 32):
+    """
+    Renders a tag into a frame. The pose uses the AprilTag convention: the camera looks down +z with x right and y down,
+    and the tag's x axis points right, its y axis points down, and its z axis points into the tag.
+
+    :param frame: The grayscale frame to render into.
+    :param id: The id of the tag.
+    :param rMatrix: The 3x3 rotation of the tag relative to the camera.
+    :param tVec: The translation of the tag's center relative to the camera in meters.
+    :param camera_matrix: The camera's intrinsic matrix.
+    :param tagSize: The width of the tag's black border in meters.
+    :param pixelsPerCell: The texture resolution of each cell.
+    :return: The four corners of the black border in the frame, in ``pupil_apriltags`` order.
+    """
+    # Creates the texture
+    texture = createTagImage(id, pixelsPerCell)
+    size    = texture.shape[0]
+
+    # The outer corners of the white border and the corners of the black border
+    outer = tagSize * TAG_TOTAL_CELLS / TAG_BORDER_CELLS / 2
+    half  = tagSize / 2
+    objOuter  = np.array([[-outer, -outer, 0], [outer, -outer, 0], [outer, outer, 0], [-outer, outer, 0]])
+    objBorder = np.array([[-half, half, 0], [half, half, 0], [half, -half, 0], [-half, -half, 0]])
+
+    # Projects both sets of corners
+    rVec, _   = cv.Rodrigues(np.asarray(rMatrix, dtype = np.float64))
+    tVec      = np.asarray(tVec, dtype = np.float64).reshape(3, 1)
+    imgOuter, _  = cv.projectPoints(objOuter, rVec, tVec, camera_matrix, None)
+    imgBorder, _ = cv.projectPoints(objBorder, rVec, tVec, camera_matrix, None)
+
+    # Warps the texture and a mask of it into the frame. Texture pixel centers sit half a pixel inside its edges
+    edge       = size - 0.5
+    texCorners = np.float32([[-0.5, -0.5], [edge, -0.5], [edge, edge], [-0.5, edge]])
+    H      = cv.getPerspectiveTransform(texCorners, imgOuter.reshape(4, 2).astype(np.float32))
+    dsize  = (frame.shape[1], frame.shape[0])
+    warped = cv.warpPerspective(texture, H, dsize, flags = cv.INTER_LINEAR)
+    mask   = cv.warpPerspective(np.full_like(texture, 255), H, dsize, flags = cv.INTER_LINEAR)
+
+    # Blends the tag into the frame
+    alpha = mask.astype(np.float32) / 255
+    frame[:] = (frame * (1 - alpha) + warped * alpha).astype(np.uint8)
+
+    return imgBorder.reshape(4, 2)
+
+def createDistortionMaps(resolution: tuple, camera_matrix, distortion):
+    """
+    Creates the maps that turn an ideal pinhole frame into a distorted one.
+
+    :param resolution: The resolution of the frame (width, height).
+    :param camera_matrix: The camera's intrinsic matrix.
+    :param distortion: The distortion coefficients to apply.
+    :return: The x and y maps to pass to ``cv.remap``.
+    """
+    # Finds where every distorted pixel comes from in the ideal frame
+    xs, ys = np.meshgrid(np.arange(resolution[0], dtype = np.float32), np.arange(resolution[1], dtype = np.float32))
+    pixels = np.stack([xs, ys], axis = -1).reshape(-1, 1, 2)
+    ideal  = cv.undistortPoints(pixels, camera_matrix, distortion, P = camera_matrix).reshape(resolution[1], resolution[0], 2)
+
+    return ideal[..., 0].copy(), ideal[..., 1].copy()
+
+def distortFrame(frame, maps):
+    """
+    Applies lens distortion to an ideal pinhole frame.
+
+    :param frame: The ideal frame.
+    :param maps: The maps from ``createDistortionMaps``.
+    :return: The distorted frame.
+    """
+    return cv.remap(frame, maps[0], maps[1], cv.INTER_LINEAR, borderValue = 128)
+
+def rotationFromEuler(roll: float, pitch: float, yaw: float):
+    """
+    Creates a rotation matrix from rotations around the x, y and z axes in radians.
+
+    :param roll: Rotation around the x axis.
+    :param pitch: Rotation around the y axis.
+    :param yaw: Rotation around the z axis.
+    :return: The 3x3 rotation matrix.
+    """
+    rX, _ = cv.Rodrigues(np.array([roll, 0.0, 0.0]))
+    rY, _ = cv.Rodrigues(np.array([0.0, pitch, 0.0]))
+    rZ, _ = cv.Rodrigues(np.array([0.0, 0.0, yaw]))
+
+    return rZ @ rY @ rX
+
+def rotationFromQuaternion(w: float, x: float, y: float, z: float):
+    """
+    Creates a rotation matrix from a unit quaternion.
+
+    :param w: The real part of the quaternion.
+    :param x: The i part of the quaternion.
+    :param y: The j part of the quaternion.
+    :param z: The k part of the quaternion.
+    :return: The 3x3 rotation matrix.
+    """
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z),     2 * (x * z + w * y)],
+        [2 * (x * y + w * z),     1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y),     2 * (y * z + w * x),     1 - 2 * (x * x + y * y)]
+    ])
+
+# Maps a vector in WPILib's camera frame (x forward, y left, z up) into OpenCV's camera frame (x right, y down, z forward)
+WPILIB_TO_OPENCV = np.array([[0, -1, 0], [0, 0, -1], [1, 0, 0]], dtype = np.float64)
+
+# Maps a vector in the AprilTag tag frame (x right, y down, z into the tag) into WPILib's tag frame (x out of the tag, y right, z up)
+APRILTAG_TO_WPILIB = np.array([[0, 0, -1], [1, 0, 0], [0, -1, 0]], dtype = np.float64)
+
+def getTagPoses(layout, cameraPose):
+    """
+    Finds the pose of every tag in a field layout relative to a camera, in the AprilTag convention ``renderTag`` uses.
+
+    :param layout: The ``AprilTagFieldLayout`` of the field.
+    :param cameraPose: The field relative ``Pose3d`` of the camera, with x forward and z up.
+    :return: A dictionary of tag id to (rotation matrix, translation vector).
+    """
+    # Gets the camera's rotation from its OpenCV frame into the field
+    q = cameraPose.rotation().getQuaternion()
+    fieldToCamera = rotationFromQuaternion(q.W(), q.X(), q.Y(), q.Z()) @ WPILIB_TO_OPENCV.T
+    cameraPosition = np.array([cameraPose.X(), cameraPose.Y(), cameraPose.Z()])
+
+    poses = {}
+    for id in range(1, len(layout.getTags())):
+        tagPose = layout.getTagPose(id)
+        q = tagPose.rotation().getQuaternion()
+        tagRotation = rotationFromQuaternion(q.W(), q.X(), q.Y(), q.Z())
+
+        # Moves the tag into the camera's frame
+        rMatrix = fieldToCamera.T @ tagRotation @ APRILTAG_TO_WPILIB
+        tVec    = fieldToCamera.T @ (np.array([tagPose.X(), tagPose.Y(), tagPose.Z()]) - cameraPosition)
+        poses[id] = (rMatrix, tVec)
+
+    return poses
+
+def renderField(frame, layout, cameraPose, camera_matrix, tagSize: float = 0.1524):
+    """
+    Renders every tag of a field layout that faces the camera into a frame.
+
+    :param frame: The grayscale frame to render into.
+    :param layout: The ``AprilTagFieldLayout`` of the field.
+    :param cameraPose: The field relative ``Pose3d`` of the camera, with x forward and z up.
+    :param camera_matrix: The camera's intrinsic matrix.
+    :param tagSize: The width of the tag's black border in meters.
+    :return: A dictionary of tag id to (corners, rotation matrix, translation vector) for every tag fully inside the frame.
+    """
+    visible = {}
+    for id, (rMatrix, tVec) in getTagPoses(layout, cameraPose).items():
+        # Skips tags behind the camera or facing away from it. The tag's z axis points into the tag
+        if ((tVec[2] <= 0) or (np.dot(rMatrix[:, 2], tVec) <= 0)):
+            continue
+
+        # Skips tags that fall outside the frame
+        corners = renderTag(frame, id, rMatrix, tVec, camera_matrix, tagSize)
+        if ((corners.min() >= 0) and (np.all(corners.max(axis = 0) < (frame.shape[1], frame.shape[0])))):
+            visible[id] = (corners, rMatrix, tVec)
+
+    return visible
+
+def blurFrame(frame, sigma: float):
+    """
+    Blurs a frame to imitate defocus and motion.
+
+    :param frame: The frame to blur.
+    :param sigma: The standard deviation of the blur in pixels, or 0 for no blur.
+    :return: The blurred frame.
+    """
+    if (sigma <= 0):
+        return frame
+
+    return cv.GaussianBlur(frame, (0, 0), sigma)
+
+def motionBlurFrame(frame, length: int, angle: float = 0.0):
+    """
+    Smears a frame along a line to imitate the camera moving during the exposure.
+
+    :param frame: The frame to blur.
+    :param length: The length of the smear in pixels, or 0 for no blur.
+    :param angle: The direction of the smear in radians.
+    :return: The blurred frame.
+    """
+    if (length <= 1):
+        return frame
+
+    # Draws the smear into a kernel
+    kernel = np.zeros((length, length), np.float32)
+    center = (length - 1) / 2
+    offset = np.array([np.cos(angle), np.sin(angle)]) * center
+    cv.line(kernel, tuple(np.round(center - offset).astype(int)), tuple(np.round(center + offset).astype(int)), 1.0, 1)
+
+    return cv.filter2D(frame, -1, kernel / kernel.sum())
+
+def addNoise(frame, sigma: float, rng):
+    """
+    Adds Gaussian sensor noise to a frame.
+
+    :param frame: The frame to add noise to.
+    :param sigma: The standard deviation of the noise in gray levels, or 0 for no noise.
+    :param rng: The ``numpy.random.Generator`` to draw the noise from.
+    :return: The noisy frame.
+    """
+    if (sigma <= 0):
+        return frame
+
+    return np.clip(frame + rng.normal(0, sigma, frame.shape), 0, 255).astype(np.uint8)
+
+def renderChessboard(frame, rMatrix, tVec, camera_matrix, innerCorners: tuple = (8, 5), squareSize: float = 0.0275, pixelsPerSquare: int = 40):
+    """
+    Renders a chessboard into a frame, with the same pose convention as ``renderTag``.
+
+    :param frame: The grayscale frame to render into.
+    :param rMatrix: The 3x3 rotation of the board relative to the camera.
+    :param tVec: The translation of the board's center relative to the camera in meters.
+    :param camera_matrix: The camera's intrinsic matrix.
+    :param innerCorners: The number of inner corners of the board (width, height).
+    :param squareSize: The width of each square in meters.
+    :param pixelsPerSquare: The texture resolution of each square.
+    """
+    # Creates the texture with a one square white border
+    squares = (innerCorners[0] + 3, innerCorners[1] + 3)
+    cells   = np.full((squares[1], squares[0]), 255, np.uint8)
+    for y in range(1, squares[1] - 1):
+        for x in range(1, squares[0] - 1):
+            if ((x + y) % 2 == 0):
+                cells[y, x] = 0
+    texture = cv.resize(cells, (squares[0] * pixelsPerSquare, squares[1] * pixelsPerSquare), interpolation = cv.INTER_NEAREST)
+
+    # Projects the outer corners of the texture
+    halfW, halfH = squares[0] * squareSize / 2, squares[1] * squareSize / 2
+    objOuter = np.array([[-halfW, -halfH, 0], [halfW, -halfH, 0], [halfW, halfH, 0], [-halfW, halfH, 0]])
+    rVec, _  = cv.Rodrigues(np.asarray(rMatrix, dtype = np.float64))
+    imgOuter, _ = cv.projectPoints(objOuter, rVec, np.asarray(tVec, dtype = np.float64).reshape(3, 1), camera_matrix, None)
+
+    # Warps the texture into the frame
+    h, w       = texture.shape
+    texCorners = np.float32([[-0.5, -0.5], [w - 0.5, -0.5], [w - 0.5, h - 0.5], [-0.5, h - 0.5]])
+    H     = cv.getPerspectiveTransform(texCorners, imgOuter.reshape(4, 2).astype(np.float32))
+    dsize = (frame.shape[1], frame.shape[0])
+    warped = cv.warpPerspective(texture, H, dsize, flags = cv.INTER_LINEAR)
+    mask   = cv.warpPerspective(np.full_like(texture, 255), H, dsize, flags = cv.INTER_LINEAR)
+
+    # Blends the board into the frame
+    alpha = mask.astype(np.float32) / 255
+    frame[:] = (frame * (1 - alpha) + warped * alpha).astype(np.uint8)